@@ -14,90 +14,101 @@ __version__ = "0.97"
 __author__ = "Martin Fenner"
 __license__ = "MIT"
 
-# ruff: noqa: F401
-from .metadata import Metadata, MetadataList
-from .readers import (
-    cff_reader,
-    codemeta_reader,
-    crossref_reader,
-    crossref_xml_reader,
-    datacite_reader,
-    datacite_xml_reader,
-    inveniordm_reader,
-    json_feed_reader,
-    kbase_reader,
-    ris_reader,
-    schema_org_reader,
-)
-from .writers import (
-    bibtex_writer,
-    citation_writer,
-    commonmeta_writer,
-    csl_writer,
-    datacite_writer,
-    ris_writer,
-    schema_org_writer,
-)
-from .utils import (
-    dict_to_spdx,
-    extract_url,
-    extract_urls,
-    extract_curie,
-    from_csl,
-    from_json_feed,
-    from_schema_org,
-    get_language,
-    issn_as_url,
-    name_to_fos,
-    normalize_cc_url,
-    normalize_id,
-    normalize_ids,
-    normalize_orcid,
-    normalize_url,
-    normalize_ror,
-    pages_as_string,
-    replace_curie,
-    to_csl,
-    validate_orcid,
-    validate_ror,
-    validate_url,
-)
-from .author_utils import (
-    authors_as_string,
-    cleanup_author,
-    get_affiliations,
-    get_authors,
-    get_one_author,
-    is_personal_name,
-)
-from .base_utils import (
-    wrap,
-    unwrap,
-    compact,
-    presence,
-    parse_attributes,
-    sanitize,
-)
-from .date_utils import (
-    get_date_from_crossref_parts,
-    get_date_from_date_parts,
-    get_date_from_unix_timestamp,
-    get_date_parts,
-    get_iso8601_date,
-    strip_milliseconds,
-)
-from .doi_utils import (
-    crossref_api_url,
-    crossref_xml_api_url,
-    doi_from_url,
-    doi_as_url,
-    doi_resolver,
-    decode_doi,
-    encode_doi,
-    datacite_api_url,
-    get_doi_ra,
-    normalize_doi,
-    validate_doi,
-    validate_prefix,
-    is_rogue_scholar_doi,
-)
+from importlib import import_module
+
+# Public names and reader and writer modules are imported on first access,
+# so that importing commonmeta does not load the libraries of every format.
+_LAZY_MODULES = {
+    "cff_reader": ".readers.cff_reader",
+    "codemeta_reader": ".readers.codemeta_reader",
+    "crossref_reader": ".readers.crossref_reader",
+    "crossref_xml_reader": ".readers.crossref_xml_reader",
+    "datacite_reader": ".readers.datacite_reader",
+    "datacite_xml_reader": ".readers.datacite_xml_reader",
+    "inveniordm_reader": ".readers.inveniordm_reader",
+    "json_feed_reader": ".readers.json_feed_reader",
+    "kbase_reader": ".readers.kbase_reader",
+    "ris_reader": ".readers.ris_reader",
+    "schema_org_reader": ".readers.schema_org_reader",
+    "bibtex_writer": ".writers.bibtex_writer",
+    "citation_writer": ".writers.citation_writer",
+    "commonmeta_writer": ".writers.commonmeta_writer",
+    "csl_writer": ".writers.csl_writer",
+    "datacite_writer": ".writers.datacite_writer",
+    "ris_writer": ".writers.ris_writer",
+    "schema_org_writer": ".writers.schema_org_writer",
+}
+_LAZY_IMPORTS = {
+    "Metadata": ".metadata",
+    "MetadataList": ".metadata",
+    "AsyncMetadataList": ".metadata",
+    "dict_to_spdx": ".utils",
+    "extract_url": ".utils",
+    "extract_urls": ".utils",
+    "extract_curie": ".utils",
+    "from_csl": ".utils",
+    "from_json_feed": ".utils",
+    "from_schema_org": ".utils",
+    "get_language": ".utils",
+    "issn_as_url": ".utils",
+    "name_to_fos": ".utils",
+    "normalize_cc_url": ".utils",
+    "normalize_id": ".utils",
+    "normalize_ids": ".utils",
+    "normalize_orcid": ".utils",
+    "normalize_url": ".utils",
+    "normalize_ror": ".utils",
+    "pages_as_string": ".utils",
+    "replace_curie": ".utils",
+    "to_csl": ".utils",
+    "validate_orcid": ".utils",
+    "validate_ror": ".utils",
+    "validate_url": ".utils",
+    "authors_as_string": ".author_utils",
+    "cleanup_author": ".author_utils",
+    "get_affiliations": ".author_utils",
+    "get_authors": ".author_utils",
+    "get_one_author": ".author_utils",
+    "is_personal_name": ".author_utils",
+    "wrap": ".base_utils",
+    "unwrap": ".base_utils",
+    "compact": ".base_utils",
+    "presence": ".base_utils",
+    "parse_attributes": ".base_utils",
+    "sanitize": ".base_utils",
+    "get_date_from_crossref_parts": ".date_utils",
+    "get_date_from_date_parts": ".date_utils",
+    "get_date_from_unix_timestamp": ".date_utils",
+    "get_date_parts": ".date_utils",
+    "get_iso8601_date": ".date_utils",
+    "strip_milliseconds": ".date_utils",
+    "crossref_api_url": ".doi_utils",
+    "crossref_xml_api_url": ".doi_utils",
+    "doi_from_url": ".doi_utils",
+    "doi_as_url": ".doi_utils",
+    "doi_resolver": ".doi_utils",
+    "decode_doi": ".doi_utils",
+    "encode_doi": ".doi_utils",
+    "datacite_api_url": ".doi_utils",
+    "get_doi_ra": ".doi_utils",
+    "normalize_doi": ".doi_utils",
+    "validate_doi": ".doi_utils",
+    "validate_prefix": ".doi_utils",
+    "is_rogue_scholar_doi": ".doi_utils",
+}
+__all__ = list(_LAZY_MODULES) + list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_MODULES:
+        value = import_module(_LAZY_MODULES[name], __name__)
+    elif name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,6 +1,7 @@
 """Author utils module for commonmeta-py"""
 import re
-from typing import List
+from typing import List, Optional
+import orjson as json
 from nameparser import HumanName
 from pydash import py_
 from furl import furl
@@ -15,13 +16,41 @@ from .utils import (
     validate_orcid,
 )
 from .base_utils import parse_attributes, wrap, presence, compact
+from .cache_utils import LRUCache
 
 from .constants import (
     COMMONMETA_CONTRIBUTOR_ROLES,
 )
 
+# parsed authors, keyed by the raw author input and the via option
+AUTHOR_CACHE = LRUCache(maxsize=50000)
+_MISSING = object()
+
+
+def author_cache_key(author, **kwargs) -> Optional[bytes]:
+    """Cache key for the raw author input, or None if it can't be serialized"""
+    try:
+        return json.dumps(
+            [kwargs.get("via", None), author], option=json.OPT_SORT_KEYS
+        )
+    except TypeError:
+        return None
+
 
 def get_one_author(author, **kwargs):
+    """parse one author string into commonmeta format, memoized in
+    AUTHOR_CACHE. Returns a new dict for every call."""
+    key = author_cache_key(author, **kwargs)
+    if key is None:
+        return parse_one_author(author, **kwargs)
+    cached = AUTHOR_CACHE.get(key, _MISSING)
+    if cached is _MISSING:
+        cached = json.dumps(parse_one_author(author, **kwargs))
+        AUTHOR_CACHE.set(key, cached)
+    return json.loads(cached)
+
+
+def parse_one_author(author, **kwargs):
     """parse one author string into commonmeta format"""
     # if author is a string
     if isinstance(author, str):
@@ -206,8 +235,23 @@ def cleanup_author(author):
 
 
 def get_authors(authors, **kwargs):
-    """transform array of author dicts into commonmeta format"""
-    return py_.uniq(py_.compact([get_one_author(i, **kwargs) for i in authors]))
+    """transform array of author dicts into commonmeta format. Authors
+    repeated within the array are parsed once, and duplicates removed."""
+    parsed = {}
+    for author in authors:
+        key = author_cache_key(author, **kwargs)
+        if key is None:
+            key = object()
+        if key not in parsed:
+            parsed[key] = get_one_author(author, **kwargs)
+    # remove duplicate authors, keeping the order
+    contributors = {}
+    for contributor in parsed.values():
+        if contributor:
+            contributors.setdefault(
+                json.dumps(contributor, option=json.OPT_SORT_KEYS), contributor
+            )
+    return [*contributors.values()]
 
 
 def authors_as_string(authors: List[dict]) -> str:
@@ -1,11 +1,24 @@
 """Base utilities for commonmeta-py"""
 import html
+import io
+from itertools import chain
 from os import path
 import re
 import xmltodict
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Union
 import nh3
 
+# keys of a path such as "metadata.rights[0].id"
+PATH_KEY_REGEX = re.compile(r"[^.\[\]]+")
+
+# lxml parser options for untrusted input
+XML_PARSER_OPTIONS = {
+    "remove_comments": True,
+    "resolve_entities": False,
+    "no_network": True,
+    "huge_tree": True,
+}
+
 
 def wrap(item) -> list:
     """Turn None, dict, or list into list"""
@@ -43,6 +56,37 @@ def compact(dict_or_list: Union[dict, list]) -> Optional[Union[dict, list]]:
     return None
 
 
+def compile_path(path: str) -> Callable[..., Any]:
+    """Compile a path such as "metadata.rights[0].id" into a function that
+    returns the value at the path in nested dicts and lists, or default if it
+    is missing, like py_.get(obj, path, default). The path is parsed once,
+    e.g. when a reader is imported, instead of on every call."""
+    # dict keys, and list indexes for keys that are numbers
+    steps = tuple(
+        (key, int(key) if key.lstrip("-").isdigit() else None)
+        for key in PATH_KEY_REGEX.findall(path)
+    )
+
+    def get(obj, default=None):
+        for key, index in steps:
+            if isinstance(obj, dict):
+                if key in obj:
+                    obj = obj[key]
+                elif index in obj:
+                    obj = obj[index]
+                else:
+                    return default
+            elif isinstance(obj, (list, tuple)) and index is not None:
+                if not -len(obj) <= index < len(obj):
+                    return default
+                obj = obj[index]
+            else:
+                return default
+        return obj
+
+    return get
+
+
 def parse_attributes(
     element: Union[str, dict, list], **kwargs
 ) -> Optional[Union[str, list]]:
@@ -103,6 +147,58 @@ def parse_xml(string: Optional[str], **kwargs) -> Optional[Union[dict, list]]:
     return xmltodict.parse(string, **kwargs)
 
 
+def iterparse_xml(source, tag):
+    """Parse XML from a string, bytes, the name of a file or a file handle
+    with lxml iterparse, yielding the elements with the tag (or tags, "{*}"
+    matches any namespace) when they end"""
+    from lxml import etree
+
+    encoding = None
+    if isinstance(source, io.TextIOBase) and hasattr(source, "buffer"):
+        # lxml reads bytes, files opened as text are read from their buffer
+        source = source.buffer
+    elif isinstance(source, io.TextIOBase):
+        source = source.read()
+    if isinstance(source, str) and not path.exists(source):
+        # ignore the encoding in the XML declaration of decoded strings
+        source = io.BytesIO(source.encode("utf-8"))
+        encoding = "utf-8"
+    elif isinstance(source, bytes):
+        source = io.BytesIO(source)
+    for _, element in etree.iterparse(
+        source, events=("end",), tag=tag, encoding=encoding, **XML_PARSER_OPTIONS
+    ):
+        yield element
+
+
+def clear_xml_element(element) -> None:
+    """Free the memory of an element read with iterparse, and of the elements
+    before it and before its ancestors, e.g. the records already read. Nodes
+    before the root element, e.g. processing instructions, are kept."""
+    element.clear(keep_tail=True)
+    for ancestor in chain([element], element.iterancestors()):
+        parent = ancestor.getparent()
+        if parent is None:
+            break
+        while ancestor.getprevious() is not None:
+            del parent[0]
+
+
+def iter_lines(source):
+    """Yield the lines of a string, bytes, the name of a file, or a file
+    handle or other iterable of lines, reading files one line at a time"""
+    if isinstance(source, str) and "\n" not in source and path.exists(source):
+        with open(source, encoding="utf-8-sig") as file:
+            yield from file
+        return
+    if isinstance(source, bytes):
+        source = source.decode("utf-8-sig")
+    if isinstance(source, str):
+        source = io.StringIO(source.lstrip("\ufeff"))
+    for line in source:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
 def sanitize(text: str, **kwargs) -> str:
     """Sanitize text"""
     # default whitelisted HTML tags
@@ -120,3 +216,19 @@ def sanitize(text: str, **kwargs) -> str:
     string = nh3.clean(text, tags=tags, attributes=attributes, link_rel=None)
     # remove excessive internal whitespace
     return " ".join(re.split(r"\s+", string, flags=re.UNICODE))
+
+
+def write_chunks(chunks, file, buffer_size: int = 65536) -> None:
+    """Write string chunks to a file-like object, buffering at most
+    about buffer_size characters between writes"""
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            file.write("".join(buffer))
+            buffer = []
+            size = 0
+    if buffer:
+        file.write("".join(buffer))
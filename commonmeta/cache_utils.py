@@ -0,0 +1,259 @@
+"""Cache utils for commonmeta-py"""
+
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+import orjson as json
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU cache with optional TTL (in seconds)
+    and hit/miss counters"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key, None)
+            if entry is not None and (
+                self.ttl is None or time.time() - entry[1] < self.ttl
+            ):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def peek(self, key, default=None):
+        """Return the cached value, or default if missing or expired, without
+        counting a hit or miss or marking the entry as recently used"""
+        with self._lock:
+            entry = self._data.get(key, None)
+            if entry is not None and (
+                self.ttl is None or time.time() - entry[1] < self.ttl
+            ):
+                return entry[0]
+            return default
+
+    def set(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = (value, time.time())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def cache_info(self) -> dict:
+        """Return hits, misses, size and maxsize"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteStore:
+    """Thread-safe key-value store in a SQLite database, with optional TTL
+    (in seconds). Keys and values are strings or bytes."""
+
+    def __init__(self, filename: str, table: str = "cache", ttl: Optional[float] = None):
+        if not table.isidentifier():
+            raise ValueError("Invalid table name")
+        self.filename = filename
+        self.table = table
+        self.ttl = ttl
+        self._lock = Lock()
+        self._connection = sqlite3.connect(filename, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value BLOB, created REAL)"
+            )
+
+    def get(self, key: str, default=None):
+        """Return the stored value, or default if missing or expired"""
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value, created FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        if self.ttl is not None and time.time() - row[1] >= self.ttl:
+            self.delete(key)
+            return default
+        return row[0]
+
+    def set(self, key: str, value) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, created) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE key = ?", (key,)
+            )
+
+    def evict(self, maxsize: int) -> None:
+        """Delete expired entries, then the oldest entries above maxsize"""
+        with self._lock, self._connection:
+            if self.ttl is not None:
+                self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE created < ?",
+                    (time.time() - self.ttl,),
+                )
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM "
+                f"{self.table} ORDER BY created DESC LIMIT -1 OFFSET ?)",
+                (maxsize,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM {self.table}"
+            ).fetchone()[0]
+
+
+class ConversionCache:
+    """Cache of conversion outputs keyed by a content hash, with an in-memory
+    LRU cache in front of an optional SQLite database. Entries expire after ttl
+    seconds, and the database keeps at most store_maxsize of the newest."""
+
+    def __init__(
+        self,
+        filename: Optional[str] = None,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        store_maxsize: int = 100000,
+    ):
+        self.memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self.store = (
+            SQLiteStore(filename, table="conversions", ttl=ttl) if filename else None
+        )
+        self.store_maxsize = store_maxsize
+        self.hits = 0
+        self.misses = 0
+        self._sets = 0
+        # the counters are shared by threads, the caches have their own locks
+        self._lock = Lock()
+        if self.store is not None:
+            self.store.evict(store_maxsize)
+
+    def get(self, key: str, default=None):
+        """Return the cached output from memory or the database"""
+        value = self.memory.get(key, None)
+        if value is None and self.store is not None:
+            value = self.store.get(key, None)
+            if value is not None:
+                self.memory.set(key, value)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value) -> None:
+        """Cache an output, evicting old entries from the database every
+        thousand outputs"""
+        self.memory.set(key, value)
+        if self.store is not None:
+            self.store.set(key, value)
+            with self._lock:
+                self._sets += 1
+                evict = self._sets % 1000 == 0
+            if evict:
+                self.store.evict(self.store_maxsize)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.store is not None:
+            self.store.clear()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
+
+    def cache_info(self) -> dict:
+        """Return hits, misses, hit rate, size in memory and in the database"""
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": len(self.memory),
+            "maxsize": self.memory.maxsize,
+            "stored": len(self.store) if self.store is not None else 0,
+        }
+
+
+def content_hash(*parts) -> str:
+    """SHA-256 of strings, bytes and JSON-serializable parts, with dict keys
+    sorted so that equal dicts hash the same"""
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode("utf-8")
+        elif not isinstance(part, bytes):
+            part = json.dumps(part, option=json.OPT_SORT_KEYS, default=str)
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def file_digest(filename: str, chunk_size: int = 1048576) -> bytes:
+    """SHA-256 of a file, read in chunks of chunk_size bytes"""
+    # hashlib.file_digest needs Python 3.11
+    digest = hashlib.sha256()
+    with open(filename, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.digest()
@@ -1,16 +1,15 @@
 import click
+import sys
 import time
 import pydash as py_
 import orjson as json
 
 from commonmeta import Metadata, MetadataList  # __version__
-from commonmeta.api_utils import update_ghost_post_via_api
+from commonmeta.metadata import configure_conversion_cache, get_cached_output
 from commonmeta.doi_utils import validate_prefix, encode_doi, decode_doi
-from commonmeta.readers.json_feed_reader import (
-    get_json_feed_item_uuid,
-)
-from commonmeta.readers.crossref_reader import get_random_crossref_id
-from commonmeta.readers.datacite_reader import get_random_datacite_id
+
+# readers and writers are imported by the commands that use them,
+# to keep the startup time of short-lived commands low
 
 
 @click.group()
@@ -31,6 +30,7 @@ def cli(show_errors):
 @click.option("--depositor", type=str)
 @click.option("--email", type=str)
 @click.option("--registrant", type=str)
+@click.option("--cache", type=str, help="SQLite database caching converted outputs")
 @click.option("--show-errors/--no-errors", type=bool, show_default=True, default=False)
 def convert(
     input,
@@ -43,22 +43,30 @@ def convert(
     depositor,
     email,
     registrant,
+    cache,
     show_errors,
 ):
+    write_kwargs = {
+        "style": style,
+        "locale": locale,
+        "depositor": depositor,
+        "email": email,
+        "registrant": registrant,
+    }
+    if cache:
+        # only outputs without errors are cached
+        configure_conversion_cache(filename=cache)
+        output = get_cached_output(
+            input, to=to, write_kwargs=write_kwargs, via=via, doi=doi, prefix=prefix
+        )
+        if output is not None:
+            click.echo(output)
+            return
     metadata = Metadata(input, via=via, doi=doi, prefix=prefix)
     if show_errors and not metadata.is_valid:
         raise click.ClickException(str(metadata.errors) + str(metadata.write_errors))
 
-    click.echo(
-        metadata.write(
-            to=to,
-            style=style,
-            locale=locale,
-            depositor=depositor,
-            email=email,
-            registrant=registrant,
-        )
-    )
+    click.echo(metadata.write(to=to, **write_kwargs))
     if show_errors and metadata.write_errors:
         raise click.ClickException(str(metadata.write_errors))
 
@@ -75,7 +83,17 @@ def convert(
 @click.option("--registrant", type=str)
 @click.option("--filename", type=str)
 @click.option("--jsonlines/--no-jsonlines", type=bool, show_default=True, default=False)
-@click.option("--show-errors/--no-errors", type=bool, show_default=True, default=False)
+@click.option("--max-records", type=int, help="Maximum works per Crossref XML batch")
+@click.option("--max-size", type=int, help="Maximum bytes per Crossref XML batch")
+@click.option("--jobs", "-j", type=int, default=1, help="Number of worker processes")
+@click.option("--cache", type=str, help="SQLite database caching converted outputs")
+@click.option(
+    "--show-errors/--no-errors",
+    type=bool,
+    show_default=True,
+    default=False,
+    help="Stop at the first item with errors",
+)
 @click.option("--show-timer/--no-timer", type=bool, show_default=True, default=False)
 def list(
     string,
@@ -89,27 +107,64 @@ def list(
     registrant,
     filename,
     jsonlines,
+    max_records,
+    max_size,
+    jobs,
+    cache,
     show_errors,
     show_timer,
 ):
     start = time.time()
+    kwargs = {
+        "via": via,
+        "depositor": depositor,
+        "email": email,
+        "registrant": registrant,
+        "prefix": prefix,
+        "filename": filename,
+        "jsonlines": jsonlines,
+    }
+    if cache and not filename:
+        # only outputs without errors are cached
+        configure_conversion_cache(filename=cache)
+        output = get_cached_output(
+            string,
+            to=to,
+            write_kwargs={"style": style, "locale": locale},
+            is_list=True,
+            **kwargs,
+        )
+        if output is not None:
+            click.echo(output)
+            return
+    # items are checked for errors as they are read and written, so that
+    # streaming works with --show-errors. Output written before the first
+    # item with errors is kept.
     metadata_list = MetadataList(
-        string,
-        via=via,
-        depositor=depositor,
-        email=email,
-        registrant=registrant,
-        prefix=prefix,
-        filename=filename,
-        jsonlines=jsonlines,
+        string, workers=jobs, raise_errors=show_errors, **kwargs
     )
     end = time.time()
     runtime = end - start
-    if show_errors and not metadata_list.is_valid:
-        raise click.ClickException(str(metadata_list.errors))
-    click.echo(metadata_list.write(to=to, style=style, locale=locale))
-    if show_errors and len(metadata_list.write_errors) > 0:
-        raise click.ClickException(str(metadata_list.write_errors))
+    try:
+        if filename and to == "crossref_xml":
+            from commonmeta.writers.crossref_xml_writer import (
+                write_crossref_xml_batches,
+            )
+
+            filenames = write_crossref_xml_batches(
+                metadata_list, filename, max_records=max_records, max_size=max_size
+            )
+            click.echo("\n".join(filenames))
+        elif filename or cache:
+            click.echo(metadata_list.write(to=to, style=style, locale=locale))
+        else:
+            # write one item at a time, so large lists are never fully in memory
+            metadata_list.write(to=to, file=sys.stdout, style=style, locale=locale)
+            click.echo()
+    except ValueError as error:
+        if not show_errors:
+            raise
+        raise click.ClickException(str(error))
     if show_timer:
         click.echo(f"Runtime: {runtime:.2f} seconds")
 
@@ -124,6 +179,9 @@ def list(
 @click.option("--locale", "-l", type=str, default="en-US")
 @click.option("--show-errors/--no-errors", type=bool, show_default=True, default=False)
 def sample(provider, prefix, type, number, to, style, locale, show_errors):
+    from commonmeta.readers.crossref_reader import get_random_crossref_id
+    from commonmeta.readers.datacite_reader import get_random_datacite_id
+
     if provider == "crossref":
         string = json.dumps(
             {"items": get_random_crossref_id(number, prefix=prefix, _type=type)}
@@ -166,6 +224,8 @@ def decode(doi):
 @cli.command()
 @click.argument("id", type=str, required=True)
 def encode_by_id(id):
+    from commonmeta.readers.json_feed_reader import get_json_feed_item_uuid
+
     post = get_json_feed_item_uuid(id)
     prefix = py_.get(post, "blog.prefix")
     if validate_prefix(prefix) is None:
@@ -179,6 +239,8 @@ def encode_by_id(id):
 @click.option("--id", type=str)
 def json_feed(filter, id=None):
     if filter == "blog_slug" and id is not None:
+        from commonmeta.readers.json_feed_reader import get_json_feed_item_uuid
+
         post = get_json_feed_item_uuid(id)
         output = py_.get(post, "blog.slug", "no slug found")
     else:
@@ -191,6 +253,8 @@ def json_feed(filter, id=None):
 @click.option("--api-key", "-k", type=str, required=True)
 @click.option("--api-url", "-u", type=str, required=True)
 def update_ghost_post(id, api_key, api_url):
+    from commonmeta.api_utils import update_ghost_post_via_api
+
     output = update_ghost_post_via_api(id, api_key, api_url)
     click.echo(output)
 
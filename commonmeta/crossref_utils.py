@@ -1,5 +1,6 @@
 """Crossref utils module for commonmeta-py"""
 
+import io
 from lxml import etree
 from typing import Optional
 from datetime import datetime
@@ -16,14 +17,13 @@ from .doi_utils import doi_from_url, validate_doi
 def generate_crossref_xml(metadata: Commonmeta) -> Optional[str]:
     """Generate Crossref XML. First checks for write errors (JSON schema validation)"""
     xml = crossref_root()
-    head = etree.SubElement(xml, "head")
-    # we use a uuid as batch_id
-    etree.SubElement(head, "doi_batch_id").text = str(uuid.uuid4())
-    etree.SubElement(head, "timestamp").text = datetime.now().strftime("%Y%m%d%H%M%S")
-    depositor = etree.SubElement(head, "depositor")
-    etree.SubElement(depositor, "depositor_name").text = metadata.depositor
-    etree.SubElement(depositor, "email_address").text = metadata.email
-    etree.SubElement(head, "registrant").text = metadata.registrant
+    xml.append(
+        crossref_head(
+            depositor=metadata.depositor,
+            email=metadata.email,
+            registrant=metadata.registrant,
+        )
+    )
 
     body = etree.SubElement(xml, "body")
     body = insert_crossref_work(metadata, body)
@@ -555,26 +555,92 @@ def crossref_root():
     return etree.fromstring(doi_batch)
 
 
-def generate_crossref_xml_list(metalist) -> Optional[str]:
-    """Generate Crossref XML list."""
-    if not metalist.is_valid:
-        return None
-    xml = crossref_root()
-    head = etree.SubElement(xml, "head")
-    # we use a uuid as batch_id
+def crossref_head(depositor=None, email=None, registrant=None):
+    """Crossref head, with a uuid as batch_id"""
+    head = etree.Element("head")
     etree.SubElement(head, "doi_batch_id").text = str(uuid.uuid4())
     etree.SubElement(head, "timestamp").text = datetime.now().strftime("%Y%m%d%H%M%S")
-    depositor = etree.SubElement(head, "depositor")
-    etree.SubElement(depositor, "depositor_name").text = metalist.depositor or "test"
-    etree.SubElement(depositor, "email_address").text = (
-        metalist.email or "info@example.org"
+    depositor_element = etree.SubElement(head, "depositor")
+    etree.SubElement(depositor_element, "depositor_name").text = depositor
+    etree.SubElement(depositor_element, "email_address").text = email
+    etree.SubElement(head, "registrant").text = registrant
+    return head
+
+
+def crossref_list_head(metalist):
+    """Crossref head for a list, with placeholders for missing depositor
+    information"""
+    return crossref_head(
+        depositor=metalist.depositor or "test",
+        email=metalist.email or "info@example.org",
+        registrant=metalist.registrant or "test",
     )
-    etree.SubElement(head, "registrant").text = metalist.registrant or "test"
 
-    body = etree.SubElement(xml, "body")
-    body = [insert_crossref_work(item, body) for item in metalist.items]
-    return etree.tostring(
-        xml,
-        doctype='<?xml version="1.0" encoding="UTF-8"?>',
-        pretty_print=True,
-    )
+
+def generate_crossref_xml_list(metalist) -> Optional[str]:
+    """Generate Crossref XML list, skipping invalid items"""
+    works = crossref_works(metalist)
+    return b"".join(generate_crossref_xml_batch(works, crossref_list_head(metalist)))
+
+
+def crossref_works(metalist):
+    """Generate the Crossref XML works of a list one at a time,
+    skipping invalid items. Their ids are kept in metalist.skipped."""
+    metalist.skipped = []
+    for item in metalist.iter_items():
+        if not item.is_valid:
+            metalist.skipped.append(item.id)
+            continue
+        body = etree.Element("body")
+        insert_crossref_work(item, body)
+        yield from body
+
+
+# closing tags written after the last work of a batch
+CROSSREF_BATCH_END = b"</body></doi_batch>"
+
+
+def generate_crossref_xml_batch(
+    works, head, max_records: Optional[int] = None, max_size: Optional[int] = None
+):
+    """Generate a Crossref XML batch incrementally with lxml.etree.xmlfile,
+    yielding the head and then every work as bytes. Stops before the work
+    that would take the batch over max_records works or max_size bytes, and
+    returns that work. A batch always contains at least one work."""
+    root = crossref_root()
+    buffer = io.BytesIO()
+    size = 0
+    count = 0
+    remaining = None
+
+    def flush(xf):
+        nonlocal size
+        xf.flush()
+        chunk = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        size += len(chunk)
+        return chunk
+
+    with etree.xmlfile(buffer, encoding="UTF-8") as xf:
+        xf.write_declaration()
+        with xf.element(root.tag, root.attrib, nsmap=root.nsmap):
+            xf.write("\n")
+            xf.write(head, pretty_print=True)
+            with xf.element("body"):
+                xf.write("\n")
+                yield flush(xf)
+                for work in works:
+                    if max_records is not None and count >= max_records:
+                        remaining = work
+                        break
+                    if max_size is not None and count > 0:
+                        work_size = len(etree.tostring(work, pretty_print=True))
+                        if size + work_size + len(CROSSREF_BATCH_END) > max_size:
+                            remaining = work
+                            break
+                    xf.write(work, pretty_print=True)
+                    count += 1
+                    yield flush(xf)
+    yield buffer.getvalue()
+    return remaining
@@ -1,13 +1,12 @@
 """Date utils for commonmeta-py"""
 import datetime
+import re
 from datetime import datetime as dt
 from typing import Optional, Union
-import dateparser
-from edtf import parse_edtf, DateAndTime, Date
-from edtf.parser.edtf_exceptions import EDTFParseException
 import pydash as py_
 
 from .base_utils import compact
+from .cache_utils import LRUCache
 
 MONTH_NAMES = {
     "01": "jan",
@@ -42,6 +41,14 @@ MONTH_SHORT_NAMES = [
 ISO8601_DATE_FORMAT = "%Y-%m-%d"
 
 
+ISO8601_DATE_REGEX = re.compile(r"^(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?$")
+
+# parsed date strings, and which parser handled them: iso8601 (regex or
+# datetime.fromisoformat), edtf, or dateparser as the slow fallback
+DATE_CACHE = LRUCache(maxsize=10000)
+DATE_PARSER_STATS = {"iso8601": 0, "edtf": 0, "dateparser": 0}
+
+
 def get_iso8601_date(date: Union[datetime.datetime, datetime.date, str, int]) -> str:
     """Get ISO 8601 date without time"""
     if date is None:
@@ -49,18 +56,60 @@ def get_iso8601_date(date: Union[datetime.datetime, datetime.date, str, int]) ->
     if isinstance(date, (datetime.datetime, datetime.date)):
         return date.strftime(ISO8601_DATE_FORMAT)
     if isinstance(date, str):
-        length = len(date)
-        if length == 7:
-            return dateparser.parse(date).strftime("%Y-%m")
-        if length == 4:
-            return dateparser.parse(date).strftime("%Y")
-        else:
-            return dateparser.parse(date).strftime(ISO8601_DATE_FORMAT)
+        result = DATE_CACHE.get(date, None)
+        if result is None:
+            result = parse_date_string(date)
+            DATE_CACHE.set(date, result)
+        return result
     if isinstance(date, int):
         return datetime.datetime.fromtimestamp(date).strftime(ISO8601_DATE_FORMAT)
     return ""
 
 
+def parse_date_string(date: str) -> str:
+    """Parse date string into ISO 8601 date, keeping year or year-month precision.
+    Try ISO 8601 and EDTF first, and only fall back to dateparser"""
+    length = len(date)
+    if length == 7:
+        date_format = "%Y-%m"
+    elif length == 4:
+        date_format = "%Y"
+    else:
+        date_format = ISO8601_DATE_FORMAT
+    match = ISO8601_DATE_REGEX.match(date)
+    try:
+        if match:
+            year, month, day = match.groups()
+            parsed = datetime.date(int(year), int(month or 1), int(day or 1))
+        else:
+            parsed = dt.fromisoformat(date)
+        DATE_PARSER_STATS["iso8601"] += 1
+        return parsed.strftime(date_format)
+    except ValueError:
+        pass
+    edtf = validate_edtf(date, quiet=True)
+    if edtf is not None:
+        DATE_PARSER_STATS["edtf"] += 1
+        return edtf.split("T")[0]
+    # dateparser loads its language data on import, so only when needed
+    import dateparser
+
+    DATE_PARSER_STATS["dateparser"] += 1
+    return dateparser.parse(date).strftime(date_format)
+
+
+def date_cache_info() -> dict:
+    """Return cache hits, misses and size, and strings parsed by each parser"""
+    return DATE_CACHE.cache_info() | DATE_PARSER_STATS
+
+
+def clear_date_cache() -> None:
+    """Remove all parsed date strings and reset the counters"""
+    DATE_CACHE.clear()
+    for key in DATE_PARSER_STATS:
+        DATE_PARSER_STATS[key] = 0
+
+
 def get_date_parts(iso8601_time: Optional[str]) -> dict:
     """Get date parts"""
     if iso8601_time is None:
@@ -130,7 +179,7 @@ def get_month_from_date(
     if not isinstance(date, (str, int, datetime.datetime, datetime.date)):
         return None
     if isinstance(date, str):
-        date = dateparser.parse(date).strftime(ISO8601_DATE_FORMAT)
+        date = get_iso8601_date(date)
     if isinstance(date, int):
         date = datetime.datetime.fromtimestamp(date).strftime(ISO8601_DATE_FORMAT)
     if isinstance(date, (datetime.datetime, datetime.date)):
@@ -195,15 +244,22 @@ def normalize_date_dict(data: dict) -> dict:
     )
 
 
-def validate_edtf(iso8601_time: Optional[str]) -> Optional[str]:
+def validate_edtf(
+    iso8601_time: Optional[str], quiet: bool = False
+) -> Optional[str]:
     """Validate EDTF string using edtf. Return None if invalid"""
     if iso8601_time is None:
         return None
+    from edtf import parse_edtf, DateAndTime, Date, Season
+    from edtf.parser.edtf_exceptions import EDTFParseException
+
     try:
         edtf = parse_edtf(iso8601_time)
-    except EDTFParseException as e:
-        print(e)
-        return None
-    if not isinstance(edtf, (DateAndTime, Date)):
+        # seasons are dates in edtf, but have no month to format
+        if not isinstance(edtf, (DateAndTime, Date)) or isinstance(edtf, Season):
+            return None
+        return edtf.isoformat()
+    except (EDTFParseException, ValueError, AttributeError) as e:
+        if not quiet:
+            print(e)
         return None
-    return edtf.isoformat()
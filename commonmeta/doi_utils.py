@@ -1,12 +1,24 @@
 """Doi utils for commonmeta-py"""
 
 import re
+from os import path
 from typing import Optional
-import httpx
+import orjson as json
 from furl import furl
 import base32_lib as base32
 
 from .base_utils import compact
+from .cache_utils import LRUCache, SQLiteStore
+
+# DOI prefixes almost never change registration agency
+DOI_RA_CACHE_TTL = 30 * 24 * 60 * 60
+DOI_RA_CACHE_MAXSIZE = 50000
+
+_doi_ra_cache = LRUCache(maxsize=DOI_RA_CACHE_MAXSIZE, ttl=DOI_RA_CACHE_TTL)
+_doi_ra_store: Optional[SQLiteStore] = None
+_doi_ra_store_maxsize = DOI_RA_CACHE_MAXSIZE
+_doi_ra_store_sets = 0
+_doi_ra_seeded = False
 
 
 def validate_doi(doi: Optional[str]) -> Optional[str]:
@@ -86,7 +98,9 @@ def short_doi_as_doi(doi: Optional[str]) -> Optional[str]:
     """Resolve a short DOI"""
     if doi is None:
         return None
-    response = httpx.head(doi_as_url(doi), timeout=10)
+    from .http_utils import http_head
+
+    response = http_head(doi_as_url(doi))
     if response.status_code != 301:
         return doi_as_url(doi)
     return response.headers.get("Location")
@@ -126,10 +140,103 @@ def get_doi_ra(doi) -> Optional[str]:
     prefix = validate_prefix(doi)
     if prefix is None:
         return None
-    response = httpx.get("https://doi.org/ra/" + prefix, timeout=10)
+    registration_agency = get_cached_doi_ra(prefix)
+    if registration_agency is not None:
+        return registration_agency
+    from .http_utils import http_get
+
+    response = http_get("https://doi.org/ra/" + prefix)
+    if response.status_code != 200:
+        return None
+    registration_agency = response.json()[0].get("RA", None)
+    set_cached_doi_ra(prefix, registration_agency)
+    return registration_agency
+
+
+async def get_doi_ra_async(doi, client=None) -> Optional[str]:
+    """Return the DOI registration agency for a given DOI with an async client"""
+    prefix = validate_prefix(doi)
+    if prefix is None:
+        return None
+    registration_agency = get_cached_doi_ra(prefix)
+    if registration_agency is not None:
+        return registration_agency
+    from .http_utils import async_http_get
+
+    response = await async_http_get("https://doi.org/ra/" + prefix, client=client)
     if response.status_code != 200:
         return None
-    return response.json()[0].get("RA", None)
+    registration_agency = response.json()[0].get("RA", None)
+    set_cached_doi_ra(prefix, registration_agency)
+    return registration_agency
+
+
+def get_cached_doi_ra(prefix: str) -> Optional[str]:
+    """Return the registration agency for a DOI prefix from the in-memory
+    cache or the optional on-disk store"""
+    if not _doi_ra_seeded:
+        seed_doi_ra_cache()
+    registration_agency = _doi_ra_cache.get(prefix, None)
+    if registration_agency is not None:
+        return registration_agency
+    if _doi_ra_store is not None:
+        registration_agency = _doi_ra_store.get(prefix, None)
+    if registration_agency is not None:
+        _doi_ra_cache.set(prefix, registration_agency)
+    return registration_agency
+
+
+def set_cached_doi_ra(prefix: str, registration_agency: Optional[str]) -> None:
+    """Cache the registration agency for a DOI prefix, evicting expired and
+    old entries from the on-disk store every thousand prefixes"""
+    global _doi_ra_store_sets
+    if registration_agency is None:
+        return None
+    if not _doi_ra_seeded:
+        seed_doi_ra_cache()
+    _doi_ra_cache.set(prefix, registration_agency)
+    if _doi_ra_store is not None:
+        _doi_ra_store.set(prefix, registration_agency)
+        _doi_ra_store_sets += 1
+        if _doi_ra_store_sets % 1000 == 0:
+            _doi_ra_store.evict(_doi_ra_store_maxsize)
+
+
+def configure_doi_ra_cache(
+    filename: Optional[str] = None,
+    ttl: Optional[float] = DOI_RA_CACHE_TTL,
+    maxsize: int = DOI_RA_CACHE_MAXSIZE,
+) -> None:
+    """Configure the DOI registration agency cache. filename is a SQLite
+    database that persists lookups between runs, ttl is in seconds. Both
+    the in-memory cache and the database keep at most maxsize prefixes."""
+    global _doi_ra_cache, _doi_ra_store, _doi_ra_store_maxsize, _doi_ra_seeded
+    if _doi_ra_store is not None:
+        _doi_ra_store.close()
+    _doi_ra_store = SQLiteStore(filename, table="doi_ra", ttl=ttl) if filename else None
+    _doi_ra_store_maxsize = maxsize
+    if _doi_ra_store is not None:
+        _doi_ra_store.evict(maxsize)
+    _doi_ra_cache = LRUCache(maxsize=maxsize, ttl=ttl)
+    _doi_ra_seeded = False
+
+
+def seed_doi_ra_cache() -> None:
+    """Add the bundled table of major Crossref and DataCite prefixes to the
+    in-memory cache. Seeded prefixes expire with the cache ttl and are then
+    looked up again."""
+    global _doi_ra_seeded
+    file_path = path.join(path.dirname(__file__), "resources", "doi_prefixes.json")
+    with open(file_path, encoding="utf-8") as file:
+        prefixes = json.loads(file.read())
+    for prefix, registration_agency in prefixes.items():
+        _doi_ra_cache.set(prefix, registration_agency)
+    _doi_ra_seeded = True
+
+
+def doi_ra_cache_info() -> dict:
+    """Return hits, misses and size of the in-memory DOI registration agency cache"""
+    return _doi_ra_cache.cache_info()
 
 
 def encode_doi(prefix, number: Optional[int] = None, checksum: bool = True) -> str:
@@ -158,7 +265,9 @@ def decode_doi(doi: str, checksum: bool = True) -> int:
 
 def get_crossref_member(member_id) -> Optional[dict]:
     """Return the Crossref member for a given member_id"""
-    response = httpx.get("https://api.crossref.org/members/" + member_id, timeout=10)
+    from .http_utils import http_get
+
+    response = http_get("https://api.crossref.org/members/" + member_id)
     if response.status_code != 200:
         return None
     data = response.json().get("message", None)
@@ -0,0 +1,103 @@
+"""HTML utils for commonmeta-py"""
+
+from html.parser import HTMLParser
+from typing import Callable, Iterable, Optional, Union
+import orjson as json
+
+
+class HtmlMeta(HTMLParser):
+    """Lookup table of the metadata in an HTML document, collected in a single
+    pass: meta tags by name and property, the canonical link, the document
+    language and the parsed JSON-LD blocks"""
+
+    def __init__(self):
+        super().__init__()
+        self.meta: dict = {}
+        self.canonical: Optional[str] = None
+        self.lang: Optional[str] = None
+        self.json_ld: list = []
+        self.head_done = False
+        self._script: Optional[list] = None
+        self._chunks: list = []
+
+    def feed(self, data: str) -> None:
+        self._chunks.append(data)
+        super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "meta":
+            attrs = dict(attrs)
+            content = attrs.get("content", None)
+            if content is None:
+                return
+            for attr in ["name", "property"]:
+                if attrs.get(attr, None):
+                    self.meta.setdefault((attr, attrs[attr]), []).append(content)
+        elif tag == "link":
+            attrs = dict(attrs)
+            if self.canonical is None and attrs.get("rel", None) == "canonical":
+                self.canonical = attrs.get("href", None)
+        elif tag == "script":
+            if dict(attrs).get("type", None) == "application/ld+json":
+                self._script = []
+        elif tag == "html":
+            if self.lang is None:
+                self.lang = dict(attrs).get("lang", None)
+        elif tag == "body":
+            self.head_done = True
+
+    def handle_data(self, data):
+        if self._script is not None:
+            self._script.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.head_done = True
+        elif tag == "script" and self._script is not None:
+            try:
+                self.json_ld.append(json.loads("".join(self._script)))
+            except json.JSONDecodeError:
+                pass
+            self._script = None
+
+    def get(self, attr: str, *values: str) -> Optional[str]:
+        """Content of the first meta tag with one of the values for attr
+        (name or property), in the order of the values"""
+        for value in values:
+            contents = self.meta.get((attr, value), None)
+            if contents:
+                return contents[0]
+        return None
+
+    def get_all(self, attr: str, value: str) -> list:
+        """Contents of all meta tags with the value for attr"""
+        return self.meta.get((attr, value), [])
+
+    @property
+    def html(self) -> str:
+        """The part of the document read so far"""
+        return "".join(self._chunks)
+
+    def soup(self):
+        """BeautifulSoup of the part of the document read so far, for
+        metadata outside of meta tags"""
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.html, "html.parser")
+
+
+def parse_html_meta(
+    chunks: Union[str, Iterable[str]],
+    stop: Optional[Callable[[HtmlMeta], bool]] = None,
+) -> HtmlMeta:
+    """Collect the metadata of an HTML document given as string or as chunks
+    of a streamed response. Stops reading after the head if stop returns True."""
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    meta = HtmlMeta()
+    for chunk in chunks:
+        meta.feed(chunk)
+        if meta.head_done and stop is not None and stop(meta):
+            break
+    meta.close()
+    return meta
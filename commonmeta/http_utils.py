@@ -0,0 +1,359 @@
+"""HTTP utils for commonmeta-py"""
+
+import asyncio
+import time
+import weakref
+from email.utils import parsedate_to_datetime
+from threading import BoundedSemaphore, Lock
+from typing import Optional
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRY_METHODS = ["GET", "HEAD"]
+MAX_BACKOFF = 60
+
+HTTP_OPTIONS = {
+    "timeout": 10,
+    "max_connections": 100,
+    "max_keepalive_connections": 20,
+    "max_connections_per_host": 10,
+    "retries": 3,
+    "backoff_factor": 0.5,
+    "http2": HTTP2_AVAILABLE,
+    "user_agent": None,
+}
+
+_client: Optional[httpx.Client] = None
+_client_lock = Lock()
+# async clients are bound to an event loop, one shared client per loop
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+# clients replaced by configure_client, closed on their loop on next use
+_stale_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_closing_tasks: set = set()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Transport that limits concurrent connections per host, and retries
+    idempotent requests on 429 and 5xx responses with exponential backoff"""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_connections_per_host: Optional[int] = 10,
+    ):
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_connections_per_host = max_connections_per_host
+        self._semaphores: dict = {}
+        self._semaphores_lock = Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._send(request)
+            if (
+                request.method not in RETRY_METHODS
+                or response.status_code not in RETRY_STATUS_CODES
+                or attempt >= self.retries
+            ):
+                return response
+            delay = get_backoff(response, attempt, self.backoff_factor)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def _send(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        if semaphore is None:
+            return self.transport.handle_request(request)
+        semaphore.acquire()
+        try:
+            response = self.transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        # keep the host slot until the response body has been read
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=ReleasingByteStream(response.stream, semaphore),
+            extensions=response.extensions,
+        )
+
+    def _semaphore(self, host: str) -> Optional[BoundedSemaphore]:
+        if not self.max_connections_per_host:
+            return None
+        with self._semaphores_lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = BoundedSemaphore(self.max_connections_per_host)
+            return self._semaphores[host]
+
+
+class ReleasingByteStream(httpx.SyncByteStream):
+    """Response stream that releases a per-host semaphore when closed"""
+
+    def __init__(self, stream, semaphore: BoundedSemaphore):
+        self.stream = stream
+        self.semaphore = semaphore
+        self.released = False
+
+    def __iter__(self):
+        yield from self.stream
+
+    def close(self) -> None:
+        try:
+            if hasattr(self.stream, "close"):
+                self.stream.close()
+        finally:
+            if not self.released:
+                self.released = True
+                self.semaphore.release()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Async transport with the same per-host limits and retries as RetryTransport"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_connections_per_host: Optional[int] = 10,
+    ):
+        self.transport = transport
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.max_connections_per_host = max_connections_per_host
+        # asyncio semaphores are bound to the loop they are first used on.
+        # Each transport belongs to one client, and shared clients to one
+        # loop, so these are per loop.
+        self._semaphores: dict = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._send(request)
+            if (
+                request.method not in RETRY_METHODS
+                or response.status_code not in RETRY_STATUS_CODES
+                or attempt >= self.retries
+            ):
+                return response
+            delay = get_backoff(response, attempt, self.backoff_factor)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    async def _send(self, request: httpx.Request) -> httpx.Response:
+        if not self.max_connections_per_host:
+            return await self.transport.handle_async_request(request)
+        host = request.url.host
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        semaphore = self._semaphores[host]
+        await semaphore.acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        # keep the host slot until the response body has been read
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=AsyncReleasingByteStream(response.stream, semaphore),
+            extensions=response.extensions,
+        )
+
+
+class AsyncReleasingByteStream(httpx.AsyncByteStream):
+    """Async response stream that releases a per-host semaphore when closed"""
+
+    def __init__(self, stream, semaphore: asyncio.Semaphore):
+        self.stream = stream
+        self.semaphore = semaphore
+        self.released = False
+
+    async def __aiter__(self):
+        async for chunk in self.stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            if hasattr(self.stream, "aclose"):
+                await self.stream.aclose()
+        finally:
+            if not self.released:
+                self.released = True
+                self.semaphore.release()
+
+
+def get_backoff(response: httpx.Response, attempt: int, backoff_factor: float):
+    """Seconds to wait before the next attempt, honouring Retry-After"""
+    retry_after = response.headers.get("Retry-After", None)
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0), MAX_BACKOFF)
+        except ValueError:
+            pass
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+            return min(max(delay, 0), MAX_BACKOFF)
+        except (TypeError, ValueError):
+            pass
+    return min(backoff_factor * (2**attempt), MAX_BACKOFF)
+
+
+def create_client(
+    transport: Optional[httpx.BaseTransport] = None, **kwargs
+) -> httpx.Client:
+    """Create an httpx.Client with connection pooling and retries. Options
+    default to HTTP_OPTIONS, transport replaces the network transport."""
+    options = HTTP_OPTIONS | kwargs
+    limits = httpx.Limits(
+        max_connections=options["max_connections"],
+        max_keepalive_connections=options["max_keepalive_connections"],
+    )
+    if transport is None:
+        transport = httpx.HTTPTransport(
+            http2=options["http2"], limits=limits, retries=1
+        )
+    headers = {"User-Agent": options["user_agent"]} if options["user_agent"] else None
+    return httpx.Client(
+        transport=RetryTransport(
+            transport,
+            retries=options["retries"],
+            backoff_factor=options["backoff_factor"],
+            max_connections_per_host=options["max_connections_per_host"],
+        ),
+        headers=headers,
+        timeout=options["timeout"],
+    )
+
+
+def create_async_client(
+    transport: Optional[httpx.AsyncBaseTransport] = None, **kwargs
+) -> httpx.AsyncClient:
+    """Create an httpx.AsyncClient with connection pooling and retries.
+    Options default to HTTP_OPTIONS, transport replaces the network transport."""
+    options = HTTP_OPTIONS | kwargs
+    limits = httpx.Limits(
+        max_connections=options["max_connections"],
+        max_keepalive_connections=options["max_keepalive_connections"],
+    )
+    if transport is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=options["http2"], limits=limits, retries=1
+        )
+    headers = {"User-Agent": options["user_agent"]} if options["user_agent"] else None
+    return httpx.AsyncClient(
+        transport=AsyncRetryTransport(
+            transport,
+            retries=options["retries"],
+            backoff_factor=options["backoff_factor"],
+            max_connections_per_host=options["max_connections_per_host"],
+        ),
+        headers=headers,
+        timeout=options["timeout"],
+    )
+
+
+def get_client() -> httpx.Client:
+    """Return the shared httpx.Client, creating it on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_client()
+    return _client
+
+
+def set_client(client: Optional[httpx.Client]) -> None:
+    """Use the given httpx.Client for all requests, e.g. in tests.
+    None closes the current client and creates a new one on next use."""
+    global _client
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient of the running event loop,
+    creating it on first use"""
+    loop = asyncio.get_running_loop()
+    for stale in _stale_async_clients.pop(loop, []):
+        task = loop.create_task(stale.aclose())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+    client = _async_clients.get(loop, None)
+    if client is None or client.is_closed:
+        client = create_async_client()
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the shared async client of the running event loop, e.g. before
+    the loop is closed. A new one is created on next use."""
+    loop = asyncio.get_running_loop()
+    for stale in _stale_async_clients.pop(loop, []):
+        await stale.aclose()
+    client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+def configure_client(**kwargs) -> None:
+    """Update HTTP_OPTIONS and recreate the shared clients on next use.
+    Async clients can only be closed on their event loop, so they are closed
+    the next time the loop uses or closes its shared client."""
+    unknown = set(kwargs) - set(HTTP_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown HTTP options: {', '.join(sorted(unknown))}")
+    HTTP_OPTIONS.update(kwargs)
+    set_client(None)
+    for loop, client in list(_async_clients.items()):
+        _stale_async_clients.setdefault(loop, []).append(client)
+    _async_clients.clear()
+
+
+def http_get(url: str, **kwargs) -> httpx.Response:
+    """GET request with the shared client"""
+    return get_client().get(url, **kwargs)
+
+
+def http_stream(url: str, **kwargs):
+    """Streaming GET request with the shared client, used as context manager"""
+    return get_client().stream("GET", url, **kwargs)
+
+
+def http_head(url: str, **kwargs) -> httpx.Response:
+    """HEAD request with the shared client"""
+    return get_client().head(url, **kwargs)
+
+
+async def async_http_get(
+    url: str, client: Optional[httpx.AsyncClient] = None, **kwargs
+) -> httpx.Response:
+    """GET request with the given async client, or the shared async client
+    of the running event loop"""
+    if client is None:
+        client = get_async_client()
+    return await client.get(url, **kwargs)
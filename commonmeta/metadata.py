@@ -1,56 +1,36 @@
 """Metadata"""
 
+from collections.abc import Iterable
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
 from os import path
 import orjson as json
 from typing import Optional, Union
-import yaml
-from pydash import py_
 
-from .readers.crossref_reader import (
-    get_crossref,
-    read_crossref,
+from .utils import (
+    normalize_id,
+    find_from_format,
+    find_from_format_by_id_async,
+    sniff_format,
+    sniff_records_format,
+    find_from_format_by_ext,
+    find_from_format_by_json,
+    SNIFF_LENGTH,
 )
-from .readers.datacite_reader import (
-    get_datacite,
-    read_datacite,
-)
-from .readers.datacite_xml_reader import read_datacite_xml
-from .readers.crossref_xml_reader import (
-    get_crossref_xml,
-    read_crossref_xml,
-)
-from .readers.schema_org_reader import (
-    get_schema_org,
-    read_schema_org,
-)
-from .readers.codemeta_reader import (
-    get_codemeta,
-    read_codemeta,
-)
-from .readers.csl_reader import read_csl
-from .readers.cff_reader import get_cff, read_cff
-from .readers.json_feed_reader import get_json_feed_item, read_json_feed_item
-from .readers.inveniordm_reader import (
-    get_inveniordm,
-    read_inveniordm,
-)
-from .readers.kbase_reader import read_kbase
-from .readers.commonmeta_reader import read_commonmeta
-from .readers.ris_reader import read_ris
-from .writers.datacite_writer import write_datacite
-from .writers.bibtex_writer import write_bibtex, write_bibtex_list
-from .writers.citation_writer import write_citation, write_citation_list
-from .writers.crossref_xml_writer import write_crossref_xml, write_crossref_xml_list
-from .writers.csl_writer import write_csl, write_csl_list
-from .writers.ris_writer import write_ris, write_ris_list
-from .writers.schema_org_writer import write_schema_org
-from .writers.commonmeta_writer import write_commonmeta, write_commonmeta_list
-from .writers.inveniordm_writer import write_inveniordm
-from .utils import normalize_id, find_from_format
-from .base_utils import parse_xml, wrap
-from .doi_utils import doi_from_url
+from .base_utils import wrap, write_chunks
+from .cache_utils import ConversionCache, content_hash, file_digest
 from .schema_utils import json_schema_errors
-from .constants import CM_TO_CR_TRANSLATIONS
+from .registry import get_format
+from . import __version__
+
+VALIDATION_MODES = ["eager", "lazy", "off"]
+WRITE_OPTIONS = ["style", "locale", "depositor", "email", "registrant"]
+JSONL_EXTENSIONS = [".jsonl", ".ndjson"]
+CONVERSION_CACHE_MAXSIZE = 1024
+
+# optional cache of write outputs, see configure_conversion_cache
+_conversion_cache: Optional[ConversionCache] = None
 
 
 # pylint: disable=R0902
@@ -60,21 +40,33 @@ class Metadata:
     def __init__(self, string: Optional[Union[str, dict]], **kwargs):
         if string is None or not isinstance(string, (str, dict)):
             raise ValueError("No input found")
+        # dicts built by write_item, with the hash of the attributes they
+        # were built from
+        self._written = {}
         self.via = kwargs.get("via", None)
+        validate = kwargs.get("validate", None) or "eager"
+        if validate not in VALIDATION_MODES:
+            raise ValueError("Validation mode not supported")
+        # the input, if it is not fetched from an id, for the conversion cache
+        source = None
         if isinstance(string, dict):
             data = string
+            source = string
         elif isinstance(string, str):
             pid = normalize_id(string)
+            parsed = None
             if pid is not None and self.via is None:
                 self.via = find_from_format(pid=pid)
             elif path.exists(string):
                 with open(string, encoding="utf-8") as file:
                     string = file.read()
                 if self.via is None:
-                    self.via = find_from_format(string=string)
+                    self.via, parsed = sniff_format(string)
+            if pid is None:
+                source = string
             if self.via is None:
                 self.via = "commonmeta"
-            data = self.get_metadata(pid=pid, string=string)
+            data = self.get_metadata(pid=pid, string=string, parsed=parsed)
         meta = self.read_metadata(data=data, **kwargs)
 
         # required properties
@@ -110,154 +102,225 @@ class Metadata:
         self.date_updated = meta.get("date_updated")
         self.state = meta.get("state")
 
-        # Catch errors in the reader, then validate against JSON schema for Commonmeta
-        self.errors = meta.get("errors", None) or json_schema_errors(
-            json.loads(self.write())
-        )
+        # Catch errors in the reader, then validate against JSON schema for Commonmeta.
+        # Validation can be deferred until errors or is_valid are first accessed,
+        # or skipped entirely.
+        self._validation = validate
+        self._errors = meta.get("errors", None)
+        self._validated = False
+        self._is_valid = None
         self.write_errors = None
-        self.is_valid = (
-            meta.get("state", None) not in ["not_found", "forbidden", "bad_request"]
+        if validate == "eager":
+            self.validate()
+            self._is_valid = self._check_valid()
+        # the conversion cache is only used while the metadata is unchanged
+        self._input_key = None
+        self._input_state = None
+        if _conversion_cache is not None and source is not None:
+            self._input_key = input_key(source, **kwargs)
+            self._input_state = self._state_hash()
+
+    def _unchanged(self) -> bool:
+        """The metadata still matches the input it was read from, also when
+        attributes were changed in place"""
+        return (
+            self._input_key is not None
+            and self._state_hash() == self._input_state
+        )
+
+    @property
+    def errors(self):
+        """Errors from reading and validating the metadata"""
+        if not self._validated:
+            self.validate()
+        return self._errors
+
+    @errors.setter
+    def errors(self, value):
+        self._errors = value
+        self._validated = True
+
+    @property
+    def is_valid(self) -> bool:
+        """Metadata was found and has no errors"""
+        if self._is_valid is None:
+            self._is_valid = self._check_valid()
+        return self._is_valid
+
+    def validate(self):
+        """Validate against JSON schema for Commonmeta, unless validation is off
+        or the reader already reported errors"""
+        if self._validation != "off" and self._errors is None:
+            # validate the commonmeta dict directly, write_item keeps it for write()
+            self._errors = json_schema_errors(
+                self.write_item("commonmeta", copy=False)
+            )
+        self._validated = True
+        return self._errors
+
+    def _check_valid(self) -> bool:
+        return (
+            self.state not in ["not_found", "forbidden", "bad_request"]
             and self.errors is None
             and self.write_errors is None
         )
 
-    def get_metadata(self, pid, string) -> dict:
-        via = self.via
+    def get_metadata(self, pid, string, parsed=None) -> dict:
+        """Fetch metadata for a pid, or parse a string. parsed is the JSON or
+        YAML data already parsed when finding the format."""
+        fmt = get_format(self.via)
         if pid is not None:
-            if via == "schema_org":
-                return get_schema_org(pid)
-            elif via == "datacite":
-                return get_datacite(pid)
-            elif via in ["crossref", "op"]:
-                return get_crossref(pid)
-            elif via == "crossref_xml":
-                return get_crossref_xml(pid)
-            elif via == "codemeta":
-                return get_codemeta(pid)
-            elif via == "cff":
-                return get_cff(pid)
-            elif via == "json_feed_item":
-                return get_json_feed_item(pid)
-            elif via == "inveniordm":
-                return get_inveniordm(pid)
+            if fmt is not None and fmt.fetch is not None:
+                return fmt.load("fetch")(pid)
+            return None
+        elif parsed is not None:
+            return parsed
         elif string is not None:
-            if via == "datacite_xml":
-                return parse_xml(string)
-            elif via == "crossref_xml":
-                return parse_xml(string, dialect="crossref")
-            elif via == "cff":
-                return yaml.safe_load(string)
-            elif via == "bibtex":
-                raise ValueError("Bibtex not supported")
-            elif via == "ris":
-                return string
-            elif via in [
-                "commonmeta",
-                "crossref",
-                "datacite",
-                "schema_org",
-                "csl",
-                "json_feed_item",
-                "codemeta",
-                "kbase",
-                "inveniordm",
-            ]:
-                return json.loads(string)
-            else:
+            if fmt is None or fmt.read is None:
                 raise ValueError("No input format found")
+            if fmt.parse is None:
+                return string
+            return fmt.load("parse")(string)
         else:
             raise ValueError("No metadata found")
 
     def read_metadata(self, data: dict, **kwargs) -> dict:
         """get_metadata"""
         via = isinstance(data, dict) and data.get("via", None) or self.via
-        if via == "commonmeta":
-            return read_commonmeta(data, **kwargs)
-        elif via == "schema_org":
-            return read_schema_org(data)
-        elif via == "datacite":
-            return read_datacite(data)
-        elif via == "datacite_xml":
-            return read_datacite_xml(data)
-        elif via in ["crossref", "op"]:
-            return read_crossref(data)
-        elif via == "crossref_xml":
-            return read_crossref_xml(data)
-        elif via == "csl":
-            return read_csl(data, **kwargs)
-        elif via == "codemeta":
-            return read_codemeta(data)
-        elif via == "cff":
-            return read_cff(data)
-        elif via == "json_feed_item":
-            return read_json_feed_item(data, **kwargs)
-        elif via == "inveniordm":
-            return read_inveniordm(data)
-        elif via == "kbase":
-            return read_kbase(data)
-        elif via == "ris":
-            return read_ris(data)
-        else:
+        fmt = get_format(via)
+        if fmt is None or fmt.read is None:
             raise ValueError("No input format found")
+        if fmt.read_options:
+            return fmt.load("read")(data, **kwargs)
+        return fmt.load("read")(data)
+
+    def write_item(self, to: str = "commonmeta", copy: bool = True) -> Optional[dict]:
+        """Build the dict for an output format, validate it and return a copy.
+        The dict is cached with a hash of the attributes it was built from, so
+        that writing several formats of the same record reuses the work until
+        the metadata changes, also when it is changed in place. copy=False
+        returns the cached dict itself, for writers that only serialize it."""
+        # write options only show up in commonmeta
+        state = self._state_hash(options=to == "commonmeta")
+        cached = self._written.get(to, None)
+        if cached is not None and cached[0] == state:
+            item = cached[1]
+        else:
+            fmt = get_format(to)
+            if fmt is None or fmt.write_item is None:
+                raise ValueError("No output format found")
+            item = fmt.load("write_item")(self)
+            if item is not None and to == "csl":
+                self.errors = json_schema_errors([item], schema="csl")
+            elif item is not None and to == "datacite":
+                self.write_errors = json_schema_errors(item, schema="datacite")
+            if item is not None:
+                self._written[to] = (state, item)
+        if item is None or not copy:
+            return item
+        return json.loads(json.dumps(item))
+
+    def _state_hash(self, options: bool = False) -> str:
+        """Hash of the public attributes, with or without the write options.
+        Keys are not sorted, dicts in another order only hash differently."""
+        state = {
+            k: v
+            for k, v in vars(self).items()
+            if not k.startswith("_") and (options or k not in WRITE_OPTIONS)
+        }
+        return hashlib.sha256(json.dumps(state, default=str)).hexdigest()
 
     def write(self, to: str = "commonmeta", **kwargs) -> str:
         """convert metadata into different formats"""
+        fmt = get_format(to)
+        if fmt is None or fmt.write is None:
+            raise ValueError("No output format found")
+        # write options such as the citation style are kept with the metadata
+        options = write_options(fmt, **kwargs)
+        for option, value in options.items():
+            setattr(self, option, value)
+        key = None
+        if _conversion_cache is not None and self._unchanged():
+            # options kept from earlier writes show up in commonmeta output
+            options = {k: self.__dict__[k] for k in WRITE_OPTIONS if k in self.__dict__}
+            key = conversion_key(self._input_key, "item", to, options)
+            output = _conversion_cache.get(key, None)
+            if output is not None:
+                return output
         try:
-            if to == "commonmeta":
-                return write_commonmeta(self)
-            elif to == "bibtex":
-                return write_bibtex(self)
-            elif to == "csl":
-                instance = py_.omit(json.loads(write_csl(self)), [])
-                self.errors = json_schema_errors(instance, schema="csl")
-                return write_csl(self)
-            elif to == "citation":
-                self.style = kwargs.get("style", "apa")
-                self.locale = kwargs.get("locale", "en-US")
-                return write_citation(self)
-            elif to == "ris":
-                return write_ris(self)
-            elif to == "schema_org":
-                return write_schema_org(self)
-            elif to == "inveniordm":
-                return write_inveniordm(self)
-            elif to == "datacite":
-                instance = json.loads(write_datacite(self))
-                self.write_errors = json_schema_errors(instance, schema="datacite")
-                print(self.write_errors)
-                return write_datacite(self)
-            elif to == "crossref_xml":
-                doi = doi_from_url(self.id)
-                _type = CM_TO_CR_TRANSLATIONS.get(self.type, None)
-                url = self.url
-                instance = {"doi": doi, "type": _type, "url": url}
-                self.depositor = kwargs.get("depositor", None)
-                self.email = kwargs.get("email", None)
-                self.registrant = kwargs.get("registrant", None)
-                self.write_errors = json_schema_errors(instance, schema="crossref")
-                return write_crossref_xml(self)
-            else:
-                raise ValueError("No output format found")
+            output = fmt.load("write")(self)
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON")
+        # only outputs without errors are cached
+        if key is not None and output is not None and self._check_valid():
+            _conversion_cache.set(key, output)
+        return output
 
 
 class MetadataList:
     """MetadataList"""
 
     def __init__(
-        self, dct: Optional[Union[str, dict]] = None, **kwargs
+        self, dct: Optional[Union[str, dict, Iterable]] = None, **kwargs
     ) -> Optional[dict]:
-        if dct is None or not isinstance(dct, (str, bytes, dict)):
+        if dct is None or not isinstance(dct, (str, bytes, dict, Iterable)):
             raise ValueError("No input found")
+        if (kwargs.get("validate", None) or "eager") not in VALIDATION_MODES:
+            raise ValueError("Validation mode not supported")
+        # items are read in a pool of worker processes if workers > 1
+        self.workers = kwargs.pop("workers", None)
+        self.chunk_size = kwargs.pop("chunk_size", None) or 100
+        # raise ValueError for the first item with errors, e.g. while streaming
+        self.raise_errors = kwargs.pop("raise_errors", False)
+        # JSON Lines input is read lazily, one item per line, by iter_items,
+        # and so are formats that split their input into records
+        self._lines = None
+        self._records = None
+        self._items = None
+        self._kwargs = kwargs
+        self.via = kwargs.get("via", None)
+        # the input, if it is not an iterable of lines, for the conversion
+        # cache. Files are hashed in chunks, not kept in memory.
+        source = None
+        filename = None
         if isinstance(dct, dict):
             meta = dct
-        elif isinstance(dct, (str, bytes)):
-            if path.exists(dct):
-                with open(dct, encoding="utf-8") as file:
+            source = dct
+        elif isinstance(dct, str) and path.splitext(dct)[1] in JSONL_EXTENSIONS:
+            if not path.exists(dct):
+                raise ValueError("No input found")
+            self._lines = dct
+            filename = dct
+            meta = {}
+        elif not isinstance(dct, (str, bytes)):
+            # file handles of formats with records, otherwise JSON Lines
+            if reads_records(self.via):
+                self._records = dct
+            else:
+                self._lines = dct
+            meta = {}
+        else:
+            filename = dct if path.exists(dct) else None
+            parsed = None
+            if filename is not None and self.via is None:
+                # formats that are read one record at a time are found from
+                # the start of the file, or from the file extension
+                with open(filename, "rb") as file:
+                    self.via = sniff_records_format(
+                        file.read(SNIFF_LENGTH)
+                    ) or find_from_format_by_ext(path.splitext(filename)[1])
+            if filename is not None and not reads_records(self.via):
+                with open(filename, encoding="utf-8") as file:
                     dct = file.read()
-            self.via = kwargs.get("via", None) or find_from_format(string=dct)
-            meta = self.get_metadata_list(dct)
+            if self.via is None:
+                self.via, parsed = sniff_format(dct)
+            if filename is None:
+                source = dct
+            if reads_records(self.via):
+                self._records = dct
+                meta = {}
+            else:
+                meta = self.get_metadata_list(dct, parsed=parsed)
 
         self.id = meta.get("id", None)
         self.type = meta.get("type", None)
@@ -269,54 +332,435 @@ class MetadataList:
         self.email = kwargs.get("email", None)
         self.registrant = kwargs.get("registrant", None)
 
-        self.items = self.read_metadata_list(wrap(meta.get("items", None)), **kwargs)
-        self.errors = [i.errors for i in self.items if i.errors is not None]
-        self.write_errors = [
-            i.write_errors for i in self.items if i.write_errors is not None
-        ]
-        self.is_valid = all([i.is_valid for i in self.items])
+        if self._lines is None and self._records is None:
+            self.items = self.read_metadata_list(
+                wrap(meta.get("items", None)), **kwargs
+            )
 
         # other options
         self.jsonlines = kwargs.get("jsonlines", False)
         self.filename = kwargs.get("filename", None)
+        # ids of the invalid items left out of the last Crossref XML output
+        self.skipped = []
+        self._input_key = None
+        self._input_state = None
+        if _conversion_cache is not None and filename is not None:
+            self._input_key = file_input_key(filename, **kwargs)
+        elif _conversion_cache is not None and source is not None:
+            self._input_key = input_key(source, **kwargs)
+        if self._input_key is not None:
+            self._input_state = self._state_hash()
+
+    def _state_hash(self) -> str:
+        """Hash of the public attributes other than the items, via, which is
+        found when JSON Lines are read, and the items skipped when writing"""
+        state = {
+            k: v
+            for k, v in vars(self).items()
+            if not k.startswith("_") and k not in ("via", "skipped")
+        }
+        return hashlib.sha256(json.dumps(state, default=str)).hexdigest()
+
+    def _unchanged(self) -> bool:
+        """The list and the items read so far still match the input"""
+        return (
+            self.__dict__.get("_input_key", None) is not None
+            and self._state_hash() == self._input_state
+            and all(i._unchanged() for i in self._items or [])
+        )
+
+    @property
+    def items(self) -> list:
+        """All items. Items from JSON Lines input are read on first access."""
+        if self._items is None:
+            self._items = [*self.iter_items()]
+        return self._items
+
+    @items.setter
+    def items(self, value: list):
+        self._items = value
+        # other items no longer match the input
+        self._input_key = None
+
+    def iter_items(self):
+        """Yield items one at a time. Items from JSON Lines input are read
+        and converted as they are needed, and are not kept in memory.
+        An iterable of lines can only be read once. With raise_errors, an
+        item with errors raises ValueError before it is yielded, and an
+        item with write errors when the next item is requested."""
+        if not self.raise_errors:
+            yield from self._iter_items()
+            return
+        for item in self._iter_items():
+            if not item.is_valid:
+                raise ValueError(f"{item.id}: {item.errors or item.state}")
+            yield item
+            if item.write_errors is not None:
+                raise ValueError(f"{item.id}: {item.write_errors}")
+
+    def _iter_items(self):
+        if self._items is not None:
+            yield from self._items
+        elif isinstance(self._lines, str):
+            with open(self._lines, encoding="utf-8") as file:
+                yield from self.read_metadata_lines(file)
+        elif self._lines is not None:
+            yield from self.read_metadata_lines(self._lines)
+        elif self._records is not None:
+            yield from self.read_metadata_records(self._records)
 
-    def get_metadata_list(self, string) -> list:
+    def read_metadata_lines(self, lines: Iterable):
+        """Read JSON Lines, finding the format from the first line if via
+        is not given"""
+        data = parse_lines(lines)
+        first = next(data, None)
+        if first is None:
+            return
+        if self.via is None:
+            self.via = find_from_format_by_json(first) or "commonmeta"
+        kwargs = self._kwargs | {"via": self.via}
+        if (self.workers or 1) > 1:
+            yield from self.read_metadata_parallel(chain([first], data), **kwargs)
+        else:
+            for item in chain([first], data):
+                yield read_metadata_item(item, self.raise_errors, **kwargs)
+
+    def read_metadata_records(self, source):
+        """Read the records of a string, file name or file handle one at a
+        time, with the iter_list function of the format"""
+        records = get_format(self.via).load("iter_list")(source)
+        kwargs = self._kwargs | {"via": self.via}
+        if (self.workers or 1) > 1:
+            yield from self.read_metadata_parallel(records, **kwargs)
+        else:
+            for record in records:
+                yield read_metadata_item(record, self.raise_errors, **kwargs)
+
+    def read_metadata_parallel(self, data: Iterable, **kwargs):
+        """Read items in a pool of worker processes, chunk_size items per
+        task, and yield them in order. Items that can't be read are kept
+        with state not_found and their errors, unless raise_errors is set."""
+        data = iter(data)
+        kwargs["raise_errors"] = self.raise_errors
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                # read at most two chunks per worker ahead
+                batch = [*islice(data, self.workers * self.chunk_size * 2)]
+                if not batch:
+                    return
+                chunks = [
+                    batch[i : i + self.chunk_size]
+                    for i in range(0, len(batch), self.chunk_size)
+                ]
+                for states in executor.map(read_metadata_chunk, chunks, repeat(kwargs)):
+                    for state in states:
+                        yield metadata_from_state(state)
+
+    @property
+    def errors(self) -> list:
+        """Errors of all items, validating items that were read lazily"""
+        return [i.errors for i in self.items if i.errors is not None]
+
+    @property
+    def write_errors(self) -> list:
+        """Write errors of all items"""
+        return [i.write_errors for i in self.items if i.write_errors is not None]
+
+    @property
+    def is_valid(self) -> bool:
+        """All items are valid"""
+        return all([i.is_valid for i in self.items])
+
+    def get_metadata_list(self, string, parsed=None) -> list:
         if string is None or not isinstance(string, (str, bytes)):
             raise ValueError("No input found")
-        if self.via in [
-            "commonmeta",
-            "crossref",
-            "datacite",
-            "schema_org",
-            "csl",
-            "json_feed_item",
-        ]:
-            return json.loads(string)
-        else:
+        fmt = get_format(self.via)
+        if fmt is None or fmt.parse_list is None:
             raise ValueError("No input format found")
+        return parsed if parsed is not None else fmt.load("parse_list")(string)
 
     def read_metadata_list(self, data: list, **kwargs) -> list:
-        """read_metadata_list"""
+        """read_metadata_list. Items that can't be read are kept with state
+        not_found and their errors, with or without workers, unless
+        raise_errors is set."""
         kwargs["via"] = kwargs.get("via", None) or self.via
-        return [Metadata(i, **kwargs) for i in data]
+        if (self.workers or 1) > 1:
+            return [*self.read_metadata_parallel(data, **kwargs)]
+        return [read_metadata_item(i, self.raise_errors, **kwargs) for i in data]
 
-    def write(self, to: str = "commonmeta", **kwargs) -> str:
-        """convert metadata list into different formats"""
-        if to == "commonmeta":
-            return write_commonmeta_list(self)
-        elif to == "bibtex":
-            return write_bibtex_list(self)
-        elif to == "csl":
-            return write_csl_list(self)
-        elif to == "citation":
-            return write_citation_list(self, **kwargs)
-        elif to == "ris":
-            return write_ris_list(self)
-        elif to == "schema_org":
-            raise ValueError("Schema.org not supported for metadata lists")
-        elif to == "datacite":
-            raise ValueError("Datacite not supported for metadata lists")
-        elif to == "crossref_xml":
-            return write_crossref_xml_list(self)
-        else:
+    def write(self, to: str = "commonmeta", file=None, **kwargs) -> Optional[str]:
+        """convert metadata list into different formats. If file is given,
+        write to that file-like object one item at a time and return None."""
+        if file is not None:
+            write_chunks(self.stream(to=to, **kwargs), file)
+            return None
+        # lists written to a file are not cached
+        key = None
+        fmt = get_format(to)
+        if (
+            _conversion_cache is not None
+            and not self.filename
+            and fmt is not None
+            and self._unchanged()
+        ):
+            key = conversion_key(
+                self._input_key, "list", to, write_options(fmt, **kwargs)
+            )
+            output = _conversion_cache.get(key, None)
+            if output is not None:
+                return output
+        output = self._write_list(to, "write_list", **kwargs)
+        if key is not None and output is not None and self.is_valid:
+            _conversion_cache.set(key, output)
+        return output
+
+    def stream(self, to: str = "commonmeta", **kwargs):
+        """convert metadata list into different formats, yielding the
+        output in chunks of one or a few items"""
+        return self._write_list(to, "stream_list", **kwargs)
+
+    def _write_list(self, to: str, function: str, **kwargs):
+        """Call the list writer or streamer of a format, passing the options
+        only to formats that use them"""
+        fmt = get_format(to)
+        if fmt is None or fmt.write is None:
             raise ValueError("No output format found")
+        writer = fmt.load(function)
+        if writer is None:
+            raise ValueError("Format not supported for metadata lists")
+        if fmt.list_options:
+            return writer(self, **kwargs)
+        return writer(self)
+
+
+def reads_records(via: Optional[str]) -> bool:
+    """Whether MetadataList reads the format one record at a time"""
+    fmt = get_format(via)
+    return fmt is not None and fmt.iter_list is not None
+
+
+def parse_lines(lines: Iterable):
+    """Parse JSON Lines, skipping empty lines"""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Invalid JSON in line {number}") from error
+
+
+def read_metadata_chunk(data: list, kwargs: dict) -> list:
+    """Read a chunk of items in a worker process, and return the attributes
+    of each Metadata as a plain dict. Items that can't be read are returned
+    with state not_found and their errors. Written outputs are left out, as
+    they are only a cache and would be sent back to the parent process."""
+    return [
+        vars(read_metadata_item(item, **kwargs)) | {"_written": {}} for item in data
+    ]
+
+
+def read_metadata_item(item, raise_errors: bool = False, **kwargs) -> Metadata:
+    """Read an item. Items that can't be read are returned with state
+    not_found and their errors, or raise with raise_errors."""
+    try:
+        return Metadata(item, **kwargs)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        if raise_errors:
+            raise
+        _id = item.get("id", None) if isinstance(item, dict) else item
+        return Metadata(
+            {
+                "id": _id if isinstance(_id, str) else None,
+                "state": "not_found",
+                "via": "commonmeta",
+                "errors": [str(error)],
+            },
+            **kwargs,
+        )
+
+
+def configure_conversion_cache(
+    filename: Optional[str] = None,
+    maxsize: int = CONVERSION_CACHE_MAXSIZE,
+    ttl: Optional[float] = None,
+    enabled: bool = True,
+) -> None:
+    """Cache the outputs of Metadata.write and MetadataList.write, keyed by
+    a hash of the input, the options, the output format and options, and the
+    library version. filename is a SQLite database that keeps outputs between
+    runs, ttl is in seconds. Inputs fetched from an id are not cached."""
+    global _conversion_cache
+    if _conversion_cache is not None:
+        _conversion_cache.close()
+    _conversion_cache = (
+        ConversionCache(filename, maxsize=maxsize, ttl=ttl) if enabled else None
+    )
+
+
+def conversion_cache_info() -> Optional[dict]:
+    """Return hits, misses, hit rate and size of the conversion cache"""
+    if _conversion_cache is None:
+        return None
+    return _conversion_cache.cache_info()
+
+
+def normalize_input(source: Union[str, bytes]) -> bytes:
+    """Input without byte order mark, surrounding whitespace and CRLF line
+    endings, so that the same content read as text or bytes hashes the same"""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    return source.removeprefix(b"\xef\xbb\xbf").strip().replace(b"\r\n", b"\n")
+
+
+def input_key(source: Union[str, bytes, dict], **kwargs) -> str:
+    """Hash of the input and the options used to read it"""
+    if not isinstance(source, dict):
+        source = normalize_input(source)
+    options = {k: v for k, v in kwargs.items() if v is not None}
+    return content_hash(source, options)
+
+
+def file_input_key(filename: str, **kwargs) -> str:
+    """Hash of a file, read in chunks, and the options used to read it"""
+    options = {k: v for k, v in kwargs.items() if v is not None}
+    return content_hash("file", file_digest(filename), options)
+
+
+def conversion_key(key: str, kind: str, to: str, options: dict) -> str:
+    """Cache key for writing an input read as item or list"""
+    return content_hash(__version__, key, kind, to, options)
+
+
+def write_options(fmt, **kwargs) -> dict:
+    """Write options of a format, with their defaults"""
+    return {k: kwargs.get(k, default) for k, default in fmt.write_options.items()}
+
+
+def get_cached_output(
+    string: str,
+    to: str = "commonmeta",
+    write_kwargs: Optional[dict] = None,
+    is_list: bool = False,
+    **kwargs,
+):
+    """Return the cached output of Metadata(string, **kwargs).write(to,
+    **write_kwargs), or of MetadataList if is_list, without reading the input.
+    Returns None if the output is not cached."""
+    fmt = get_format(to)
+    if _conversion_cache is None or fmt is None:
+        return None
+    if not is_list and normalize_id(string) is not None:
+        return None
+    kwargs = {k: v for k, v in kwargs.items() if k not in ["workers", "chunk_size"]}
+    if is_list and path.exists(string):
+        key = file_input_key(string, **kwargs)
+    elif path.exists(string):
+        with open(string, "rb") as file:
+            key = input_key(file.read(), **kwargs)
+    else:
+        key = input_key(string, **kwargs)
+    key = conversion_key(
+        key,
+        "list" if is_list else "item",
+        to,
+        write_options(fmt, **(write_kwargs or {})),
+    )
+    return _conversion_cache.get(key, None)
+
+
+def metadata_from_state(state: dict) -> Metadata:
+    """Metadata from the attributes returned by read_metadata_chunk"""
+    metadata = Metadata.__new__(Metadata)
+    metadata.__dict__.update(state)
+    return metadata
+
+
+class AsyncMetadataList(MetadataList):
+    """MetadataList with items fetched concurrently from their ids"""
+
+    def __init__(self, items: Optional[list] = None, **kwargs):
+        self.workers = None
+        self.chunk_size = 100
+        self.raise_errors = kwargs.pop("raise_errors", False)
+        self._lines = None
+        self._records = None
+        self._kwargs = kwargs
+        self.via = kwargs.get("via", None)
+        self.id = kwargs.get("id", None)
+        self.type = kwargs.get("type", None)
+        self.title = kwargs.get("title", None)
+        self.description = kwargs.get("description", None)
+
+        # options needed for Crossref DOI registration
+        self.depositor = kwargs.get("depositor", None)
+        self.email = kwargs.get("email", None)
+        self.registrant = kwargs.get("registrant", None)
+
+        self.items = wrap(items)
+
+        # other options
+        self.jsonlines = kwargs.get("jsonlines", False)
+        self.filename = kwargs.get("filename", None)
+
+    @classmethod
+    async def from_ids(
+        cls, pids: list, concurrency: int = 10, client=None, **kwargs
+    ) -> "AsyncMetadataList":
+        """Fetch, detect and read metadata for a list of ids, with at most
+        concurrency requests in flight. Items that can't be fetched or read
+        are kept with state not_found and their errors."""
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1")
+        import asyncio
+        from .http_utils import create_async_client
+
+        via = kwargs.pop("via", None)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(pid, client):
+            async with semaphore:
+                try:
+                    return await get_metadata_async(pid, via=via, client=client)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    return {
+                        "id": pid,
+                        "state": "not_found",
+                        "via": "commonmeta",
+                        "errors": [str(error)],
+                    }
+
+        if client is None:
+            async with create_async_client() as client:
+                data = await asyncio.gather(*[fetch(pid, client) for pid in pids])
+        else:
+            data = await asyncio.gather(*[fetch(pid, client) for pid in pids])
+        items = [
+            read_metadata_item(i, **(kwargs | {"via": i.get("via")})) for i in data
+        ]
+        return cls(items, via=via, **kwargs)
+
+
+async def get_metadata_async(pid: str, via: Optional[str] = None, client=None) -> dict:
+    """Fetch metadata for an id with an async client, finding the format
+    from the id if via is not given"""
+    _id = normalize_id(pid)
+    if _id is None:
+        return {
+            "id": pid,
+            "state": "not_found",
+            "via": "commonmeta",
+            "errors": ["No valid id found"],
+        }
+    if via is None:
+        via = await find_from_format_by_id_async(_id, client=client)
+    fmt = get_format(via)
+    get_metadata = fmt.load("fetch_async") if fmt is not None else None
+    if get_metadata is None:
+        return {
+            "id": _id,
+            "state": "not_found",
+            "via": "commonmeta",
+            "errors": ["No input format found"],
+        }
+    return {"via": via} | await get_metadata(_id, client=client)
@@ -0,0 +1,245 @@
+"""BibTeX reader for commonmeta-py"""
+import re
+from typing import Optional
+
+from ..utils import compact, normalize_url, dict_to_spdx, get_language
+from ..base_utils import iter_lines, presence
+from ..author_utils import get_authors
+from ..date_utils import get_date_from_parts, MONTH_SHORT_NAMES
+from ..doi_utils import normalize_doi, doi_from_url
+from ..constants import BIB_TO_CM_TRANSLATIONS, Commonmeta
+
+# the start of an entry, e.g. @article{ or @article(
+BIBTEX_ENTRY_REGEX = re.compile(r"\A\s*@\s*(\w+)\s*([{(])")
+BIBTEX_AT_REGEX = re.compile(r"@\s*(\w+)\s*[{(]")
+BIBTEX_KEY_REGEX = re.compile(r"\s*([^\s,{}]*)")
+BIBTEX_NAME_REGEX = re.compile(r"([^\s=,{}\"#]+)\s*=\s*")
+BIBTEX_MACRO_REGEX = re.compile(r"[^\s,{}\"#]+")
+BIBTEX_SEPARATOR_REGEX = re.compile(r"[\s,]*")
+BIBTEX_CONCAT_REGEX = re.compile(r"\s*#\s*")
+# braces, quotes and parentheses, skipping escaped characters
+BIBTEX_DELIMITER_REGEX = re.compile(r"\\.|[{}\"()]")
+BIBTEX_CLOSING = {"{": "}", '"': '"', "(": ")"}
+
+
+def read_bibtex(data: Optional[str], **kwargs) -> Commonmeta:
+    """read_bibtex"""
+
+    meta = bibtex_meta(data=data)
+    read_options = kwargs or {}
+
+    if not meta:
+        return {"state": "not_found"}
+
+    _id = read_options.get("doi", None) or normalize_doi(meta.get("doi", None))
+    _type = BIB_TO_CM_TRANSLATIONS.get(meta.get("ENTRYTYPE", "").lower(), "Other")
+    container_type = "Journal" if _type == "JournalArticle" else None
+
+    authors = [
+        {"creatorName": author}
+        for author in re.split(r"\s+and\s+", meta.get("author", "").strip())
+        if author
+    ]
+    contributors = get_authors(authors)
+    date = {}
+    if meta.get("year", None) is not None:
+        date["published"] = get_date_from_parts(
+            meta.get("year"),
+            bibtex_month(meta.get("month", None)) or 0,
+            meta.get("day", None) or 0,
+        )
+    descriptions = None
+    if meta.get("abstract", None) is not None:
+        descriptions = [{"description": meta.get("abstract"), "type": "Abstract"}]
+    container_title = meta.get("journal", None) or meta.get("booktitle", None)
+    if container_title is not None:
+        pages = re.split(r"-+", meta.get("pages", ""), maxsplit=1)
+        container = compact(
+            {
+                "type": container_type,
+                "title": container_title,
+                "identifier": meta.get("issn", None),
+                "identifierType": "ISSN" if meta.get("issn", None) else None,
+                "volume": meta.get("volume", None),
+                "issue": meta.get("number", None),
+                "firstPage": presence(pages[0].strip()),
+                "lastPage": presence(pages[1].strip()) if len(pages) > 1 else None,
+            }
+        )
+    else:
+        container = None
+    if meta.get("publisher", None) is not None:
+        publisher = {"name": meta.get("publisher")}
+    else:
+        publisher = None
+    license_ = meta.get("copyright", None)
+    if license_ is not None and license_.startswith("http"):
+        license_ = dict_to_spdx({"url": license_})
+    else:
+        license_ = None
+    subjects = [
+        {"subject": subject.strip()}
+        for subject in re.split(r"[,;]", meta.get("keywords", ""))
+        if subject.strip()
+    ]
+    state = "findable" if meta.get("doi", None) or read_options else "not_found"
+
+    return {
+        "id": _id,
+        "type": _type,
+        "doi": doi_from_url(_id),
+        "url": normalize_url(meta.get("url", None)),
+        "titles": [{"title": meta.get("title", None)}],
+        "descriptions": descriptions,
+        "contributors": presence(contributors),
+        "publisher": publisher,
+        "container": container,
+        "date": date,
+        "license": license_,
+        "subjects": presence(subjects),
+        "language": get_language(meta.get("language", None)),
+        "state": state,
+    } | read_options
+
+
+def bibtex_meta(data: Optional[str]) -> dict:
+    """Fields of the first entry, with @string macros expanded and LaTeX
+    converted to unicode. Entries are parsed directly, as the grammar of
+    bibtexparser is slow to build and to run for single entries."""
+    if data is None:
+        return {}
+    from bibtexparser.latexenc import latex_to_unicode
+
+    strings = {}
+    pos = 0
+    while True:
+        match = BIBTEX_AT_REGEX.search(data, pos)
+        if match is None:
+            return {}
+        entry_type = match.group(1).lower()
+        if entry_type in ["comment", "preamble"]:
+            _, pos = bibtex_value(data, match.end() - 1, strings)
+        elif entry_type == "string":
+            fields, pos = bibtex_fields(data, match.end(), strings)
+            strings.update(fields)
+        else:
+            key = BIBTEX_KEY_REGEX.match(data, match.end())
+            fields, _ = bibtex_fields(data, key.end(), strings)
+            return {
+                name: latex_to_unicode(" ".join(value.split()))
+                for name, value in fields.items()
+            } | {"ENTRYTYPE": entry_type, "ID": key.group(1)}
+
+
+def bibtex_fields(data: str, pos: int, strings: dict) -> tuple:
+    """Fields of an entry from pos to its closing brace or parenthesis, and
+    the position after the entry"""
+    fields = {}
+    while True:
+        pos = BIBTEX_SEPARATOR_REGEX.match(data, pos).end()
+        if pos >= len(data) or data[pos] in "})":
+            return fields, pos + 1
+        match = BIBTEX_NAME_REGEX.match(data, pos)
+        if match is None:
+            return fields, len(data)
+        value, pos = bibtex_value(data, match.end(), strings)
+        parts = [value]
+        # values concatenated with #
+        while (concat := BIBTEX_CONCAT_REGEX.match(data, pos)) is not None:
+            value, pos = bibtex_value(data, concat.end(), strings)
+            parts.append(value)
+        fields[match.group(1).lower()] = "".join(parts)
+
+
+def bibtex_value(data: str, pos: int, strings: dict) -> tuple:
+    """A value in braces, quotes or parentheses (for @comment and @preamble),
+    a number or a @string macro, and the position after it"""
+    start = data[pos : pos + 1]
+    if start in BIBTEX_CLOSING:
+        depth = 0
+        for match in BIBTEX_DELIMITER_REGEX.finditer(data, pos + 1):
+            char = match.group(0)
+            if char == "{":
+                depth += 1
+            elif char == "}" and depth > 0:
+                depth -= 1
+            elif depth == 0 and char == BIBTEX_CLOSING[start]:
+                return data[pos + 1 : match.start()], match.end()
+        return data[pos + 1 :], len(data)
+    match = BIBTEX_MACRO_REGEX.match(data, pos)
+    if match is None:
+        return "", pos
+    name = match.group(0)
+    # undefined macros, e.g. month names, are kept as they are
+    return strings.get(name.lower(), name), match.end()
+
+
+def bibtex_month(month: Optional[str]) -> Optional[str]:
+    """Month number from a number or an English month name"""
+    if month is None or month.isdigit():
+        return month
+    name = month[:3].lower()
+    if name not in MONTH_SHORT_NAMES:
+        return None
+    return str(MONTH_SHORT_NAMES.index(name) + 1)
+
+
+def bibtex_entry_ends(line: str, pos: int, closing: str, state: list) -> bool:
+    """Whether the entry closed by closing ends in line after pos. state is
+    the brace depth in the entry and in the current quoted value, or None
+    outside quoted values, and is updated for the next line."""
+    depth, quoted = state
+    for match in BIBTEX_DELIMITER_REGEX.finditer(line, pos):
+        char = match.group(0)
+        if quoted is not None:
+            if char == "{":
+                quoted += 1
+            elif char == "}" and quoted > 0:
+                quoted -= 1
+            elif char == '"' and quoted == 0:
+                quoted = None
+        elif char == "{":
+            depth += 1
+        elif depth > 0:
+            if char == "}":
+                depth -= 1
+        elif char == closing:
+            return True
+        elif char == '"':
+            quoted = 0
+    state[:] = [depth, quoted]
+    return False
+
+
+def iter_bibtex_records(source):
+    """Split BibTeX with several entries, given as string, file name or file
+    handle, into the strings of single entries. The input is read one line at
+    a time, counting braces to find the end of an entry in braces or
+    parentheses. As in bibtex_value, a quote only ends a quoted value outside
+    braces, and unmatched closing braces in quoted values are ignored.
+    @string definitions are added in front of the entries after them,
+    @comment and @preamble are skipped."""
+    strings = []
+    entry = []
+    entry_type = None
+    for line in iter_lines(source):
+        pos = 0
+        if not entry:
+            match = BIBTEX_ENTRY_REGEX.match(line)
+            if match is None:
+                continue
+            entry_type = match.group(1).lower()
+            closing = BIBTEX_CLOSING[match.group(2)]
+            state = [0, None]
+            pos = match.end()
+        entry.append(line)
+        if not bibtex_entry_ends(line, pos, closing, state):
+            continue
+        record = "".join(entry)
+        entry = []
+        if entry_type == "string":
+            strings.append(record)
+        elif entry_type not in ["comment", "preamble"]:
+            yield "".join(strings) + record
+    if entry and entry_type not in ["string", "comment", "preamble"]:
+        yield "".join(strings) + "".join(entry)
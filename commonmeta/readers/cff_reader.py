@@ -1,9 +1,9 @@
 """cff reader for commonmeta-py"""
 from typing import Optional
 from urllib.parse import urlparse
-import httpx
 import yaml
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     normalize_id,
     name_to_fos,
@@ -20,16 +20,24 @@ from ..constants import Commonmeta
 def get_cff(pid: str, **kwargs) -> dict:
     """get_cff"""
     url = github_as_cff_url(pid)
-    response = httpx.get(url, timeout=10, **kwargs)
+    return cff_response(http_get(url, **kwargs), url)
+
+
+async def get_cff_async(pid: str, client=None, **kwargs) -> dict:
+    """get_cff with an async client"""
+    url = github_as_cff_url(pid)
+    return cff_response(await async_http_get(url, client=client, **kwargs), url)
+
+
+def cff_response(response, url: str) -> dict:
+    """CFF from the response for a CITATION.cff file"""
     if response.status_code != 200:
         return {"state": "not_found"}
-    text = response.text
-    repo_url = github_as_repo_url(url)
-    data = yaml.safe_load(text)
+    data = yaml.safe_load(response.text)
 
     # collect metadata not included in the CFF file
     if data.get("repository-code", None) is None:
-        data["repository-code"] = repo_url
+        data["repository-code"] = github_as_repo_url(url)
 
     return data
 
@@ -1,8 +1,8 @@
 """codemeta reader for commonmeta-py"""
 from typing import Optional
 from collections import defaultdict
-import httpx
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     normalize_id,
     from_schema_org_creators,
@@ -23,7 +23,17 @@ from ..constants import (
 def get_codemeta(pid: str, **kwargs) -> dict:
     """get_codemeta"""
     url = str(github_as_codemeta_url(pid))
-    response = httpx.get(url, timeout=10, **kwargs)
+    return codemeta_response(http_get(url, **kwargs), url)
+
+
+async def get_codemeta_async(pid: str, client=None, **kwargs) -> dict:
+    """get_codemeta with an async client"""
+    url = str(github_as_codemeta_url(pid))
+    return codemeta_response(await async_http_get(url, client=client, **kwargs), url)
+
+
+def codemeta_response(response, url: str) -> dict:
+    """Codemeta from the response for a codemeta.json file"""
     if response.status_code != 200:
         return {"state": "not_found"}
     data = response.json()
@@ -4,6 +4,7 @@ from typing import Optional
 import httpx
 from pydash import py_
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     dict_to_spdx,
     normalize_cc_url,
@@ -12,7 +13,14 @@ from ..utils import (
     normalize_issn,
     issn_as_url,
 )
-from ..base_utils import wrap, compact, presence, sanitize, parse_attributes
+from ..base_utils import (
+    wrap,
+    compact,
+    presence,
+    sanitize,
+    parse_attributes,
+    compile_path,
+)
 from ..author_utils import get_authors
 from ..date_utils import get_date_from_date_parts
 from ..doi_utils import (
@@ -29,11 +37,20 @@ from ..constants import (
     Commonmeta,
 )
 
+# paths in Crossref REST API responses
+CREATED_DATE_TIME = compile_path("created.date-time")
+INSTITUTION_NAME = compile_path("institution.0.name")
+ISSUED_DATE_TIME = compile_path("issued.date-time")
+JOURNAL_ISSUE_ISSUE = compile_path("journal-issue.issue")
+MESSAGE_ITEMS = compile_path("message.items")
+RELATION_IS_PART_OF = compile_path("relation.is-part-of")
+RESOURCE_PRIMARY_URL = compile_path("resource.primary.URL")
+
 
 def get_crossref_list(query: dict, **kwargs) -> list[dict]:
     """get_crossref list from Crossref API."""
     url = crossref_api_query_url(query, **kwargs)
-    response = httpx.get(url, timeout=30, **kwargs)
+    response = http_get(url, timeout=30, **kwargs)
     if response.status_code != 200:
         return []
     return response.json().get("message", {}).get("items", [])
@@ -45,7 +62,20 @@ def get_crossref(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = crossref_api_url(doi)
-    response = httpx.get(url, timeout=10, **kwargs)
+    return crossref_response(http_get(url, **kwargs))
+
+
+async def get_crossref_async(pid: str, client=None, **kwargs) -> dict:
+    """get_crossref with an async client"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = crossref_api_url(doi)
+    return crossref_response(await async_http_get(url, client=client, **kwargs))
+
+
+def crossref_response(response) -> dict:
+    """Crossref message from the response of the Crossref REST API"""
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json().get("message", {}) | {"via": "crossref"}
@@ -80,16 +110,16 @@ def read_crossref(data: Optional[dict], **kwargs) -> Commonmeta:
     if editors:
         contributors += get_authors(editors)
 
-    url = normalize_url(py_.get(meta, "resource.primary.URL"))
+    url = normalize_url(RESOURCE_PRIMARY_URL(meta))
     titles = get_titles(meta)
     publisher = compact({"name": meta.get("publisher", None)})
-    if _type == "Article" and py_.get(publisher, "name") == "Front Matter":
+    if _type == "Article" and publisher.get("name", None) == "Front Matter":
         _type = "BlogPost"
     date = compact(
         {
-            "published": py_.get(meta, "issued.date-time")
+            "published": ISSUED_DATE_TIME(meta)
             or get_date_from_date_parts(meta.get("issued", None))
-            or py_.get(meta, "created.date-time")
+            or CREATED_DATE_TIME(meta)
         }
     )
     identifiers = []
@@ -300,7 +330,7 @@ def get_issn(meta: dict) -> Optional[str]:
         or next(
             (
                 item
-                for item in py_.get(meta, "relation.is-part-of", [])
+                for item in RELATION_IS_PART_OF(meta, [])
                 if item["id-type"] == "issn"
             ),
             None,
@@ -340,9 +370,9 @@ def get_container(meta: dict, issn: str) -> dict:
     isbn = isbn["value"] if isbn else None
     container_title = parse_attributes(meta.get("container-title", None), first=True)
     if not container_title and container_type in ["Periodical"]:
-        container_title = py_.get(meta, "institution.0.name")
+        container_title = INSTITUTION_NAME(meta)
     volume = meta.get("volume", None)
-    issue = py_.get(meta, "journal-issue.issue")
+    issue = JOURNAL_ISSUE_ISSUE(meta)
     if meta.get("page", None):
         pages = meta.get("page", None).split("-")
         first_page = pages[0]
@@ -401,11 +431,11 @@ def get_random_crossref_id(number: int = 1, **kwargs) -> list:
     number = 20 if number > 20 else number
     url = crossref_api_sample_url(number, **kwargs)
     try:
-        response = httpx.get(url, timeout=10)
+        response = http_get(url)
         if response.status_code != 200:
             return []
 
-        items = py_.get(response.json(), "message.items")
+        items = MESSAGE_ITEMS(response.json())
         return [i.get("DOI") for i in items]
     except (httpx.ReadTimeout, httpx.ConnectError):
         return []
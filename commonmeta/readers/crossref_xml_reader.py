@@ -1,10 +1,12 @@
 """crossref_xml reader for commonmeta-py"""
 
-from typing import Optional
+from functools import lru_cache
+from os import path
+from typing import Optional, Union
 from collections import defaultdict
-import httpx
-from pydash import py_
+from lxml import etree
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     doi_from_url,
     dict_to_spdx,
@@ -15,11 +17,12 @@ from ..utils import (
 )
 from ..base_utils import (
     compact,
-    wrap,
     presence,
     sanitize,
     parse_attributes,
-    parse_xml,
+    iterparse_xml,
+    clear_xml_element,
+    XML_PARSER_OPTIONS,
 )
 from ..author_utils import get_authors
 from ..date_utils import get_date_from_crossref_parts, get_iso8601_date
@@ -31,6 +34,117 @@ from ..constants import (
     CR_TO_CM_CONTAINER_TRANSLATIONS,
 )
 
+# root elements of the dicts that parse_crossref_xml returned before 0.97
+LEGACY_ROOTS = {"crossref_result", "query", "doi_record"}
+# elements that are always lists when converted to dicts, as in parse_xml
+FORCE_LIST = {
+    "person_name",
+    "organization",
+    "titles",
+    "item",
+    "citation",
+    "program",
+    "related_item",
+}
+
+
+@lru_cache(maxsize=None)
+def xpath(expression: str) -> etree.XPath:
+    """Compile a path of element names, e.g. "titles[1]/title" or
+    "journal_metadata/@language", into an XPath that ignores namespaces"""
+    steps = []
+    for step in expression.split("/"):
+        if step.startswith("@"):
+            steps.append(step)
+        else:
+            name, bracket, predicate = step.partition("[")
+            steps.append(f"*[local-name()='{name}']{bracket}{predicate}")
+    return etree.XPath("/".join(steps))
+
+
+STRING = etree.XPath("string()")
+CRM_ITEMS = xpath("crm-item")
+# element that identifies the resource type, the element with the bibliographic
+# metadata, and the element with the language
+BIBMETA = [
+    (
+        "journal/journal_article",
+        "journal-article",
+        "journal/journal_article",
+        "journal/journal_metadata",
+    ),
+    (
+        "journal/journal_issue",
+        "journal-issue",
+        "journal/journal_issue",
+        "journal/journal_metadata",
+    ),
+    ("journal", "journal", "journal", "journal/journal_metadata"),
+    ("posted_content", "posted-content", "posted_content", "posted_content"),
+    ("book/content_item", "book-chapter", "book/content_item", "book/book_metadata"),
+    (
+        "book/book_series_metadata",
+        "book-series",
+        "book/book_series_metadata",
+        "book/book_series_metadata",
+    ),
+    (
+        "book/book_set_metadata",
+        "book-set",
+        "book/book_set_metadata",
+        "book/book_set_metadata",
+    ),
+    ("book/book_metadata", "book", "book/book_metadata", "book/book_metadata"),
+    (
+        "conference",
+        "proceedings-article",
+        "conference/conference_paper",
+        "conference/conference_paper",
+    ),
+    ("sa_component", "component", "sa_component/component_list/component", None),
+    ("database", "dataset", "database/dataset", "database/database_metadata"),
+    (
+        "report_paper",
+        "report",
+        "report_paper/report_paper_metadata",
+        "report_paper/report_paper_metadata",
+    ),
+    ("peer_review", "peer-review", "peer_review", "peer_review"),
+    ("dissertation", "dissertation", "dissertation", "dissertation"),
+]
+LICENSE_REFS = [
+    xpath("program[1]/license_ref"),
+    xpath("crossmark/custom_metadata/program[1]/license_ref"),
+    xpath("crossmark/custom_metadata/program[2]/license_ref"),
+]
+
+
+def parse_crossref_xml(string: Optional[Union[str, bytes]]):
+    """Parse crossref_xml string, or the name of a file, into an lxml element"""
+    if string is None:
+        return None
+    # parsers are not shared, as they can't be used by several threads at once
+    if isinstance(string, str) and path.exists(string):
+        return etree.parse(string, etree.XMLParser(**XML_PARSER_OPTIONS)).getroot()
+    if isinstance(string, str):
+        # ignore the encoding in the XML declaration of decoded strings
+        parser = etree.XMLParser(encoding="utf-8", **XML_PARSER_OPTIONS)
+        return etree.fromstring(string.encode("utf-8"), parser)
+    return etree.fromstring(string, etree.XMLParser(**XML_PARSER_OPTIONS))
+
+
+def iter_crossref_xml_records(source: Union[str, bytes]):
+    """Split a crossref_result with several queries, or doi_records, into the
+    XML strings of single records. The file is read with iterparse and each
+    record is freed once it has been serialized."""
+    for element in iterparse_xml(source, tag="{*}doi_record"):
+        # the query around a doi_record has the crm-items, e.g. publisher name
+        parent = element.getparent()
+        if parent is not None and etree.QName(parent).localname == "query":
+            element = parent
+        yield etree.tostring(element, encoding="unicode", with_tail=False)
+        clear_xml_element(element)
+
 
 def get_crossref_xml(pid: str, **kwargs) -> dict:
     """Get crossref_xml metadata from a DOI"""
@@ -38,174 +152,193 @@ def get_crossref_xml(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = crossref_xml_api_url(doi)
-    response = httpx.get(
-        url, headers={"Accept": "text/xml;charset=utf-8"}, timeout=10, **kwargs
+    return crossref_xml_response(
+        http_get(url, headers={"Accept": "text/xml;charset=utf-8"}, **kwargs)
     )
+
+
+async def get_crossref_xml_async(pid: str, client=None, **kwargs) -> dict:
+    """Get crossref_xml metadata from a DOI with an async client"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = crossref_xml_api_url(doi)
+    response = await async_http_get(
+        url,
+        client=client,
+        headers={"Accept": "text/xml;charset=utf-8"},
+        **kwargs,
+    )
+    return crossref_xml_response(response)
+
+
+def crossref_xml_response(response) -> dict:
+    """Crossref XML from the response of the Crossref API"""
     if response.status_code != 200:
         return {"state": "not_found"}
 
-    return parse_xml(response.text, dialect="crossref") | {"via": "crossref_xml"}
+    return {"xml": response.text, "via": "crossref_xml"}
 
 
-def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
-    """read_crossref_xml"""
+def get_text(element, *expressions: str) -> Optional[str]:
+    """Text of the first element found with one of the paths, or None"""
+    if element is None:
+        return None
+    for expression in expressions:
+        found = xpath(expression)(element)
+        if found:
+            if isinstance(found[0], str):
+                text = found[0].strip()
+            else:
+                text = element_text(found[0])
+            if text:
+                return text
+    return None
+
+
+def element_text(element) -> Optional[str]:
+    """Text content of an element, including the text of child elements"""
+    text = element.text if len(element) == 0 else STRING(element)
+    return (text.strip() or None) if text else None
+
+
+def get_element(element, expression: str):
+    """First element found with the path, or None"""
+    if element is None:
+        return None
+    found = xpath(expression)(element)
+    return found[0] if found else None
+
+
+def element_to_dict(element) -> Union[dict, str, None]:
+    """Convert an element into a dict in the format of parse_xml, for
+    functions shared with other readers"""
+    result: dict = {etree.QName(k).localname: v for k, v in element.attrib.items()}
+    text = [element.text or ""]
+    for child in element:
+        if not isinstance(child.tag, str):
+            continue
+        key = etree.QName(child).localname
+        value = element_to_dict(child)
+        if key in result:
+            if not isinstance(result[key], list) or key not in FORCE_LIST:
+                result[key] = [result[key]]
+            result[key].append(value)
+        else:
+            result[key] = [value] if key in FORCE_LIST else value
+        text.append(child.tail or "")
+    text = "".join(text).strip()
+    if not result:
+        return text or None
+    if text:
+        result["#text"] = text
+    return result
+
+
+def read_crossref_xml(data, **kwargs) -> Commonmeta:
+    """read_crossref_xml, from a parsed crossref_result, query or doi_record,
+    or the result of get_crossref_xml"""
+    if isinstance(data, dict):
+        if "xml" not in data and LEGACY_ROOTS.intersection(data):
+            raise TypeError(
+                "read_crossref_xml no longer reads the dict from xmltodict, "
+                "pass the XML string or the element from parse_crossref_xml"
+            )
+        data = parse_crossref_xml(data.get("xml", None))
     if data is None:
         return {"state": "not_found"}
-    meta = py_.get(
-        data, "crossref_result.query_result.body.query.doi_record.crossref", {}
-    )
+    root = etree.QName(data).localname
+    if root == "crossref_result":
+        query = get_element(data, "query_result/body/query")
+    elif root == "query":
+        query = data
+    else:
+        query = None
+    if query is not None:
+        meta = get_element(query, "doi_record/crossref")
+    elif root == "doi_record":
+        meta = get_element(data, "crossref")
+    else:
+        meta = None
 
     # query contains information from outside metadata schema, e.g. publisher name
-    query = py_.get(data, "crossref_result.query_result.body.query", {})
+    crm_items = (
+        {
+            i.get("name", None): STRING(i).strip() or None
+            for i in reversed(CRM_ITEMS(query))
+        }
+        if query is not None
+        else {}
+    )
 
     # read_options = ActiveSupport::HashWithIndifferentAccess.
     # new(options.except(:doi, :id, :url,
     # :sandbox, :validate, :ra))
     read_options = kwargs or {}
 
-    member_id = next(
-        (
-            i
-            for i in wrap(query.get("crm-item", None))
-            if i.get("name", None) == "member-id"
-        ),
-        {},
-    ).get("#text", None)
+    member_id = crm_items.get("member-id", None)
     publisher_id = (
         "https://api.crossref.org/members/" + member_id if member_id else None
     )
     publisher = compact(
         {
             "id": publisher_id,
-            "name": next(
-                (
-                    i
-                    for i in wrap(query.get("crm-item", None))
-                    if i.get("name", None) == "publisher-name"
-                ),
-                {},
-            ).get("#text", None),
+            "name": crm_items.get("publisher-name", None),
         }
     )
 
     # fetch metadata depending of Crossref type
-    if py_.get(meta, "journal.journal_article", None):
-        bibmeta = py_.get(meta, "journal.journal_article", {})
-        resource_type = "journal-article"
-        language = py_.get(meta, "journal.journal_metadata.language")
-    elif py_.get(meta, "journal.journal_issue", None):
-        bibmeta = py_.get(meta, "journal.journal_issue", {})
-        resource_type = "journal-issue"
-        language = py_.get(meta, "journal.journal_metadata.language")
-    elif py_.get(meta, "journal", None):
-        bibmeta = py_.get(meta, "journal", {})
-        resource_type = "journal"
-        language = py_.get(meta, "journal.journal_metadata.language")
-    elif py_.get(meta, "posted_content", None):
-        bibmeta = meta.get("posted_content", {})
-        if publisher.get("name", None) is None:
-            publisher = {"name": py_.get(bibmeta, "institution.institution_name", None)}
-        resource_type = "posted-content"
-        language = py_.get(meta, "posted_content.language")
-    elif py_.get(meta, "book.content_item"):
-        bibmeta = py_.get(meta, "book.content_item")
-        resource_type = "book-chapter"
-        language = py_.get(meta, "book.book_metadata.language")
-    elif py_.get(meta, "book.book_series_metadata"):
-        bibmeta = py_.get(meta, "book.book_series_metadata")
-        resource_type = "book-series"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "book.book_set_metadata"):
-        bibmeta = py_.get(meta, "book.book_set_metadata")
-        resource_type = "book-set"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "book.book_metadata"):
-        bibmeta = py_.get(meta, "book.book_metadata")
-        resource_type = "book"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "conference", None):
-        bibmeta = py_.get(meta, "conference.conference_paper", {})
-        resource_type = "proceedings-article"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "sa_component", None):
-        bibmeta = py_.get(meta, "sa_component.component_list.component", {})
-        resource_type = "component"
-        language = None
-    elif py_.get(meta, "database", None):
-        bibmeta = py_.get(meta, "database.dataset", {})
-        resource_type = "dataset"
-        language = py_.get(meta, "database.database_metadata.language")
-    elif py_.get(meta, "report_paper", None):
-        bibmeta = py_.get(meta, "report_paper.report_paper_metadata", {})
-        resource_type = "report"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "peer_review", None):
-        bibmeta = py_.get(meta, "peer_review", {})
-        resource_type = "peer-review"
-        language = bibmeta.get("language", None)
-    elif py_.get(meta, "dissertation", None):
-        bibmeta = py_.get(meta, "dissertation", {})
-        resource_type = "dissertation"
-        language = bibmeta.get("language", None)
-    else:
-        bibmeta = {}
-        resource_type = ""
-        language = None
+    bibmeta = None
+    resource_type = ""
+    language = None
+    if meta is not None:
+        for expression, resource, bibmeta_path, language_path in BIBMETA:
+            if get_element(meta, expression) is not None:
+                bibmeta = get_element(meta, bibmeta_path)
+                resource_type = resource
+                if language_path is not None:
+                    language = get_text(meta, language_path + "/@language")
+                break
+    if resource_type == "posted-content" and publisher.get("name", None) is None:
+        publisher = {"name": get_text(bibmeta, "institution/institution_name")}
 
     _id = normalize_doi(
         kwargs.get("doi", None)
         or kwargs.get("id", None)
-        or py_.get(bibmeta, "doi_data.doi")
+        or get_text(bibmeta, "doi_data/doi")
     )
     _type = CR_TO_CM_TRANSLATIONS.get(resource_type, "Other")
-    if _type == "Article" and py_.get(publisher, "name") == "Front Matter":
+    if _type == "Article" and publisher.get("name", None) == "Front Matter":
         _type = "BlogPost"
 
-    url = parse_attributes(py_.get(bibmeta, "doi_data.resource"))
+    url = parse_attributes(get_text(bibmeta, "doi_data/resource"))
     url = normalize_url(url)
     titles = crossref_titles(bibmeta)
     contributors = crossref_people(bibmeta)
 
     date: dict = defaultdict(list)
-    date["created"] = next(
-        (
-            i
-            for i in wrap(query.get("crm-item", None))
-            if i.get("name", None) == "created"
-        ),
-        {},
-    ).get("#text", None)
+    date["created"] = crm_items.get("created", None)
     date["published"] = (
-        get_date_from_crossref_parts(bibmeta.get("publication_date", {}))
-        or get_date_from_crossref_parts(bibmeta.get("review_date", {}))
+        crossref_date(get_element(bibmeta, "publication_date"))
+        or crossref_date(get_element(bibmeta, "review_date"))
         or date["created"]
     )
-    date["updated"] = next(
-        (
-            i
-            for i in wrap(query.get("crm-item", None))
-            if i.get("name", None) == "last-update"
-        ),
-        {},
-    ).get("#text", None)
+    date["updated"] = crm_items.get("last-update", None)
 
     # TODO: fix timestamp. Until then, remove time as this is not always stable with Crossref (different server timezones)
     date = {k: get_iso8601_date(v) for k, v in date.items()}
 
     descriptions = crossref_description(bibmeta)
-    funding = (
-        py_.get(bibmeta, "program.0")
-        or py_.get(bibmeta, "program.0.assertion")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.0.assertion")
+    funding_references = crossref_funding(
+        xpath("program")(bibmeta) if bibmeta is not None else []
     )
-    funding_references = crossref_funding(wrap(funding))
 
     license_ = (
-        py_.get(bibmeta, "program.0.license_ref")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.0.license_ref")
-        or py_.get(bibmeta, "crossmark.custom_metadata.program.1.license_ref")
+        next((refs for refs in (i(bibmeta) for i in LICENSE_REFS) if refs), [])
+        if bibmeta is not None
+        else []
     )
-    license_ = crossref_license(wrap(license_))
+    license_ = crossref_license(license_)
 
     # By using book_metadata, we can account for where resource_type is `BookChapter` and not assume its a whole book
     # if book_metadata:
@@ -236,18 +369,17 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
     # else:
     #     container = None
     container = crossref_container(meta, resource_type=resource_type)
-    references = [
-        crossref_reference(i) for i in wrap(py_.get(bibmeta, "citation_list.citation"))
-    ]
-    files = presence(meta.get("contentUrl", None))
-    provider = (
-        bibmeta.get("reg-agency").capitalize()
-        if bibmeta.get("reg-agency", None)
-        else None
+    references = (
+        [crossref_reference(i) for i in xpath("citation_list/citation")(bibmeta)]
+        if bibmeta is not None
+        else []
+    )
+    provider = get_doi_ra(_id)
+    state = (
+        "findable"
+        if (meta is not None and len(meta) > 0) or read_options
+        else "not_found"
     )
-    if provider is None:
-        provider = get_doi_ra(_id)
-    state = "findable" if meta or read_options else "not_found"
 
     return {
         # required properties
@@ -276,7 +408,7 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
         "date_registered": None,
         "date_published": None,
         "date_updated": None,
-        "content_url": presence(files),
+        "content_url": None,
         "container": presence(container),
         "provider": provider,
         "state": state,
@@ -286,14 +418,12 @@ def read_crossref_xml(data: dict, **kwargs) -> Commonmeta:
 
 def crossref_titles(bibmeta):
     """Title information from Crossref metadata."""
-    title = parse_attributes(py_.get(bibmeta, "titles.0.title"))
-    subtitle = parse_attributes(py_.get(bibmeta, "titles.0.subtitle"))
+    title = parse_attributes(get_text(bibmeta, "titles[1]/title"))
+    subtitle = parse_attributes(get_text(bibmeta, "titles[1]/subtitle"))
     original_language_title = parse_attributes(
-        py_.get(bibmeta, "titles.0.original_language_title")
-    )
-    language = parse_attributes(
-        py_.get(bibmeta, "titles.0.original_language_title"), content="language"
+        get_text(bibmeta, "titles[1]/original_language_title")
     )
+    language = get_text(bibmeta, "titles[1]/original_language_title/@language")
     if title is None and original_language_title is None:
         return None
     if title and original_language_title is None and subtitle is None:
@@ -322,34 +452,49 @@ def crossref_description(bibmeta):
 
     def format_abstract(element):
         """Format abstract"""
-        if isinstance(element.get("p", None), list):
-            element["p"] = element["p"][0]
-        if isinstance(element.get("p", None), dict):
-            element["p"] = element["p"]["#text"]
         description_type = (
             "Abstract" if element.get("abstract-type", None) == "abstract" else "Other"
         )
+        description = get_text(element, "p")
         return compact(
             {
                 "descriptionType": description_type,
-                "description": sanitize(
-                    parse_attributes(element, content="p", first=True)
-                ),
+                "description": sanitize(description) if description else None,
             }
         )
 
-    return [format_abstract(i) for i in wrap(bibmeta.get("abstract", None))]
+    if bibmeta is None:
+        return []
+    return [format_abstract(i) for i in xpath("abstract")(bibmeta)]
+
+
+def crossref_date(element) -> Optional[str]:
+    """Date from Crossref publication_date or review_date"""
+    if element is None:
+        return None
+    return get_date_from_crossref_parts(
+        compact(
+            {
+                "year": get_text(element, "year"),
+                "month": get_text(element, "month"),
+                "day": get_text(element, "day"),
+            }
+        )
+    )
 
 
 def crossref_people(bibmeta):
     """Person information from Crossref metadata."""
-
-    person = py_.get(bibmeta, "contributors.person_name") or bibmeta.get(
-        "person_name", None
+    if bibmeta is None:
+        return []
+    person = xpath("contributors/person_name")(bibmeta) or xpath("person_name")(
+        bibmeta
     )
-    organization = wrap(py_.get(bibmeta, "contributors.organization"))
+    organization = xpath("contributors/organization")(bibmeta)
 
-    return get_authors(from_crossref_xml(wrap(person) + wrap(organization)))
+    return get_authors(
+        from_crossref_xml([element_to_dict(i) for i in person + organization])
+    )
 
     #     (Array.wrap(person) + Array.wrap(organization)).select do |a|
     #       a['contributor_role'] == contributor_role
@@ -388,84 +533,71 @@ def crossref_people(bibmeta):
     #           'name' => a['name'] || a['#text'] }
 
 
-def crossref_reference(reference: Optional[dict]) -> Optional[dict]:
-    """Get reference from Crossref reference"""
-    if reference is None or not isinstance(reference, dict):
+def crossref_reference(reference) -> Optional[dict]:
+    """Get reference from Crossref citation element"""
+    if reference is None:
         return None
-    doi = parse_attributes(reference.get("doi", None))
-    unstructured = reference.get("unstructured_citation", None)
-    if isinstance(unstructured, dict):
-        text = unstructured.get("font", None) or unstructured.get("#text", None)
-    else:
-        text = reference.get("unstructured_citation", None)
+    # text of the first child element with each name
+    fields: dict = {}
+    for child in reference:
+        if isinstance(child.tag, str):
+            fields.setdefault(child.tag.rpartition("}")[2], element_text(child))
+    text = fields.get
+
+    doi = parse_attributes(text("doi"))
+    unstructured = text("unstructured_citation")
     metadata = {
         "key": reference.get("key", None),
         "id": normalize_doi(doi) if doi else None,
-        "contributor": reference.get("author", None),
-        "title": reference.get("article_title", None),
-        "publisher": reference.get("publisher", None),
-        "publicationYear": reference.get("cYear", None),
-        "volume": reference.get("volume", None),
-        "issue": reference.get("issue", None),
-        "firstPage": reference.get("first_page", None),
-        "lastPage": reference.get("last_page", None),
-        "containerTitle": reference.get("journal_title", None),
+        "contributor": text("author"),
+        "title": text("article_title"),
+        "publisher": text("publisher"),
+        "publicationYear": text("cYear"),
+        "volume": text("volume"),
+        "issue": text("issue"),
+        "firstPage": text("first_page"),
+        "lastPage": text("last_page"),
+        "containerTitle": text("journal_title"),
         "edition": None,
-        "unstructured": sanitize(text) if text else None,
+        "unstructured": sanitize(unstructured) if unstructured else None,
     }
     return compact(metadata)
 
 
-def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dict:
+def crossref_container(meta, resource_type: str = "JournalArticle") -> dict:
     """Get container from Crossref"""
     container_type = CROSSREF_CONTAINER_TYPES.get(resource_type, None)
+    if meta is None:
+        return {}
+    ct = container_type
+    issns = (
+        xpath(f"{ct}/{ct}_metadata/issn")(meta)
+        + xpath(f"{ct}/{ct}_series_metadata/series_metadata/issn")(meta)
+        if ct is not None
+        else []
+    )
     issn = next(
-        (
-            i
-            for i in wrap(
-                py_.get(meta, f"{container_type}.{container_type}_metadata.issn")
-            )
-            + wrap(
-                py_.get(
-                    meta,
-                    f"{container_type}.{container_type}_series_metadata.series_metadata.issn",
-                )
-            )
-            if i.get("media_type", None) == "electronic"
-        ),
-        {},
-    ) or next(
-        (
-            i
-            for i in wrap(
-                py_.get(meta, f"{container_type}.{container_type}_metadata.issn")
-            )
-            + wrap(
-                py_.get(
-                    meta,
-                    f"{container_type}.{container_type}_series_metadata.series_metadata.issn",
-                )
-            )
-            if i.get("media_type", None) == "print"
-        ),
-        {},
+        (i for i in issns if i.get("media_type", None) == "electronic"),
+        next((i for i in issns if i.get("media_type", None) == "print"), None),
     )
-    issn = normalize_issn(issn) if issn else None
-    isbn = py_.get(meta, f"conference.{container_type}_metadata.isbn.#text")
+    issn = normalize_issn(element_text(issn)) if issn is not None else None
+    isbn = get_text(meta, f"conference/{ct}_metadata/isbn") if ct else None
     container_title = (
-        py_.get(meta, f"{container_type}.{container_type}_metadata.full_title")
-        or py_.get(meta, f"{container_type}.{container_type}_metadata.titles.0.title")
-        or py_.get(meta, f"conference.{container_type}_metadata.{container_type}_title")
-        or py_.get(
+        get_text(
             meta,
-            f"{container_type}.{container_type}_series_metadata.series_metadata.titles.0.title",
+            f"{ct}/{ct}_metadata/full_title",
+            f"{ct}/{ct}_metadata/titles[1]/title",
+            f"conference/{ct}_metadata/{ct}_title",
+            f"{ct}/{ct}_series_metadata/series_metadata/titles[1]/title",
         )
+        if ct is not None
+        else None
     )
-    volume = py_.get(
-        meta,
-        f"{container_type}.{container_type}_issue.{container_type}_volume.volume",
-    )
-    issue = py_.get(meta, f"{container_type}.{container_type}_issue.issue")
+    volume = get_text(meta, f"{ct}/{ct}_issue/{ct}_volume/volume") if ct else None
+    issue = get_text(meta, f"{ct}/{ct}_issue/issue") if ct else None
+    pages = (
+        [f"{ct}/{ct}_article/pages", f"{ct}/content_item/pages"] if ct else []
+    ) + ["conference/conference_paper/pages"]
     return compact(
         {
             "type": CR_TO_CM_CONTAINER_TRANSLATIONS.get(container_type, None),
@@ -474,18 +606,10 @@ def crossref_container(meta: dict, resource_type: str = "JournalArticle") -> dic
             "title": container_title,
             "volume": volume,
             "issue": issue,
-            "firstPage": py_.get(
-                meta, f"{container_type}.{container_type}_article.pages.first_page"
-            )
-            or py_.get(meta, f"{container_type}.content_item.pages.first_page")
-            or py_.get(meta, "conference.conference_paper.pages.first_page"),
-            "lastPage": py_.get(
-                meta, f"{container_type}.{container_type}_article.pages.last_page"
-            )
-            or py_.get(meta, f"{container_type}.content_item.pages.last_page")
-            or py_.get(meta, "conference.conference_paper.pages.last_page"),
-            "location": py_.get(meta, "conference.event_metadata.conference_location"),
-            "series": py_.get(meta, "conference.event_metadata.conference_acronym"),
+            "firstPage": get_text(meta, *[f"{i}/first_page" for i in pages]),
+            "lastPage": get_text(meta, *[f"{i}/last_page" for i in pages]),
+            "location": get_text(meta, "conference/event_metadata/conference_location"),
+            "series": get_text(meta, "conference/event_metadata/conference_acronym"),
         }
     )
 
@@ -500,7 +624,7 @@ def crossref_license(licenses: list) -> dict:
 
     def map_element(element):
         """Format element"""
-        url = parse_attributes(element)
+        url = parse_attributes(element_text(element))
         url = normalize_cc_url(url)
         return dict_to_spdx({"url": url})
 
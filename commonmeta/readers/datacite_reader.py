@@ -5,6 +5,7 @@ from typing import Optional
 import httpx
 from pydash import py_
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     normalize_url,
     normalize_doi,
@@ -12,7 +13,7 @@ from ..utils import (
     dict_to_spdx,
     format_name_identifier,
 )
-from ..base_utils import compact, wrap, presence
+from ..base_utils import compact, wrap, presence, compile_path
 from ..author_utils import get_authors
 from ..date_utils import normalize_date_dict
 from ..doi_utils import (
@@ -27,6 +28,11 @@ from ..constants import (
     Commonmeta,
 )
 
+# paths in DataCite REST API responses
+DATA_ATTRIBUTES = compile_path("data.attributes")
+RESOURCE_TYPE = compile_path("types.resourceType")
+RESOURCE_TYPE_GENERAL = compile_path("types.resourceTypeGeneral")
+
 
 def get_datacite(pid: str, **kwargs) -> dict:
     """get_datacite"""
@@ -35,14 +41,30 @@ def get_datacite(pid: str, **kwargs) -> dict:
         return {"state": "not_found"}
     url = datacite_api_url(doi)
     try:
-        response = httpx.get(url, timeout=10, **kwargs)
-        if response.status_code != 200:
-            return {"state": "not_found"}
-        return py_.get(response.json(), "data.attributes", {}) | {"via": "datacite"}
+        return datacite_response(http_get(url, **kwargs))
+    except httpx.ReadTimeout:
+        return {"state": "timeout"}
+
+
+async def get_datacite_async(pid: str, client=None, **kwargs) -> dict:
+    """get_datacite with an async client"""
+    doi = doi_from_url(pid)
+    if doi is None:
+        return {"state": "not_found"}
+    url = datacite_api_url(doi)
+    try:
+        return datacite_response(await async_http_get(url, client=client, **kwargs))
     except httpx.ReadTimeout:
         return {"state": "timeout"}
 
 
+def datacite_response(response) -> dict:
+    """DataCite attributes from the response of the DataCite REST API"""
+    if response.status_code != 200:
+        return {"state": "not_found"}
+    return DATA_ATTRIBUTES(response.json(), {}) | {"via": "datacite"}
+
+
 def read_datacite(data: dict, **kwargs) -> Commonmeta:
     """read_datacite"""
     meta = data
@@ -52,8 +74,8 @@ def read_datacite(data: dict, **kwargs) -> Commonmeta:
     read_options = kwargs or {}
 
     _id = doi_as_url(meta.get("doi", None))
-    resource__typegeneral = py_.get(meta, "types.resourceTypeGeneral")
-    resource_type = py_.get(meta, "types.resourceType")
+    resource__typegeneral = RESOURCE_TYPE_GENERAL(meta)
+    resource_type = RESOURCE_TYPE(meta)
     _type = DC_TO_CM_TRANSLATIONS.get(resource__typegeneral, "Other")
     additional_type = DC_TO_CM_TRANSLATIONS.get(resource_type, None)
     # if resource_type is one of the new resource__typegeneral types introduced in schema 4.3, use it
@@ -380,11 +402,11 @@ def get_random_datacite_id(number: int = 1) -> list:
     number = 20 if number > 20 else number
     url = datacite_api_sample_url(number)
     try:
-        response = httpx.get(url, timeout=60)
+        response = http_get(url, timeout=60)
         if response.status_code != 200:
             return []
 
-        items = py_.get(response.json(), "data")
+        items = response.json().get("data", None)
         return [i.get("id") for i in items]
     except httpx.ReadTimeout:
         return []
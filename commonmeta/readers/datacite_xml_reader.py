@@ -1,16 +1,39 @@
 """datacite_xml reader for Commonmeta"""
 
 from collections import defaultdict
-import httpx
+from typing import Union
 from pydash import py_
 
-from ..base_utils import compact, wrap, presence, sanitize, parse_attributes
+from ..http_utils import http_get
+from ..base_utils import (
+    compact,
+    wrap,
+    presence,
+    sanitize,
+    parse_attributes,
+    iterparse_xml,
+    clear_xml_element,
+    compile_path,
+)
 from ..author_utils import get_authors
 from ..date_utils import strip_milliseconds, normalize_date_dict
 from ..doi_utils import doi_from_url, doi_as_url, datacite_api_url, normalize_doi
 from ..utils import normalize_url, normalize_cc_url, dict_to_spdx
 from ..constants import DC_TO_CM_TRANSLATIONS, Commonmeta
 
+# paths in DataCite XML parsed with xmltodict
+ALTERNATE_IDENTIFIERS = compile_path("alternateIdentifiers.alternateIdentifier")
+CREATORS = compile_path("creators.creator")
+DATA_ATTRIBUTES = compile_path("data.attributes")
+DATES = compile_path("dates.date")
+DESCRIPTIONS = compile_path("descriptions.description")
+RELATED_IDENTIFIERS = compile_path("relatedIdentifiers.relatedIdentifier")
+RESOURCE_TYPE = compile_path("resourceType.#text")
+RESOURCE_TYPE_GENERAL = compile_path("resourceType.resourceTypeGeneral")
+RIGHTS = compile_path("rightsList.rights")
+SUBJECTS = compile_path("subjects.subject")
+TITLES = compile_path("titles.title")
+
 
 def get_datacite_xml(pid: str, **kwargs) -> dict:
     """get_datacite_xml"""
@@ -18,10 +41,21 @@ def get_datacite_xml(pid: str, **kwargs) -> dict:
     if doi is None:
         return {"state": "not_found"}
     url = datacite_api_url(doi)
-    response = httpx.get(url, timeout=10, **kwargs)
+    response = http_get(url, **kwargs)
     if response.status_code != 200:
         return {"state": "not_found"}
-    return py_.get(response.json(), "data.attributes", {}) | {"via": "datacite_xml"}
+    return DATA_ATTRIBUTES(response.json(), {}) | {"via": "datacite_xml"}
+
+
+def iter_datacite_xml_records(source: Union[str, bytes]):
+    """Split a collection of DataCite resources, e.g. an OAI-PMH harvest, into
+    the XML strings of single resources. The file is read with iterparse and
+    each resource is freed once it has been serialized."""
+    from lxml import etree
+
+    for element in iterparse_xml(source, tag="{*}resource"):
+        yield etree.tostring(element, encoding="unicode", with_tail=False)
+        clear_xml_element(element)
 
 
 def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
@@ -36,11 +70,11 @@ def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
     doi = parse_attributes(meta.get("identifier", None))
     _id = doi_as_url(doi) if doi else None
 
-    resource__typegeneral = py_.get(meta, "resourceType.resourceTypeGeneral")
+    resource__typegeneral = RESOURCE_TYPE_GENERAL(meta)
     _type = DC_TO_CM_TRANSLATIONS.get(resource__typegeneral, "Other")
-    additional_type = py_.get(meta, "resourceType.#text")
+    additional_type = RESOURCE_TYPE(meta)
 
-    identifiers = wrap(py_.get(meta, "alternateIdentifiers.alternateIdentifier"))
+    identifiers = wrap(ALTERNATE_IDENTIFIERS(meta))
     identifiers = get_xml_identifiers(identifiers)
 
     def format_title(title):
@@ -55,15 +89,15 @@ def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
             }
         return None
 
-    titles = [format_title(i) for i in wrap(py_.get(meta, "titles.title"))]
+    titles = [format_title(i) for i in wrap(TITLES(meta))]
 
-    contributors = get_authors(wrap(py_.get(meta, "creators.creator")))
+    contributors = get_authors(wrap(CREATORS(meta)))
     contrib = get_authors(wrap(meta.get("contributors", None)))
     if contrib:
         contributors = contributors + contrib
-    publisher = {"name": py_.get(meta, "publisher")}
+    publisher = {"name": meta.get("publisher", None)}
     date = get_dates(
-        wrap(py_.get(meta, "dates.date")), meta.get("publicationYear", None)
+        wrap(DATES(meta)), meta.get("publicationYear", None)
     )
 
     def format_description(description):
@@ -81,7 +115,7 @@ def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
         return None
 
     descriptions = [
-        format_description(i) for i in wrap(py_.get(meta, "descriptions.description"))
+        format_description(i) for i in wrap(DESCRIPTIONS(meta))
     ]
 
     def format_subject(subject):
@@ -98,7 +132,7 @@ def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
             )
         return None
 
-    subjects = [format_subject(i) for i in wrap(py_.get(meta, "subjects.subject")) if i]
+    subjects = [format_subject(i) for i in wrap(SUBJECTS(meta)) if i]
 
     def format_geo_location(geo_location):
         """format_geo_location"""
@@ -174,16 +208,16 @@ def read_datacite_xml(data: dict, **kwargs) -> Commonmeta:
             }
         )
 
-    license_ = wrap(py_.get(meta, "rightsList.rights"))
+    license_ = wrap(RIGHTS(meta))
     if len(license_) > 0:
         license_ = normalize_cc_url(license_[0].get("rightsURI", None))
         license_ = dict_to_spdx({"url": license_}) if license_ else None
 
     references = get_xml_references(
-        wrap(py_.get(meta, "relatedIdentifiers.relatedIdentifier"))
+        wrap(RELATED_IDENTIFIERS(meta))
     )
     relations = get_xml_relations(
-        wrap(py_.get(meta, "relatedIdentifiers.relatedIdentifier"))
+        wrap(RELATED_IDENTIFIERS(meta))
     )
 
     def map_funding_reference(funding_reference):
@@ -1,9 +1,9 @@
 """InvenioRDM reader for Commonmeta"""
 
-import httpx
 from pydash import py_
 from furl import furl
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     normalize_url,
     normalize_doi,
@@ -13,7 +13,7 @@ from ..utils import (
     get_language,
     validate_ror,
 )
-from ..base_utils import compact, wrap, presence, sanitize
+from ..base_utils import compact, wrap, presence, sanitize, compile_path
 from ..author_utils import get_authors
 from ..date_utils import strip_milliseconds
 from ..doi_utils import doi_as_url, doi_from_url
@@ -23,13 +23,55 @@ from ..constants import (
     Commonmeta,
 )
 
+# paths in InvenioRDM records
+AWARD_URI = compile_path("award.identifiers[0].identifier")
+AWARD_NUMBER = compile_path("award.number")
+AWARD_TITLE_EN = compile_path("award.title.en")
+JOURNAL = compile_path("custom_fields.journal:journal")
+JOURNAL_ISSN = compile_path("custom_fields.journal:journal.issn")
+FUNDER_ID = compile_path("funder.id")
+FUNDER_NAME = compile_path("funder.name")
+LINKS_SELF = compile_path("links.self")
+LINKS_SELF_HTML = compile_path("links.self_html")
+METADATA_ADDITIONAL_TITLES = compile_path("metadata.additional_titles")
+METADATA_CREATORS = compile_path("metadata.creators")
+METADATA_DESCRIPTION = compile_path("metadata.description")
+METADATA_FUNDING = compile_path("metadata.funding")
+METADATA_KEYWORDS = compile_path("metadata.keywords")
+METADATA_LANGUAGE = compile_path("metadata.language")
+METADATA_LANGUAGES_ID = compile_path("metadata.languages[0].id")
+METADATA_LICENSE_ID = compile_path("metadata.license.id")
+METADATA_NOTES = compile_path("metadata.notes")
+METADATA_PUBLICATION_DATE = compile_path("metadata.publication_date")
+METADATA_PUBLISHER = compile_path("metadata.publisher")
+METADATA_RELATED_IDENTIFIERS = compile_path("metadata.related_identifiers")
+METADATA_RESOURCE_TYPE_ID = compile_path("metadata.resource_type.id")
+METADATA_RESOURCE_TYPE_TYPE = compile_path("metadata.resource_type.type")
+METADATA_RIGHTS_ID = compile_path("metadata.rights[0].id")
+METADATA_TITLE = compile_path("metadata.title")
+METADATA_VERSION = compile_path("metadata.version")
+PIDS_DOI_IDENTIFIER = compile_path("pids.doi.identifier")
+
 
 def get_inveniordm(pid: str, **kwargs) -> dict:
     """get_inveniordm"""
     if pid is None:
         return {"state": "not_found"}
     url = normalize_url(pid)
-    response = httpx.get(url, timeout=10, follow_redirects=True, **kwargs)
+    return inveniordm_response(http_get(url, follow_redirects=True, **kwargs))
+
+
+async def get_inveniordm_async(pid: str, client=None, **kwargs) -> dict:
+    """get_inveniordm with an async client"""
+    if pid is None:
+        return {"state": "not_found"}
+    url = normalize_url(pid)
+    response = await async_http_get(url, client=client, follow_redirects=True, **kwargs)
+    return inveniordm_response(response)
+
+
+def inveniordm_response(response) -> dict:
+    """InvenioRDM record from the response of the InvenioRDM API"""
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json()
@@ -40,35 +82,33 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
     meta = data
     read_options = kwargs or {}
 
-    url = normalize_url(py_.get(meta, "links.self_html"))
+    url = normalize_url(LINKS_SELF_HTML(meta))
     _id = (
         doi_as_url(meta.get("doi", None))
-        or doi_as_url(py_.get(meta, "pids.doi.identifier"))
+        or doi_as_url(PIDS_DOI_IDENTIFIER(meta))
         or url
     )
-    resource_type = py_.get(meta, "metadata.resource_type.type") or py_.get(
-        meta, "metadata.resource_type.id"
-    )
+    resource_type = METADATA_RESOURCE_TYPE_TYPE(meta) or METADATA_RESOURCE_TYPE_ID(meta)
     _type = INVENIORDM_TO_CM_TRANSLATIONS.get(resource_type, "Other")
 
-    contributors = py_.get(meta, "metadata.creators")
+    contributors = METADATA_CREATORS(meta)
     contributors = get_authors(
         from_inveniordm(wrap(contributors)),
     )
-    publisher = meta.get("publisher", None) or py_.get(meta, "metadata.publisher")
+    publisher = meta.get("publisher", None) or METADATA_PUBLISHER(meta)
     if publisher:
         publisher = {"name": publisher}
-    if _type == "Article" and py_.get(publisher, "name") == "Front Matter":
+    if _type == "Article" and publisher and publisher.get("name") == "Front Matter":
         _type = "BlogPost"
 
-    title = py_.get(meta, "metadata.title")
+    title = METADATA_TITLE(meta)
     titles = [{"title": sanitize(title)}] if title else None
-    additional_titles = py_.get(meta, "metadata.additional_titles")
+    additional_titles = METADATA_ADDITIONAL_TITLES(meta)
     # if additional_titles:
     #     titles += [{"title": sanitize("bla")} for i in wrap(additional_titles)]
 
     date: dict = {}
-    date["published"] = py_.get(meta, ("metadata.publication_date"))
+    date["published"] = METADATA_PUBLICATION_DATE(meta)
     if date["published"]:
         date["published"] = date["published"].split("/")[0]
     date["updated"] = strip_milliseconds(meta.get("updated", None))
@@ -83,9 +123,9 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
         )
         publisher = {"name": "Zenodo"}
     else:
-        container = py_.get(meta, "custom_fields.journal:journal")
+        container = JOURNAL(meta)
         if container:
-            issn = py_.get(meta, "custom_fields.journal:journal.issn")
+            issn = JOURNAL_ISSN(meta)
             container = compact(
                 {
                     "type": "Periodical",
@@ -94,25 +134,21 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
                     "identifierType": "ISSN" if issn else None,
                 }
             )
-    license_ = py_.get(meta, "metadata.rights[0].id") or py_.get(
-        meta, "metadata.license.id"
-    )
+    license_ = METADATA_RIGHTS_ID(meta) or METADATA_LICENSE_ID(meta)
     if license_:
         license_ = dict_to_spdx({"id": license_})
     descriptions = format_descriptions(
         [
-            py_.get(meta, "metadata.description"),
-            py_.get(meta, "metadata.notes"),
+            METADATA_DESCRIPTION(meta),
+            METADATA_NOTES(meta),
         ]
     )
-    language = py_.get(meta, "metadata.language") or py_.get(
-        meta, "metadata.languages[0].id"
-    )
-    subjects = [name_to_fos(i) for i in wrap(py_.get(meta, "metadata.keywords"))]
+    language = METADATA_LANGUAGE(meta) or METADATA_LANGUAGES_ID(meta)
+    subjects = [name_to_fos(i) for i in wrap(METADATA_KEYWORDS(meta))]
 
-    references = get_references(wrap(py_.get(meta, "metadata.related_identifiers")))
-    relations = get_relations(wrap(py_.get(meta, "metadata.related_identifiers")))
-    funding_references = get_funding_references(wrap(py_.get(meta, "metadata.funding")))
+    references = get_references(wrap(METADATA_RELATED_IDENTIFIERS(meta)))
+    relations = get_relations(wrap(METADATA_RELATED_IDENTIFIERS(meta)))
+    funding_references = get_funding_references(wrap(METADATA_FUNDING(meta)))
     if meta.get("conceptdoi", None):
         relations.append(
             {
@@ -136,7 +172,7 @@ def read_inveniordm(data: dict, **kwargs) -> Commonmeta:
         # "additional_type": additional_type,
         "subjects": presence(subjects),
         "language": get_language(language),
-        "version": py_.get(meta, "metadata.version"),
+        "version": METADATA_VERSION(meta),
         "license": presence(license_),
         "descriptions": descriptions,
         "geoLocations": None,
@@ -189,12 +225,12 @@ def get_funding_references(funding_references: list) -> list:
         """map_funding"""
 
         return compact({
-            "funderName": py_.get(funding, "funder.name"),
-            "funderIdentifier": py_.get(funding, "funder.id"),
-            "funderIdentifierType": "ROR" if validate_ror(py_.get(funding, "funder.id")) else None,
-            "awardTitle": py_.get(funding, "award.title.en"),
-            "awardNumber": py_.get(funding, "award.number"),
-            "awardUri": py_.get(funding, "award.identifiers[0].identifier"),
+            "funderName": FUNDER_NAME(funding),
+            "funderIdentifier": FUNDER_ID(funding),
+            "funderIdentifierType": "ROR" if validate_ror(FUNDER_ID(funding)) else None,
+            "awardTitle": AWARD_TITLE_EN(funding),
+            "awardNumber": AWARD_NUMBER(funding),
+            "awardUri": AWARD_URI(funding),
         })
     
     return [map_funding(i) for i in funding_references]
@@ -207,7 +243,7 @@ def get_file(file: dict) -> str:
             "bucket": file.get("bucket", None),
             "key": file.get("key", None),
             "checksum": file.get("checksum", None),
-            "url": py_.get(file, "links.self"),
+            "url": LINKS_SELF(file),
             "size": file.get("size", None),
             "mimeType": "application/" + _type if _type else None,
         }
@@ -1,10 +1,10 @@
 """JSON Feed reader for commonmeta-py"""
 
 from typing import Optional
-import httpx
 from pydash import py_
 from furl import furl
 
+from ..http_utils import http_get, async_http_get
 from ..utils import (
     compact,
     normalize_url,
@@ -17,7 +17,7 @@ from ..utils import (
     issn_as_url,
 )
 from ..author_utils import get_authors
-from ..base_utils import presence, sanitize, parse_attributes
+from ..base_utils import presence, sanitize, parse_attributes, compile_path
 from ..date_utils import get_date_from_unix_timestamp
 from ..doi_utils import (
     normalize_doi,
@@ -29,13 +29,37 @@ from ..doi_utils import (
 )
 from ..constants import Commonmeta
 
+# paths in JSON Feed items of the Rogue Scholar API
+BLOG_CATEGORY = compile_path("blog.category")
+BLOG_FUNDING = compile_path("blog.funding")
+BLOG_GENERATOR = compile_path("blog.generator")
+BLOG_ISSN = compile_path("blog.issn")
+BLOG_LICENSE = compile_path("blog.license")
+BLOG_PREFIX = compile_path("blog.prefix")
+BLOG_SLUG = compile_path("blog.slug")
+BLOG_STATUS = compile_path("blog.status")
+BLOG_TITLE = compile_path("blog.title")
+
 
 def get_json_feed_item(pid: str, **kwargs) -> dict:
     """get_json_feed_item"""
     if pid is None:
         return {"state": "not_found"}
     url = normalize_url(pid)
-    response = httpx.get(url, timeout=10, follow_redirects=True, **kwargs)
+    return json_feed_item_response(http_get(url, follow_redirects=True, **kwargs))
+
+
+async def get_json_feed_item_async(pid: str, client=None, **kwargs) -> dict:
+    """get_json_feed_item with an async client"""
+    if pid is None:
+        return {"state": "not_found"}
+    url = normalize_url(pid)
+    response = await async_http_get(url, client=client, follow_redirects=True, **kwargs)
+    return json_feed_item_response(response)
+
+
+def json_feed_item_response(response) -> dict:
+    """JSON Feed item from the response of the Rogue Scholar API"""
     if response.status_code != 200:
         return {"state": "not_found"}
     return response.json() | {"via": "json_feed_item"}
@@ -48,9 +72,9 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
     meta = data
     read_options = kwargs or {}
     url = None
-    if py_.get(meta, "blog.status", None) in ["active", "expired"]:
+    if BLOG_STATUS(meta) in ["active", "expired"]:
         url = normalize_url(meta.get("url", None))
-    elif py_.get(meta, "blog.status", None) == "archived" and meta.get(
+    elif BLOG_STATUS(meta) == "archived" and meta.get(
         "archive_url", None
     ):
         url = normalize_url(meta.get("archive_url", None))
@@ -58,7 +82,7 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
     _type = "BlogPost"
 
     # optionally generate a DOI if missing but a DOI prefix is provided
-    prefix = read_options.get("prefix", None) or py_.get(meta, "blog.prefix", None)
+    prefix = read_options.get("prefix", None) or BLOG_PREFIX(meta)
     if doi_from_url(_id) is None and prefix is not None:
         _id = encode_doi(prefix)
 
@@ -82,10 +106,10 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
         else None
     )
 
-    license_ = py_.get(meta, "blog.license", None)
+    license_ = BLOG_LICENSE(meta)
     if license_ is not None:
         license_ = dict_to_spdx({"url": license_})
-    issn = py_.get(meta, "blog.issn", None)
+    issn = BLOG_ISSN(meta)
     blog_url = (
         f"https://rogue-scholar.org/blogs/{meta.get('blog_slug')}"
         if meta.get("blog_slug", None)
@@ -94,10 +118,10 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
     container = compact(
         {
             "type": "Blog",
-            "title": py_.get(meta, "blog.title", None),
+            "title": BLOG_TITLE(meta),
             "identifier": issn or blog_url,
             "identifierType": "ISSN" if issn else "URL",
-            "platform": py_.get(meta, "blog.generator", None),
+            "platform": BLOG_GENERATOR(meta),
         }
     )
     publisher = (
@@ -115,12 +139,12 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
         descriptions = [{"description": sanitize(description), "type": "Abstract"}]
     else:
         descriptions = None
-    category = py_.get(meta, "blog.category", None)
+    category = BLOG_CATEGORY(meta)
     if category is not None:
         subjects = [name_to_fos(py_.human_case(category))]
     else:
         subjects = []
-    tags = wrap(py_.get(meta, "tags", None))
+    tags = wrap(meta.get("tags", None))
     if tags is not None:
         subjects += wrap([format_subject(i) for i in tags])
     references = get_references(wrap(meta.get("reference", None)))
@@ -137,8 +161,8 @@ def read_json_feed_item(data: Optional[dict], **kwargs) -> Commonmeta:
         {"identifier": meta.get("id"), "identifierType": "UUID"},
         {"identifier": meta.get("guid"), "identifierType": "GUID"},
     ]
-    content = py_.get(meta, "content_html", "")
-    image = py_.get(meta, "image", None)
+    content = meta.get("content_html", "")
+    image = meta.get("image", None)
     files = get_files(_id)
     state = "findable" if meta or read_options else "not_found"
 
@@ -255,7 +279,7 @@ def get_funding_references(meta: Optional[dict]) -> Optional[list]:
         elif len(urls) == 2 and validate_ror(urls[0]):
             f = furl(urls[0])
             _id = f.path.segments[-1]
-            response = httpx.get(f"https://api.ror.org/organizations/{_id}", timeout=10)
+            response = http_get(f"https://api.ror.org/organizations/{_id}")
             ror = response.json()
             funder_name = ror.get("name", None)
             funder_identifier = urls[0]
@@ -311,11 +335,11 @@ def get_funding_references(meta: Optional[dict]) -> Optional[list]:
                 "awardUri": award_uri,
             }
         )
-    funding_references = py_.get(meta, "funding_references")
+    funding_references = meta.get("funding_references", None)
     if funding_references is not None:
         awards += [format_funding_reference(i) for i in funding_references if i.get("funderName", None)]
     
-    awards += wrap(py_.get(meta, "blog.funding"))
+    awards += wrap(BLOG_FUNDING(meta))
     return py_.uniq(awards)
 
 
@@ -392,7 +416,7 @@ def get_json_feed_item_uuid(id: str):
     if id is None:
         return None
     url = f"https://api.rogue-scholar.org/posts/{id}"
-    response = httpx.get(url, timeout=10)
+    response = http_get(url)
     if response.status_code != 200:
         return response.json()
     post = response.json()
@@ -420,11 +444,11 @@ def get_json_feed_blog_slug(id: str):
     if id is None:
         return None
     url = f"https://api.rogue-scholar.org/posts/{id}"
-    response = httpx.get(url, timeout=10)
+    response = http_get(url)
     if response.status_code != 200:
         return response.json()
     post = response.json()
-    return py_.get(post, "blog.slug", None)
+    return BLOG_SLUG(post)
 
 
 def format_subject(subject: str) -> Optional[dict]:
@@ -2,7 +2,7 @@
 from pydash import py_
 
 from ..utils import normalize_url, normalize_doi, from_curie, from_kbase
-from ..base_utils import compact, wrap, presence, sanitize
+from ..base_utils import compact, wrap, presence, sanitize, compile_path
 from ..author_utils import get_authors
 from ..date_utils import normalize_date_dict
 from ..doi_utils import doi_from_url, validate_doi
@@ -11,6 +11,11 @@ from ..constants import (
     Commonmeta,
 )
 
+# paths in KBase credit metadata
+FUNDER_ORGANIZATION_ID = compile_path("funder.organization_id")
+FUNDER_ORGANIZATION_NAME = compile_path("funder.organization_name")
+METADATA_VERSION = compile_path("metadata.version")
+
 
 def read_kbase(data: dict, **kwargs) -> Commonmeta:
     """read_kbase"""
@@ -83,7 +88,7 @@ def read_kbase(data: dict, **kwargs) -> Commonmeta:
         "subjects": None,
         "language": language,
         "identifiers": None,
-        "version": py_.get(meta, "metadata.version"),
+        "version": METADATA_VERSION(meta),
         "license": presence(license_),
         "descriptions": descriptions,
         "geo_locations": None,
@@ -174,7 +179,7 @@ def get_funding_references(funding_references: list) -> list:
 
     def map_funding_reference(funding_reference: dict) -> dict:
         """map_funding_reference"""
-        funder_identifier = py_.get(funding_reference, "funder.organization_id", None)
+        funder_identifier = FUNDER_ORGANIZATION_ID(funding_reference)
         funder_identifier_type = (
             funder_identifier.split(":")[0] if funder_identifier else None
         )
@@ -182,9 +187,7 @@ def get_funding_references(funding_references: list) -> list:
             {
                 "funderIdentifier": from_curie(funder_identifier),
                 "funderIdentifierType": funder_identifier_type,
-                "funderName": py_.get(
-                    funding_reference, "funder.organization_name", None
-                ),
+                "funderName": FUNDER_ORGANIZATION_NAME(funding_reference),
                 "awardNumber": funding_reference.get("grant_id", None),
                 "awardUri": funding_reference.get("grant_url", None),
             }
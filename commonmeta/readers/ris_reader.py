@@ -1,13 +1,17 @@
 """RIS reader for commonmeta-py"""
+import re
 from typing import Optional
 
 from ..utils import compact, normalize_url, wrap
-from ..base_utils import presence
+from ..base_utils import iter_lines, presence
 from ..author_utils import get_authors
 from ..date_utils import get_date_from_parts
 from ..doi_utils import normalize_doi, doi_from_url
 from ..constants import RIS_TO_CM_TRANSLATIONS, Commonmeta
 
+# a tag of two letters or digits, two spaces, a hyphen and the value
+RIS_TAG_REGEX = re.compile(r"\A\s*([A-Z][A-Z0-9])\s{1,2}-(?:\s(.*))?\Z")
+
 
 def read_ris(data: Optional[str], **kwargs) -> Commonmeta:
     """read_ris"""
@@ -70,7 +74,7 @@ def read_ris(data: Optional[str], **kwargs) -> Commonmeta:
         "type": _type,
         "doi": doi_from_url(_id),
         "url": normalize_url(meta.get("UR", None)),
-        "titles": [{"title": meta.get("T1", None)}],
+        "titles": [{"title": meta.get("T1", None) or meta.get("TI", None)}],
         "descriptions": descriptions,
         "contributors": presence(contributors),
         "publisher": presence(publisher),
@@ -84,20 +88,43 @@ def read_ris(data: Optional[str], **kwargs) -> Commonmeta:
 
 
 def ris_meta(data):
-    """ris_meta"""
+    """Values of the tags of the first record, as string or as list if
+    the tag is repeated"""
     meta = {}
     if data is None:
         return meta
     for line in data.split("\n"):
-        values = line.split("-", 2)
-        key = values[0].strip()
-        if len(values) == 1:
+        match = RIS_TAG_REGEX.match(line.rstrip())
+        if match is None:
             continue
-        if meta.get(key, None) is None:
-            meta[key] = values[1].strip()
+        key, value = match.group(1), (match.group(2) or "").strip()
+        if key == "ER":
+            break
+        if key not in meta:
+            meta[key] = value
         elif isinstance(meta[key], str):
-            meta[key] = [meta[key]]
-        elif isinstance(meta[key], list):
-            meta[key].append(values[1].strip())
-
+            meta[key] = [meta[key], value]
+        else:
+            meta[key].append(value)
     return meta
+
+
+def iter_ris_records(source):
+    """Split RIS with several records, given as string, file name or file
+    handle, into the strings of single records. The input is read one line
+    at a time, from the TY tag that starts a record to the ER tag that ends it."""
+    record = []
+    for line in iter_lines(source):
+        match = RIS_TAG_REGEX.match(line.rstrip())
+        tag = match.group(1) if match is not None else None
+        if tag == "TY":
+            if record:
+                yield "".join(record)
+            record = [line]
+        elif record:
+            record.append(line)
+            if tag == "ER":
+                yield "".join(record)
+                record = []
+    if record:
+        yield "".join(record)
@@ -1,15 +1,16 @@
 """schema_org reader for commonmeta-py"""
 
+import asyncio
 from typing import Optional
 import io
-import orjson as json
 from datetime import datetime
 from collections import defaultdict
 import httpx
 from pydash import py_
-from bs4 import BeautifulSoup
 import pikepdf
 
+from ..http_utils import http_stream
+from ..html_utils import parse_html_meta
 from ..utils import (
     dict_to_spdx,
     normalize_cc_url,
@@ -31,7 +32,7 @@ from ..date_utils import (
     get_datetime_from_pdf_time,
 )
 from ..doi_utils import doi_from_url, get_doi_ra, validate_doi
-from ..translators import web_translator
+from ..translators import web_translator, needs_body
 from ..constants import (
     SO_TO_CM_TRANSLATIONS,
     SO_TO_DC_RELATION_TYPES,
@@ -51,7 +52,30 @@ def get_schema_org(pid: str, **kwargs) -> dict:
     if doi_from_url(pid):
         return get_doi_meta(doi_from_url(pid))
     try:
-        response = httpx.get(url, timeout=10, follow_redirects=True, **kwargs)
+        with http_stream(url, follow_redirects=True, **kwargs) as response:
+            if response.status_code >= 400:
+                if response.status_code in [404, 410]:
+                    state = "not_found"
+                elif response.status_code in [401, 403]:
+                    state = "forbidden"
+                else:
+                    state = "bad_request"
+                return {
+                    "@id": url,
+                    "@type": "WebPage",
+                    "state": state,
+                    "via": "schema_org",
+                }
+            elif response.headers.get("content-type") == "application/pdf":
+                return get_pdf_meta(response.read(), url)
+
+            # read the head, and the body only if needed for JSON-LD
+            # or site-specific metadata
+            body = needs_body(url)
+            meta = parse_html_meta(
+                response.iter_text(),
+                stop=lambda meta: not body and get_json_ld(meta) is not None,
+            )
     except httpx.ConnectError as error:
         return {
             "@id": url,
@@ -60,63 +84,15 @@ def get_schema_org(pid: str, **kwargs) -> dict:
             "via": "schema_org",
             "errors": [str(error)],
         }
-    if response.status_code >= 400:
-        if response.status_code in [404, 410]:
-            state = "not_found"
-        elif response.status_code in [401, 403]:
-            state = "forbidden"
-        else:
-            state = "bad_request"
-        return {"@id": url, "@type": "WebPage", "state": state, "via": "schema_org"}
-    elif response.headers.get("content-type") == "application/pdf":
-        try:
-            pdf = pikepdf.open(io.BytesIO(response.content))
-            with pdf.open_metadata() as meta:
-                if meta.get("/doi", None) is not None:
-                    return get_doi_meta(meta.get("/doi"))
-                date_modified = (
-                    get_datetime_from_pdf_time(meta.get("/ModDate"))
-                    if meta.get("/ModDate", None)
-                    else None
-                )
-                name = meta.get("/Title", None)
-                return compact(
-                    {
-                        "@id": url,
-                        "@type": "DigitalDocument",
-                        "via": "schema_org",
-                        "name": str(name),
-                        "datePublished": date_modified,
-                        "dateAccessed": datetime.now().isoformat("T", "seconds")
-                        if date_modified is None
-                        else None,
-                    }
-                )
-        except Exception as error:
-            print(error)
-            return {
-                "@id": url,
-                "@type": "WebPage",
-                "state": "bad_request",
-                "via": "schema_org",
-            }
-
-    soup = BeautifulSoup(response.text, "html.parser")
 
     # load html meta tags
-    data = get_html_meta(soup)
+    data = get_html_meta(meta)
     # load site-specific metadata
-    data |= web_translator(soup, url)
+    data |= web_translator(meta, url)
 
-    # load schema.org metadata. If there are multiple schema.org blocks, load them all,
-    # and pick the first one with a supported type
-    list = [
-        json.loads(x.text) for x in soup.find_all("script", type="application/ld+json")
-    ]
-    json_ld = next(
-        (i for i in list if i.get("@type", None) in SO_TO_CM_TRANSLATIONS),
-        None,
-    )
+    # load schema.org metadata. If there are multiple schema.org blocks,
+    # pick the first one with a supported type
+    json_ld = get_json_ld(meta)
     if json_ld is not None:
         data |= json_ld
 
@@ -138,6 +114,47 @@ def get_schema_org(pid: str, **kwargs) -> dict:
     return data | {"via": "schema_org", "state": "findable"}
 
 
+async def get_schema_org_async(pid: str, client=None, **kwargs) -> dict:
+    """get_schema_org in a worker thread, as landing pages may need several
+    dependent requests. Uses the shared sync client, not client."""
+    return await asyncio.to_thread(get_schema_org, pid, **kwargs)
+
+
+def get_pdf_meta(content: bytes, url: str) -> dict:
+    """Get metadata from a PDF document"""
+    try:
+        pdf = pikepdf.open(io.BytesIO(content))
+        with pdf.open_metadata() as meta:
+            if meta.get("/doi", None) is not None:
+                return get_doi_meta(meta.get("/doi"))
+            date_modified = (
+                get_datetime_from_pdf_time(meta.get("/ModDate"))
+                if meta.get("/ModDate", None)
+                else None
+            )
+            name = meta.get("/Title", None)
+            return compact(
+                {
+                    "@id": url,
+                    "@type": "DigitalDocument",
+                    "via": "schema_org",
+                    "name": str(name),
+                    "datePublished": date_modified,
+                    "dateAccessed": datetime.now().isoformat("T", "seconds")
+                    if date_modified is None
+                    else None,
+                }
+            )
+    except Exception as error:
+        print(error)
+        return {
+            "@id": url,
+            "@type": "WebPage",
+            "state": "bad_request",
+            "via": "schema_org",
+        }
+
+
 def read_schema_org(data: Optional[dict], **kwargs) -> Commonmeta:
     """read_schema_org"""
     if (
@@ -396,106 +413,89 @@ def schema_org_geolocation(geo_location: Optional[dict]) -> Optional[dict]:
     return None
 
 
-def get_html_meta(soup):
-    """Get metadata from HTML meta tags"""
+def get_html_meta(meta):
+    """Get metadata from HTML meta tags, given as HtmlMeta"""
     data = {}
     pid = (
-        soup.select_one("meta[name='citation_doi']")
-        or soup.select_one("meta[name='dc.identifier']")
-        or soup.select_one("meta[name='DC.identifier']")
-        or soup.select_one("meta[name='bepress_citation_doi']")
-        or soup.select_one('[rel="canonical"]')
+        meta.get(
+            "name",
+            "citation_doi",
+            "dc.identifier",
+            "DC.identifier",
+            "bepress_citation_doi",
+        )
+        or meta.canonical
     )
     if pid is not None:
-        pid = pid.get("content", None) or pid.get("href", None)
         data["@id"] = normalize_id(pid)
 
-    _type = (
-        soup.select_one("meta[name='dc.type']")
-        or soup.select_one("meta[name='DC.type']")
-    )
-    data["@type"] = _type["content"].capitalize() if _type else None
+    _type = meta.get("name", "dc.type", "DC.type")
+    data["@type"] = _type.capitalize() if _type else None
     if _type is None:
-        _type = soup.select_one("meta[property='og:type']")
-        data["@type"] = OG_TO_SO_TRANSLATIONS.get(_type["content"]) if _type else None
+        _type = meta.get("property", "og:type")
+        data["@type"] = OG_TO_SO_TRANSLATIONS.get(_type) if _type else None
 
-    url = soup.select_one("meta[property='og:url']") or soup.select_one(
-        "meta[name='twitter:url']"
-    )
-    data["url"] = url["content"] if url else None
+    url = meta.get("property", "og:url") or meta.get("name", "twitter:url")
+    data["url"] = url
     if pid is None and url is not None:
-        data["@id"] = url["content"]
-
-    title = (
-        soup.select_one("meta[name='citation_title']")
-        or soup.select_one("meta[name='dc.title']")
-        or soup.select_one("meta[name='DC.title']")
-        or soup.select_one("meta[property='og:title']")
-        or soup.select_one("meta[name='twitter:title']")
-        or soup.select_one("meta[name='title']")
+        data["@id"] = url
+
+    data["name"] = (
+        meta.get("name", "citation_title", "dc.title", "DC.title")
+        or meta.get("property", "og:title")
+        or meta.get("name", "twitter:title", "title")
     )
-    data["name"] = title["content"] if title else None
 
-    author = soup.select("meta[name='citation_author']")
-    data["author"] = [i["content"] for i in author] if author else None
+    data["author"] = meta.get_all("name", "citation_author") or None
 
-    description = soup.select_one("meta[name='citation_abstract']") or soup.select_one(
-        "meta[name='dc.description']"
-        or soup.select_one("meta[property='og:description']")
-        or soup.select_one("meta[name='twitter:description']")
-        or soup.select_one("meta[name='description']")
+    data["description"] = (
+        meta.get("name", "citation_abstract", "dc.description")
+        or meta.get("property", "og:description")
+        or meta.get("name", "twitter:description", "description")
     )
-    data["description"] = description["content"] if description else None
 
-    keywords = soup.select_one("meta[name='citation_keywords']")
+    keywords = meta.get("name", "citation_keywords")
     data["keywords"] = (
-        str(keywords["content"]).replace(";", ",").rstrip(", ") if keywords else None
+        str(keywords).replace(";", ",").rstrip(", ") if keywords else None
     )
 
-    date_published = (
-        soup.select_one("meta[name='citation_publication_date']")
-        or soup.select_one("meta[name='dc.date']")
-        or soup.select_one("meta[property='article:published_time']")
-    )
+    date_published = meta.get(
+        "name", "citation_publication_date", "dc.date"
+    ) or meta.get("property", "article:published_time")
     data["datePublished"] = (
-        get_iso8601_date(date_published["content"]) if date_published else None
-    )
-    date_modified = soup.select_one(
-        "meta[property='og:updated_time']"
-        or soup.select_one("meta[property='article:modified_time']")
-    )
-    data["dateModified"] = (
-        get_iso8601_date(date_modified["content"]) if date_modified else None
+        get_iso8601_date(date_published) if date_published else None
     )
-    license_ = soup.select_one("meta[name='dc.rights']")
-    data["license"] = license_["content"] if license_ else None
+    date_modified = meta.get("property", "og:updated_time", "article:modified_time")
+    data["dateModified"] = get_iso8601_date(date_modified) if date_modified else None
+    data["license"] = meta.get("name", "dc.rights")
 
-    lang = soup.select_one("meta[name='dc.language']") or soup.select_one(
-        "meta[name='citation_language']"
-    )
+    lang = meta.get("name", "dc.language", "citation_language") or meta.lang
     if lang is not None:
-        data["inLanguage"] = lang["content"]
-    else:
-        html = soup.select_one("html")
-        if html is not None:
-            lang = html.get("lang", None)
-            if lang is not None:
-                data["inLanguage"] = lang
+        data["inLanguage"] = lang
 
-    publisher = soup.select_one("meta[property='og:site_name']")
-    data["publisher"] = {"name": publisher["content"]} if publisher else None
-
-    name = soup.select_one("meta[property='og:site_name']")
-    issn = soup.select_one("meta[name='citation_issn']")
+    publisher = meta.get("property", "og:site_name")
+    data["publisher"] = {"name": publisher} if publisher else None
     data["isPartOf"] = compact(
         {
-            "name": name["content"] if name else None,
-            "issn": issn["content"] if issn else None,
+            "name": publisher,
+            "issn": meta.get("name", "citation_issn"),
         }
     )
     return data
 
 
+def get_json_ld(meta) -> Optional[dict]:
+    """Get the first JSON-LD block with a supported schema.org type"""
+    return next(
+        (
+            i
+            for i in meta.json_ld
+            if isinstance(i, dict) and i.get("@type", None) in SO_TO_CM_TRANSLATIONS
+        ),
+        None,
+    )
+
+
 def get_funding_reference(dct):
     """Get funding reference"""
     return compact(
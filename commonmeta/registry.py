@@ -0,0 +1,289 @@
+"""Registry of metadata formats for commonmeta-py"""
+from importlib import import_module
+from threading import Lock
+from typing import Callable, Optional, Union
+from pydash import py_
+
+ENTRY_POINT_GROUP = "commonmeta.formats"
+
+
+class MetadataFormat:
+    """Reader and writer functions of a metadata format, found by name (via or to).
+
+    Functions are given as callables or as "module:function" strings, relative
+    to commonmeta if they start with a dot. Strings are imported the first time
+    they are used, so that a conversion only loads the libraries it needs:
+
+    - fetch and fetch_async: get the data for an id
+    - parse: turn a string into data for read, the string is used as is if None
+    - read: turn data into a commonmeta dict, with the Metadata options if
+      read_options is set
+    - write_item: build the dict cached by Metadata.write_item
+    - write: write a Metadata as string, after setting write_options
+      (name and default) as attributes
+    - parse_list: turn a string into a dict with items for MetadataList
+    - iter_list: split a string or file into the strings of single records,
+      for MetadataList input that is read one record at a time
+    - write_list and stream_list: write a MetadataList, with the options if
+      list_options is set
+
+    sniff is called with parsed JSON and returns True if it is in this format."""
+
+    def __init__(
+        self,
+        name: str,
+        sniff: Optional[Callable[[dict], bool]] = None,
+        fetch: Optional[Union[str, Callable]] = None,
+        fetch_async: Optional[Union[str, Callable]] = None,
+        parse: Optional[Union[str, Callable]] = None,
+        read: Optional[Union[str, Callable]] = None,
+        read_options: bool = False,
+        write_item: Optional[Union[str, Callable]] = None,
+        write: Optional[Union[str, Callable]] = None,
+        write_options: Optional[dict] = None,
+        parse_list: Optional[Union[str, Callable]] = None,
+        iter_list: Optional[Union[str, Callable]] = None,
+        write_list: Optional[Union[str, Callable]] = None,
+        stream_list: Optional[Union[str, Callable]] = None,
+        list_options: bool = False,
+    ):
+        self.name = name
+        self.sniff = sniff
+        self.fetch = fetch
+        self.fetch_async = fetch_async
+        self.parse = parse
+        self.read = read
+        self.read_options = read_options
+        self.write_item = write_item
+        self.write = write
+        self.write_options = write_options or {}
+        self.parse_list = parse_list
+        self.iter_list = iter_list
+        self.write_list = write_list
+        self.stream_list = stream_list
+        self.list_options = list_options
+        self._functions: dict = {}
+
+    def load(self, function: str) -> Optional[Callable]:
+        """Return one of the functions of this format, importing it on first use"""
+        if function not in self._functions:
+            reference = getattr(self, function)
+            if isinstance(reference, str):
+                reference = load_function(reference)
+            self._functions[function] = reference
+        return self._functions[function]
+
+    def __repr__(self) -> str:
+        return f"MetadataFormat({self.name!r})"
+
+
+def load_function(reference: str) -> Callable:
+    """Import a function given as "module:function" """
+    module, name = reference.split(":")
+    package = __package__ if module.startswith(".") else None
+    return getattr(import_module(module, package), name)
+
+
+CODEMETA_CONTEXT = (
+    "https://raw.githubusercontent.com/codemeta/codemeta/master/codemeta.jsonld"
+)
+FORMATS = {
+    fmt.name: fmt
+    for fmt in [
+        MetadataFormat(
+            "commonmeta",
+            sniff=lambda data: data.get("schema", "").startswith(
+                "https://commonmeta.org"
+            ),
+            parse="orjson:loads",
+            read=".readers.commonmeta_reader:read_commonmeta",
+            read_options=True,
+            write_item=".writers.commonmeta_writer:write_commonmeta_item",
+            write=".writers.commonmeta_writer:write_commonmeta",
+            parse_list="orjson:loads",
+            write_list=".writers.commonmeta_writer:write_commonmeta_list",
+            stream_list=".writers.commonmeta_writer:stream_commonmeta_list",
+        ),
+        MetadataFormat(
+            "schema_org",
+            sniff=lambda data: data.get("@context", None) == "http://schema.org",
+            fetch=".readers.schema_org_reader:get_schema_org",
+            fetch_async=".readers.schema_org_reader:get_schema_org_async",
+            parse="orjson:loads",
+            read=".readers.schema_org_reader:read_schema_org",
+            write=".writers.schema_org_writer:write_schema_org",
+            parse_list="orjson:loads",
+        ),
+        MetadataFormat(
+            "codemeta",
+            sniff=lambda data: data.get("@context", None) == CODEMETA_CONTEXT,
+            fetch=".readers.codemeta_reader:get_codemeta",
+            fetch_async=".readers.codemeta_reader:get_codemeta_async",
+            parse="orjson:loads",
+            read=".readers.codemeta_reader:read_codemeta",
+        ),
+        MetadataFormat(
+            "json_feed_item",
+            sniff=lambda data: data.get("guid", None) is not None,
+            fetch=".readers.json_feed_reader:get_json_feed_item",
+            fetch_async=".readers.json_feed_reader:get_json_feed_item_async",
+            parse="orjson:loads",
+            read=".readers.json_feed_reader:read_json_feed_item",
+            read_options=True,
+            parse_list="orjson:loads",
+        ),
+        MetadataFormat(
+            "datacite",
+            sniff=lambda data: data.get("schemaVersion", "").startswith(
+                "http://datacite.org/schema/kernel"
+            ),
+            fetch=".readers.datacite_reader:get_datacite",
+            fetch_async=".readers.datacite_reader:get_datacite_async",
+            parse="orjson:loads",
+            read=".readers.datacite_reader:read_datacite",
+            write_item=".writers.datacite_writer:write_datacite_item",
+            write=".writers.datacite_writer:write_datacite",
+            parse_list="orjson:loads",
+        ),
+        MetadataFormat(
+            "crossref",
+            sniff=lambda data: data.get("source", None) == "Crossref",
+            fetch=".readers.crossref_reader:get_crossref",
+            fetch_async=".readers.crossref_reader:get_crossref_async",
+            parse="orjson:loads",
+            read=".readers.crossref_reader:read_crossref",
+            parse_list="orjson:loads",
+        ),
+        MetadataFormat(
+            "csl",
+            sniff=lambda data: py_.get(data, "issued.date-parts") is not None,
+            parse="orjson:loads",
+            read=".readers.csl_reader:read_csl",
+            read_options=True,
+            write_item=".writers.csl_writer:write_csl_item",
+            write=".writers.csl_writer:write_csl",
+            parse_list="orjson:loads",
+            write_list=".writers.csl_writer:write_csl_list",
+            stream_list=".writers.csl_writer:stream_csl_list",
+        ),
+        MetadataFormat(
+            "inveniordm",
+            sniff=lambda data: py_.get(data, "conceptdoi") is not None,
+            fetch=".readers.inveniordm_reader:get_inveniordm",
+            fetch_async=".readers.inveniordm_reader:get_inveniordm_async",
+            parse="orjson:loads",
+            read=".readers.inveniordm_reader:read_inveniordm",
+            write=".writers.inveniordm_writer:write_inveniordm",
+        ),
+        MetadataFormat(
+            "kbase",
+            sniff=lambda data: py_.get(data, "credit_metadata") is not None,
+            parse="orjson:loads",
+            read=".readers.kbase_reader:read_kbase",
+        ),
+        MetadataFormat(
+            "op",
+            fetch=".readers.crossref_reader:get_crossref",
+            fetch_async=".readers.crossref_reader:get_crossref_async",
+            read=".readers.crossref_reader:read_crossref",
+        ),
+        MetadataFormat(
+            "crossref_xml",
+            fetch=".readers.crossref_xml_reader:get_crossref_xml",
+            fetch_async=".readers.crossref_xml_reader:get_crossref_xml_async",
+            parse=".readers.crossref_xml_reader:parse_crossref_xml",
+            read=".readers.crossref_xml_reader:read_crossref_xml",
+            write=".writers.crossref_xml_writer:write_crossref_xml",
+            write_options={"depositor": None, "email": None, "registrant": None},
+            iter_list=".readers.crossref_xml_reader:iter_crossref_xml_records",
+            write_list=".writers.crossref_xml_writer:write_crossref_xml_list",
+            stream_list=".writers.crossref_xml_writer:stream_crossref_xml_list",
+        ),
+        MetadataFormat(
+            "datacite_xml",
+            parse=".base_utils:parse_xml",
+            read=".readers.datacite_xml_reader:read_datacite_xml",
+            iter_list=".readers.datacite_xml_reader:iter_datacite_xml_records",
+        ),
+        MetadataFormat(
+            "cff",
+            fetch=".readers.cff_reader:get_cff",
+            fetch_async=".readers.cff_reader:get_cff_async",
+            parse="yaml:safe_load",
+            read=".readers.cff_reader:read_cff",
+        ),
+        MetadataFormat(
+            "ris",
+            read=".readers.ris_reader:read_ris",
+            write=".writers.ris_writer:write_ris",
+            iter_list=".readers.ris_reader:iter_ris_records",
+            write_list=".writers.ris_writer:write_ris_list",
+            stream_list=".writers.ris_writer:stream_ris_list",
+        ),
+        MetadataFormat(
+            "bibtex",
+            read=".readers.bibtex_reader:read_bibtex",
+            write=".writers.bibtex_writer:write_bibtex",
+            iter_list=".readers.bibtex_reader:iter_bibtex_records",
+            write_list=".writers.bibtex_writer:write_bibtex_list",
+            stream_list=".writers.bibtex_writer:stream_bibtex_list",
+        ),
+        MetadataFormat(
+            "citation",
+            write=".writers.citation_writer:write_citation",
+            write_options={"style": "apa", "locale": "en-US"},
+            write_list=".writers.citation_writer:write_citation_list",
+            stream_list=".writers.citation_writer:stream_citation_list",
+            list_options=True,
+        ),
+    ]
+}
+_entry_points_loaded = False
+_entry_points_lock = Lock()
+
+
+def register_format(fmt: MetadataFormat) -> None:
+    """Add a format, or replace the format with the same name"""
+    FORMATS[fmt.name] = fmt
+
+
+def format_entry_points() -> list:
+    """Entry points in the commonmeta.formats group"""
+    from importlib.metadata import entry_points
+
+    eps = entry_points()
+    if hasattr(eps, "select"):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    # Python 3.9 returns a dict of groups
+    return list(eps.get(ENTRY_POINT_GROUP, []))
+
+
+def load_entry_points() -> None:
+    """Register the formats of installed packages, given as entry points in the
+    commonmeta.formats group that point to a MetadataFormat. Formats that are
+    already registered are kept."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    with _entry_points_lock:
+        if _entry_points_loaded:
+            return
+        for entry_point in format_entry_points():
+            if entry_point.name not in FORMATS:
+                register_format(entry_point.load())
+        _entry_points_loaded = True
+
+
+def get_format(name: Optional[str]) -> Optional[MetadataFormat]:
+    """Return the format registered for a name, or None"""
+    fmt = FORMATS.get(name, None)
+    if fmt is None and name is not None and not _entry_points_loaded:
+        load_entry_points()
+        fmt = FORMATS.get(name, None)
+    return fmt
+
+
+def iter_formats():
+    """Yield all formats, including those from entry points"""
+    load_entry_points()
+    yield from list(FORMATS.values())
@@ -1,27 +1,89 @@
 """Schema utils for commonmeta-py"""
 from os import path
+from threading import Lock
+from typing import TYPE_CHECKING, Optional
 import orjson as json
-from jsonschema import Draft202012Validator, ValidationError
 
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
 
-def json_schema_errors(instance, schema: str = "commonmeta"):
-    """validate against JSON schema"""
-    schema_map = {
-        "commonmeta": "commonmeta_v0.16",
-        "datacite": "datacite-v4.5",
-        "crossref": "crossref-v0.2",
-        "csl": "csl-data",
-        "cff": "cff_v1.2.0",
-    }
-    try:
-        if schema not in schema_map.keys():
-            raise ValueError("No schema found")
-        file_path = path.join(
-            path.dirname(__file__), f"resources/{schema_map[schema]}.json"
-        )
+SCHEMA_MAP = {
+    "commonmeta": "commonmeta_v0.16",
+    "datacite": "datacite-v4.5",
+    "crossref": "crossref-v0.2",
+    "csl": "csl-data",
+    "cff": "cff_v1.2.0",
+}
+
+SCHEMA_FILES = [
+    "commonmeta_v0.12",
+    "commonmeta_v0.13",
+    "commonmeta_v0.14",
+    "commonmeta_v0.15",
+    "commonmeta_v0.16",
+    "datacite-v4.5",
+    "crossref-v0.2",
+    "csl-data",
+    "cff_v1.2.0",
+]
+
+# compiled validators are shared by all threads, keyed by schema file name
+_validators: dict = {}
+_validators_lock = Lock()
+_validators_stats = {"hits": 0, "misses": 0}
+
+
+def get_schema_validator(schema: str = "commonmeta") -> "Draft202012Validator":
+    """Return the compiled validator for a schema name or schema file name.
+    The schema file is read and checked only the first time it is requested."""
+    name = SCHEMA_MAP.get(schema, schema)
+    if name not in SCHEMA_FILES:
+        raise ValueError("No schema found")
+    validator = _validators.get(name, None)
+    if validator is not None:
+        _validators_stats["hits"] += 1
+        return validator
+    with _validators_lock:
+        # another thread may have compiled the schema while we waited
+        validator = _validators.get(name, None)
+        if validator is not None:
+            _validators_stats["hits"] += 1
+            return validator
+        from jsonschema import Draft202012Validator
+
+        file_path = path.join(path.dirname(__file__), f"resources/{name}.json")
         with open(file_path, encoding="utf-8") as file:
             string = file.read()
-            schema = json.loads(string)
-        return Draft202012Validator(schema).validate(instance)
+        schema_dict = json.loads(string)
+        Draft202012Validator.check_schema(schema_dict)
+        validator = Draft202012Validator(schema_dict)
+        _validators[name] = validator
+        _validators_stats["misses"] += 1
+        return validator
+
+
+def schema_cache_info() -> dict:
+    """Return hits, misses and size of the schema validator registry"""
+    return {
+        "hits": _validators_stats["hits"],
+        "misses": _validators_stats["misses"],
+        "size": len(_validators),
+    }
+
+
+def clear_schema_cache() -> None:
+    """Remove all compiled validators and reset the counters"""
+    with _validators_lock:
+        _validators.clear()
+        _validators_stats["hits"] = 0
+        _validators_stats["misses"] = 0
+
+
+def json_schema_errors(instance, schema: str = "commonmeta") -> Optional[str]:
+    """validate against JSON schema"""
+    from jsonschema import ValidationError
+
+    try:
+        return get_schema_validator(schema).validate(instance)
     except ValidationError as error:
         return error.message
@@ -1,45 +1,55 @@
-"""Web translators for commonmeta. Using BeautifulSoup to extract metadata from web pages."""
+"""Web translators for commonmeta. Extract site-specific metadata from web pages."""
 
 from furl import furl
 import re
 
 from .doi_utils import doi_as_url
 
+# hosts with metadata outside of the head, the full page has to be read
+BODY_TRANSLATOR_HOSTS = ["datacite.org", "app.pan.pl"]
 
-def web_translator(soup, url: str):
-    """Extract metadata from web pages"""
+
+def web_translator(meta, url: str):
+    """Extract metadata from web pages, given as HtmlMeta"""
     f = furl(url)
     if f.host == "arxiv.org":
-        return arxiv_translator(soup)
+        return arxiv_translator(meta)
     elif f.host == "datacite.org":
-        return datacite_translator(soup)
+        return datacite_translator(meta)
     elif f.host == "app.pan.pl":
-        return pan_translator(soup)
+        return pan_translator(meta)
     return {}
 
 
-def arxiv_translator(soup):
+def needs_body(url: str) -> bool:
+    """Whether the web translator for the url needs the page body"""
+    return furl(url).host in BODY_TRANSLATOR_HOSTS
+
+
+def arxiv_translator(meta):
     """Extract metadata from arXiv. Find the DOI and return it."""
-    arxiv_id = soup.select_one("meta[name='citation_arxiv_id']")
+    arxiv_id = meta.get("name", "citation_arxiv_id")
     if arxiv_id is None:
         return {}
-    return {"@id": f"https://doi.org/10.48550/arXiv.{arxiv_id['content']}"}
+    return {"@id": f"https://doi.org/10.48550/arXiv.{arxiv_id}"}
 
 
-def datacite_translator(soup):
+def datacite_translator(meta):
     """Extract metadata from DataCite blog posts. Find the DOI and return it."""
-    doi = soup.select_one("div#citation")
+    doi = meta.soup().select_one("div#citation")
     if doi is None:
         return {}
     return {"@id": doi.get("data-doi", None)}
 
 
-def pan_translator(soup):
+def pan_translator(meta):
     """Extract metadata from Acta Palaeontologica Polonica. Find the DOI and return it."""
-    caption = soup.select_one("p.caption div.vol").text
+    caption = meta.soup().select_one("p.caption div.vol")
+    if caption is None:
+        return {}
     match = re.search(
         r"doi:(10\.4202/.+)\Z",
-        caption,
+        caption.text,
     )
     if match is None:
         return {}
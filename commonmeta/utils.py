@@ -4,18 +4,50 @@ import os
 import orjson as json
 import re
 import time
+from threading import Lock
 from typing import Optional
 from urllib.parse import urlparse
 import yaml
 from furl import furl
-import bibtexparser
-from bs4 import BeautifulSoup
 from pydash import py_
-import pycountry
 
 from .base_utils import wrap, compact, parse_attributes
-from .doi_utils import normalize_doi, doi_from_url, get_doi_ra, validate_doi, doi_as_url
+from .doi_utils import (
+    normalize_doi,
+    doi_from_url,
+    get_doi_ra,
+    get_doi_ra_async,
+    validate_doi,
+    doi_as_url,
+)
 from .constants import DATACITE_CONTRIBUTOR_TYPES
+from .registry import iter_formats
+
+# number of characters looked at to find the format of a string
+SNIFF_LENGTH = 4096
+XML_ROOT_REGEX = re.compile(
+    r"\A(?:\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>]*>)*<([A-Za-z_][\w:.-]*)",
+    re.DOTALL | re.IGNORECASE,
+)
+# bibtexparser.bibdatabase.STANDARD_TYPES, without importing bibtexparser
+BIBTEX_TYPES = [
+    "article",
+    "book",
+    "booklet",
+    "conference",
+    "inbook",
+    "incollection",
+    "inproceedings",
+    "manual",
+    "mastersthesis",
+    "misc",
+    "phdthesis",
+    "proceedings",
+    "techreport",
+    "unpublished",
+]
+BIBTEX_TYPE_REGEX = re.compile(r"\A@(" + "|".join(BIBTEX_TYPES) + r")\s*[{(]")
+CFF_VERSION_REGEX = re.compile(r"^cff-version:", re.MULTILINE)
 
 
 NORMALIZED_LICENSES = {
@@ -73,6 +105,9 @@ UNKNOWN_INFORMATION = {
     ":etal": "too numerous to list (et alia)",
 }
 
+_spdx_index: Optional[tuple] = None
+_spdx_lock = Lock()
+
 HTTP_SCHEME = "http://"
 HTTPS_SCHEME = "https://"
 
@@ -415,26 +450,51 @@ def normalize_issn(string, **kwargs):
     return None
 
 
+def get_spdx_index() -> tuple:
+    """Index SPDX licenses by casefolded id and by url, loading licenses.json
+    only once. Entries keep their position to preserve first-match order.
+    Short Creative Commons urls from NORMALIZED_LICENSES are included."""
+    global _spdx_index
+    if _spdx_index is not None:
+        return _spdx_index
+    with _spdx_lock:
+        if _spdx_index is not None:
+            return _spdx_index
+        file_path = os.path.join(
+            os.path.dirname(__file__), "resources", "spdx", "licenses.json"
+        )
+        with open(file_path, encoding="utf-8") as file:
+            spdx = json.loads(file.read()).get("licenses")
+        ids: dict = {}
+        urls: dict = {}
+        for position, lic in enumerate(spdx):
+            entry = (position, lic)
+            ids.setdefault(lic["licenseId"].casefold(), entry)
+            urls.setdefault(lic["seeAlso"][0], entry)
+        for url, normalized_url in NORMALIZED_LICENSES.items():
+            if normalized_url in urls:
+                urls.setdefault(url, urls[normalized_url])
+        _spdx_index = (ids, urls)
+    return _spdx_index
+
+
 def dict_to_spdx(dct: dict) -> dict:
     """Convert a dict to SPDX"""
     dct.update({"url": normalize_cc_url(dct.get("url", None))})
-    file_path = os.path.join(
-        os.path.dirname(__file__), "resources", "spdx", "licenses.json"
-    )
-    with open(file_path, encoding="utf-8") as file:
-        string = file.read()
-        spdx = json.loads(string).get("licenses")
-    license_ = next(
-        (
-            lic
-            for lic in spdx
-            if lic["licenseId"].casefold() == dct.get("id", "").casefold()
-            or lic["seeAlso"][0] == dct.get("url", None)
-        ),
-        None,
-    )
-    if license_ is None:
+    ids, urls = get_spdx_index()
+    _id = dct.get("id", None)
+    # licenses matching id or url, the first one in licenses.json wins
+    matches = [
+        m
+        for m in [
+            ids.get(_id.casefold(), None) if isinstance(_id, str) else None,
+            urls.get(dct.get("url", None), None),
+        ]
+        if m is not None
+    ]
+    if len(matches) == 0:
         return compact(dct)
+    license_ = min(matches, key=lambda m: m[0])[1]
     #   license = spdx.find do |l|
     #     l['licenseId'].casecmp?(hsh['rightsIdentifier']) || l['seeAlso'].first == normalize_cc_url(hsh['rightsUri']) || l['name'] == hsh['rights'] || l['seeAlso'].first == normalize_cc_url(hsh['rights'])
     #   end
@@ -730,6 +790,19 @@ def find_from_format_by_id(pid: str) -> Optional[str]:
     doi = validate_doi(pid)
     if doi and (registration_agency := get_doi_ra(doi)) is not None:
         return registration_agency.lower()
+    return find_from_format_by_url(pid)
+
+
+async def find_from_format_by_id_async(pid: str, client=None) -> Optional[str]:
+    """Find reader from format by id with an async client"""
+    doi = validate_doi(pid)
+    if doi and (registration_agency := await get_doi_ra_async(doi, client)) is not None:
+        return registration_agency.lower()
+    return find_from_format_by_url(pid)
+
+
+def find_from_format_by_url(pid: str) -> Optional[str]:
+    """Find reader from format by url, for ids that are not registered DOIs"""
     if (
         re.match(r"\A(http|https):/(/)?github\.com/(.+)/CITATION.cff\Z", pid)
         is not None
@@ -787,36 +860,130 @@ def find_from_format_by_dict(dct: dict) -> Optional[str]:
 
 def find_from_format_by_string(string: str) -> Optional[str]:
     """Find reader from format by string"""
+    return sniff_format(string)[0]
+
+
+def sniff_format(string) -> tuple:
+    """Find reader from format by looking at the start of a string (or bytes),
+    parsing the full string only for JSON and CFF, or when the start is ambiguous.
+    Returns the format and the parsed JSON or YAML data, if any."""
     if string is None:
+        return None, None
+    head = string[:SNIFF_LENGTH]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+    head = head.lstrip("\ufeff \t\r\n")
+    if head.startswith(("{", "[")):
+        try:
+            data = json.loads(strip_bom(string))
+        except json.JSONDecodeError:
+            return find_from_format_by_parsing(string), None
+        if isinstance(data, dict) and data.get("cff-version", None):
+            return "cff", data
+        return find_from_format_by_json(data), data
+    via = sniff_records_format(head)
+    if via is not None:
+        return via, None
+    if head.startswith("<"):
+        root = xml_root_name(head)
+        if root == "html":
+            return find_from_format_by_html(string), None
+        return find_from_format_by_parsing(string), None
+    if CFF_VERSION_REGEX.search(head):
+        try:
+            data = yaml.safe_load(string)
+            if isinstance(data, dict) and data.get("cff-version", None):
+                return "cff", data
+        except yaml.YAMLError:
+            pass
+    return find_from_format_by_parsing(string), None
+
+
+def sniff_records_format(string) -> Optional[str]:
+    """Find the reader of formats that can hold several records, i.e. XML,
+    RIS and BibTeX, from the start of a string (or bytes)"""
+    head = string[:SNIFF_LENGTH]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+    head = head.lstrip("\ufeff \t\r\n")
+    if head.startswith("<"):
+        return sniff_xml_format(head)
+    if head.startswith("TY  - "):
+        return "ris"
+    if BIBTEX_TYPE_REGEX.match(head):
+        return "bibtex"
+    return None
+
+
+def sniff_xml_format(string) -> Optional[str]:
+    """Find XML reader from the root element at the start of a string (or
+    bytes). OAI-PMH harvests are read if they contain DataCite metadata."""
+    head = string[:SNIFF_LENGTH]
+    if isinstance(head, bytes):
+        head = head.decode("utf-8", errors="ignore")
+    head = head.lstrip("\ufeff")
+    root = xml_root_name(head)
+    if root in ["crossref_result", "doi_records", "doi_record"]:
+        return "crossref_xml"
+    if root in ["resource", "resources"]:
+        return "datacite_xml"
+    if root == "oai-pmh" and "datacite" in head:
+        return "datacite_xml"
+    return None
+
+
+def strip_bom(string):
+    """Remove a UTF-8 byte order mark from the start of a string or bytes"""
+    if isinstance(string, bytes):
+        return string[3:] if string.startswith(b"\xef\xbb\xbf") else string
+    return string[1:] if string.startswith("\ufeff") else string
+
+
+def xml_root_name(string: str) -> Optional[str]:
+    """Local name of the root element, skipping declarations and comments"""
+    match = XML_ROOT_REGEX.match(string)
+    if match is None:
+        return None
+    return match.group(1).split(":")[-1].lower()
+
+
+def find_from_format_by_json(data) -> Optional[str]:
+    """Find reader from format by parsed JSON, lists by their first item"""
+    if not isinstance(data, dict):
         return None
+    item = data["items"][0] if data.get("items", None) else data
+    for fmt in iter_formats():
+        if fmt.sniff is not None and (fmt.sniff(data) or fmt.sniff(item)):
+            return fmt.name
+    return None
+
+
+def find_from_format_by_html(string) -> Optional[str]:
+    """Find reader from format by HTML"""
+    from bs4 import BeautifulSoup
+
+    try:
+        data = BeautifulSoup(string, "html.parser")
+        if (
+            data.find("script", type="application/ld+json")
+            or data.find("meta", {"name": "citation_doi"})
+            or data.find("meta", {"name": "dc.identifier"})
+        ):
+            return "schema_org"
+    except ValueError:
+        pass
+    return None
+
+
+def find_from_format_by_parsing(string) -> Optional[str]:
+    """Find reader from format by trying all parsers on the full string"""
+    from bs4 import BeautifulSoup
+
     try:
         data = json.loads(string)
         if not isinstance(data, dict):
             raise TypeError
-        if data.get("schema", "").startswith("https://commonmeta.org"):
-            return "commonmeta"
-        if data.get("items", None) is not None:
-            data = data["items"][0]
-        if data.get("@context", None) == "http://schema.org":
-            return "schema_org"
-        if data.get("@context", None) in [
-            "https://raw.githubusercontent.com/codemeta/codemeta/master/codemeta.jsonld"
-        ]:
-            return "codemeta"
-        if data.get("guid", None) is not None:
-            return "json_feed_item"
-        if data.get("schemaVersion", "").startswith(
-            "http://datacite.org/schema/kernel"
-        ):
-            return "datacite"
-        if data.get("source", None) == "Crossref":
-            return "crossref"
-        if py_.get(data, "issued.date-parts") is not None:
-            return "csl"
-        if py_.get(data, "conceptdoi") is not None:
-            return "inveniordm"
-        if py_.get(data, "credit_metadata") is not None:
-            return "kbase"
+        return find_from_format_by_json(data)
     except (TypeError, json.JSONDecodeError):
         pass
     try:
@@ -827,16 +994,8 @@ def find_from_format_by_string(string: str) -> Optional[str]:
             return "datacite_xml"
     except ValueError:
         pass
-    try:
-        data = BeautifulSoup(string, "html.parser")
-        if (
-            data.find("script", type="application/ld+json")
-            or data.find("meta", {"name": "citation_doi"})
-            or data.find("meta", {"name": "dc.identifier"})
-        ):
-            return "schema_org"
-    except ValueError:
-        pass
+    if find_from_format_by_html(string) is not None:
+        return "schema_org"
     try:
         data = yaml.safe_load(string)
         if data.get("cff-version", None):
@@ -844,9 +1003,11 @@ def find_from_format_by_string(string: str) -> Optional[str]:
     except (yaml.YAMLError, AttributeError):
         pass
 
+    if isinstance(string, bytes):
+        string = string.decode("utf-8", errors="ignore")
     if string.startswith("TY  - "):
         return "ris"
-    if any(string.startswith(f"@{t}") for t in bibtexparser.bibdatabase.STANDARD_TYPES):
+    if any(string.startswith(f"@{t}") for t in BIBTEX_TYPES):
         return "bibtex"
 
     # no format found
@@ -1182,6 +1343,8 @@ def get_language(lang: str, format: str = "alpha_2") -> Optional[str]:
     """
     if not lang:
         return None
+    import pycountry
+
     if len(lang) == 2:
         language = pycountry.languages.get(alpha_2=lang)
     elif len(lang) == 3:
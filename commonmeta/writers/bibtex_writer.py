@@ -147,3 +147,19 @@ def write_bibtex_list(metalist):
     for month_name in MONTH_SHORT_NAMES:
         bibtex_str = bibtex_str.replace(f"{{{month_name}}}", month_name)
     return bibtex_str
+
+
+def stream_bibtex_list(metalist):
+    """Write bibtex list one entry at a time. Entries are written in the
+    order of the list, not sorted by key as in write_bibtex_list."""
+    writer = BibTexWriter()
+    writer.common_strings = True
+    writer.indent = "    "
+    writer.order_entries_by = None
+    for index, item in enumerate(metalist.iter_items()):
+        bib_database = BibDatabase()
+        bib_database.entries = [page_double_hyphen(write_bibtex_item(item))]
+        bibtex_str = writer.write(bib_database)
+        for month_name in MONTH_SHORT_NAMES:
+            bibtex_str = bibtex_str.replace(f"{{{month_name}}}", month_name)
+        yield bibtex_str if index == 0 else writer.entry_separator + bibtex_str
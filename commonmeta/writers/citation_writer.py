@@ -1,12 +1,55 @@
 """Citation writer for commonmeta-py"""
-import orjson as json
 import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from os import path
+from threading import Lock
+from typing import Optional
 from pydash import py_
 from citeproc import CitationStylesStyle, CitationStylesBibliography
 from citeproc import Citation, CitationItem
 from citeproc import formatter
 from citeproc.source.json import CiteProcJSON
-from citeproc_styles import get_style_filepath
+from citeproc_styles import get_style_filepath, StyleNotFoundError
+
+from ..cache_utils import LRUCache
+
+# parsed styles are shared by all threads, keyed by (style, locale)
+STYLE_CACHE = LRUCache(maxsize=32)
+_style_lock = Lock()
+
+
+def get_style_path(style: str) -> str:
+    """Path of a CSL style file, from citeproc-py-styles or the styles
+    bundled with commonmeta-py"""
+    try:
+        return get_style_filepath(style)
+    except StyleNotFoundError:
+        style_path = path.join(
+            path.dirname(__file__), "..", "resources", "styles", f"{style}.csl"
+        )
+        if path.exists(style_path):
+            return style_path
+        raise
+
+
+def get_citation_style(
+    style: str = "apa", locale: str = "en-US"
+) -> CitationStylesStyle:
+    """Return the parsed CSL style for a style and locale. Style and locale
+    files are parsed only the first time a combination is requested."""
+    key = (style, locale)
+    citation_style = STYLE_CACHE.get(key)
+    if citation_style is not None:
+        return citation_style
+    with _style_lock:
+        # another thread may have parsed the style while we waited. This
+        # isn't counted, the miss above already was.
+        citation_style = STYLE_CACHE.peek(key)
+        if citation_style is None:
+            citation_style = CitationStylesStyle(get_style_path(style), locale=locale)
+            STYLE_CACHE.set(key, citation_style)
+        return citation_style
 
 
 def write_citation(metadata):
@@ -14,8 +57,7 @@ def write_citation(metadata):
 
     # Process the JSON data to generate a citeproc-py BibliographySource.
     item = write_citation_item(metadata)
-    style_path = get_style_filepath(metadata.style)
-    style = CitationStylesStyle(style_path, locale=metadata.locale)
+    style = get_citation_style(metadata.style, metadata.locale)
     bib = CitationStylesBibliography(style, item, formatter.html)
     citation = Citation([CitationItem(metadata.id)])
 
@@ -30,37 +72,113 @@ def write_citation(metadata):
 
 def write_citation_item(metadata):
     """Write citation item"""
+    csl = write_citation_csl(metadata)
+    if csl is None:
+        return None
+    return CiteProcJSON([csl])
+
+
+def write_citation_csl(metadata):
+    """CSL item for citeproc-py, or None if there are write errors"""
     if metadata.write_errors is not None:
         return None
-    csl = json.loads(metadata.write(to="csl"))
+    csl = metadata.write_item(to="csl", copy=False)
+    if csl is None:
+        return None
 
     # Remove keys that are not supported by citeproc-py.
-    csl = py_.omit(csl, "copyright", "categories")
-    return CiteProcJSON([csl])
+    return py_.omit(csl, "copyright", "categories")
+
+
+class NumberedCitationItem(CitationItem):
+    """Citation item with a fixed citation number, so that chunks of a
+    bibliography are numbered as one, and numbers aren't looked up by
+    position in the bibliography for every item"""
+
+    def __init__(self, key, number: int):
+        super().__init__(key)
+        self._number = number
+
+    @property
+    def number(self):
+        return self._number
+
+
+def render_citations(
+    csl_items: list,
+    style: str = "apa",
+    locale: str = "en-US",
+    start: int = 1,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> dict:
+    """Render CSL items as one bibliography, numbered from start, and return
+    the citations by id. With workers, chunks of chunk_size items are
+    rendered in parallel processes."""
+    if workers is not None and workers > 1 and len(csl_items) > chunk_size:
+        starts = range(start, start + len(csl_items), chunk_size)
+        chunks = [csl_items[i - start : i - start + chunk_size] for i in starts]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                render_citations, chunks, repeat(style), repeat(locale), starts
+            )
+            return {k: v for result in results for k, v in result.items()}
+
+    citation_style = get_citation_style(style, locale)
+    items = {}
+    for csl in csl_items:
+        if csl.get("id", None) is not None and csl["id"] not in items:
+            items[csl["id"]] = csl
+    bib = CitationStylesBibliography(
+        citation_style, CiteProcJSON(items.values()), formatter.html
+    )
+    cites = [NumberedCitationItem(_id, start + n) for n, _id in enumerate(items)]
+    bib.register(Citation(cites))
+    citations = {}
+    for _id, cite in zip(items, cites):
+        text = citation_style.render_bibliography([cite])
+        citations[_id] = _clean_result(str(text[0])) if text else None
+    return citations
 
 
 def write_citation_list(metalist, **kwargs):
     """Write citation list"""
     if metalist is None:
         return None
+    return "".join(stream_citation_list(metalist, **kwargs))
+
 
+def stream_citation_list(metalist, chunk_size: int = 1000, **kwargs):
+    """Write citation list, rendering chunk_size items at a time as one
+    bibliography"""
     style = kwargs.get("style", "apa")
     locale = kwargs.get("locale", "en-US")
-    style_path = get_style_filepath(style)
-    style = CitationStylesStyle(style_path, locale=locale)  #
-
-    def format_citation(index, item):
-        bib = CitationStylesBibliography(style, item, formatter.html)
-        _id = metalist.items[index].id
-        citation = Citation([CitationItem(_id)])
-        bib.register(citation)
-        return _clean_result(str(bib.bibliography()[0]))
+    workers = kwargs.get("workers", None)
 
-    citations = [write_citation_item(item) for item in metalist.items]
-    bibliographies = [
-        format_citation(index, item) for index, item in enumerate(citations)
-    ]
-    return "\n\n".join(bibliographies)
+    # with workers, read enough items to keep all workers busy
+    batch_size = chunk_size * (workers or 1)
+    start = 1
+    first = True
+    items = metalist.iter_items()
+    while True:
+        chunk = [*islice(items, batch_size)]
+        if not chunk:
+            return
+        csl_items = [write_citation_csl(item) for item in chunk]
+        citations = render_citations(
+            [i for i in csl_items if i is not None],
+            style=style,
+            locale=locale,
+            start=start,
+            workers=workers,
+            chunk_size=chunk_size,
+        )
+        for item in chunk:
+            citation = citations.get(item.id, None)
+            if citation is not None:
+                yield citation if first else "\n\n" + citation
+                first = False
+        start += len(citations)
 
 
 def _clean_result(text):
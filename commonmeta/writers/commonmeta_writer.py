@@ -1,18 +1,26 @@
 """Commonmeta writer for commonmeta-py"""
 
+from typing import Optional
 import orjson as json
-import orjsonl
 import pydash as py_
-from ..base_utils import compact
+from ..base_utils import compact, write_chunks
 
 
 def write_commonmeta(metadata):
     """Write commonmeta"""
+    item = metadata.write_item("commonmeta", copy=False)
+    if item is None:
+        return None
+    return json.dumps(item, option=json.OPT_INDENT_2)
+
+
+def write_commonmeta_item(metadata) -> Optional[dict]:
+    """Write commonmeta item"""
     if metadata is None:
         return None
 
     data = py_.omit(
-        vars(metadata),
+        public_vars(metadata),
         [
             "via",
             "is_valid",
@@ -32,7 +40,12 @@ def write_commonmeta(metadata):
             "funding_references": "fundingReferences",
         },
     )
-    return json.dumps(compact(data), option=json.OPT_INDENT_2)
+    return compact(data)
+
+
+def public_vars(metadata) -> dict:
+    """Instance attributes without private state such as validation settings"""
+    return {k: v for k, v in vars(metadata).items() if not k.startswith("_")}
 
 
 def write_commonmeta_list(metalist):
@@ -41,28 +54,40 @@ def write_commonmeta_list(metalist):
     if metalist is None:
         return None
 
+    if metalist.filename and metalist.filename.rsplit(".", 1)[1] in ["jsonl", "json"]:
+        with open(metalist.filename, "w", encoding="utf-8") as file:
+            write_chunks(
+                stream_commonmeta_list(metalist, jsonlines=metalist.jsonlines), file
+            )
+        return metalist.filename
+    else:
+        return "".join(stream_commonmeta_list(metalist, jsonlines=False))
+
+
+def stream_commonmeta_list(metalist, jsonlines: Optional[bool] = None):
+    """Write commonmeta list one item at a time, optionally as JSON Lines.
+    Uses the jsonlines option of the list if jsonlines is not given."""
+    if jsonlines is None:
+        jsonlines = getattr(metalist, "jsonlines", False)
+
     def format_item(item):
         """Format item for commonmeta list"""
-        item = py_.omit(vars(item), ["via", "is_valid"])
-        return compact(item)
+        item = py_.omit(public_vars(item), ["via", "is_valid"])
+        return json.dumps(compact(item)).decode("utf-8")
+
+    if jsonlines:
+        for item in metalist.iter_items():
+            yield format_item(item) + "\n"
+        return
 
-    items = [format_item(item) for item in metalist.items]
-    output = compact(
+    head = compact(
         {
             "id": metalist.id,
             "title": metalist.title,
             "description": metalist.description,
-            "items": items,
         }
     )
-
-    if metalist.filename and metalist.filename.rsplit(".", 1)[1] in ["jsonl", "json"]:
-        if metalist.jsonlines:
-            orjsonl.save(metalist.filename, items)
-        else:
-            json_output = json.dumps(output).decode("utf-8")
-            with open(metalist.filename, "w") as file:
-                file.write(json_output)
-        return metalist.filename
-    else:
-        return json.dumps(output).decode("utf-8")
+    yield json.dumps(head).decode("utf-8")[:-1] + ("," if head else "") + '"items":['
+    for index, item in enumerate(metalist.iter_items()):
+        yield format_item(item) if index == 0 else "," + format_item(item)
+    yield "]}"
@@ -1,17 +1,77 @@
 """Crossref XML writer for commonmeta-py"""
+from itertools import chain
+from os import path
 from typing import Optional
-from ..constants import Commonmeta
-from ..crossref_utils import generate_crossref_xml, generate_crossref_xml_list
+from ..constants import Commonmeta, CM_TO_CR_TRANSLATIONS
+from ..doi_utils import doi_from_url
+from ..schema_utils import json_schema_errors
+from ..crossref_utils import (
+    generate_crossref_xml,
+    generate_crossref_xml_list,
+    generate_crossref_xml_batch,
+    crossref_list_head,
+    crossref_works,
+)
 
 
 def write_crossref_xml(metadata: Commonmeta) -> Optional[str]:
-    """Write Crossref XML"""
+    """Write Crossref XML, after validating the required DOI, type and url"""
+    instance = {
+        "doi": doi_from_url(metadata.id),
+        "type": CM_TO_CR_TRANSLATIONS.get(metadata.type, None),
+        "url": metadata.url,
+    }
+    metadata.write_errors = json_schema_errors(instance, schema="crossref")
     return generate_crossref_xml(metadata)
 
 
 def write_crossref_xml_list(metalist):
-    """Write crossref_xml list"""
+    """Write crossref_xml list, skipping invalid items"""
     if metalist is None:
         return None
 
     return generate_crossref_xml_list(metalist)
+
+
+def stream_crossref_xml_list(metalist):
+    """Write crossref_xml list one work at a time, skipping invalid items"""
+    works = crossref_works(metalist)
+    for chunk in generate_crossref_xml_batch(works, crossref_list_head(metalist)):
+        yield chunk.decode("utf-8")
+
+
+def write_crossref_xml_batches(
+    metalist,
+    filename: str,
+    max_records: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> list:
+    """Write crossref_xml list to numbered batch files (e.g. deposit-1.xml,
+    deposit-2.xml for filename deposit.xml) with at most max_records works
+    or max_size bytes each, skipping invalid items. Returns the filenames."""
+    if metalist is None:
+        return []
+    root, ext = path.splitext(filename)
+    works = crossref_works(metalist)
+    filenames = []
+    work = next(works, None)
+    while work is not None:
+        batch_filename = f"{root}-{len(filenames) + 1}{ext or '.xml'}"
+        batch = generate_crossref_xml_batch(
+            chain([work], works),
+            crossref_list_head(metalist),
+            max_records=max_records,
+            max_size=max_size,
+        )
+        with open(batch_filename, "wb") as file:
+            # the batch returns the first work that didn't fit
+            while True:
+                try:
+                    file.write(next(batch))
+                except StopIteration as stop:
+                    work = stop.value
+                    break
+        filenames.append(batch_filename)
+        if work is None:
+            work = next(works, None)
+    return filenames
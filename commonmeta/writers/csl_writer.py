@@ -11,7 +11,7 @@ from ..constants import CM_TO_CSL_TRANSLATIONS, Commonmeta
 
 def write_csl(metadata: Commonmeta) -> Optional[str]:
     """Write CSL-JSON"""
-    item = write_csl_item(metadata)
+    item = metadata.write_item("csl", copy=False)
     if item is None:
         return None
     return json.dumps(item)
@@ -77,5 +77,14 @@ def write_csl_list(metalist):
     """Write CSL-JSON list"""
     if metalist is None:
         return None
-    items = [write_csl_item(item) for item in metalist.items]
-    return json.dumps(items)
+    return "".join(stream_csl_list(metalist))
+
+
+def stream_csl_list(metalist):
+    """Write CSL-JSON list one item at a time"""
+    yield "["
+    for index, item in enumerate(metalist.iter_items()):
+        if index > 0:
+            yield ","
+        yield json.dumps(write_csl_item(item)).decode("utf-8")
+    yield "]"
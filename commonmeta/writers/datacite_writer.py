@@ -17,8 +17,16 @@ from ..constants import (
 
 def write_datacite(metadata: Commonmeta) -> Optional[Union[str, dict]]:
     """Write datacite. Make sure JSON Schema validates before writing"""
-    if metadata.write_errors is not None:
+    item = metadata.write_item("datacite", copy=False)
+    if item is None or metadata.write_errors is not None:
         return "{}"
+    return json.dumps(item)
+
+
+def write_datacite_item(metadata: Commonmeta) -> Optional[dict]:
+    """Write datacite item"""
+    if metadata.write_errors is not None:
+        return None
 
     alternate_identifiers = [
         {
@@ -113,7 +121,7 @@ def write_datacite(metadata: Commonmeta) -> Optional[Union[str, dict]]:
         for i in wrap(metadata.descriptions)
     ]
 
-    data = compact(
+    return compact(
         {
             "id": metadata.id,
             "doi": doi_from_url(metadata.id),
@@ -137,7 +145,6 @@ def write_datacite(metadata: Commonmeta) -> Optional[Union[str, dict]]:
             "schemaVersion": "http://datacite.org/schema/kernel-4",
         }
     )
-    return json.dumps(data)
 
 
 def to_datacite_creator(creator: dict) -> dict:
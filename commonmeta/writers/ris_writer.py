@@ -54,5 +54,12 @@ def write_ris_list(metalist):
     """Write RIS list"""
     if metalist is None:
         return None
-    items = [write_ris(item) for item in metalist.items]
-    return "\r\n\r\n".join(items)
+    return "".join(stream_ris_list(metalist))
+
+
+def stream_ris_list(metalist):
+    """Write RIS list one item at a time"""
+    for index, item in enumerate(metalist.iter_items()):
+        if index > 0:
+            yield "\r\n\r\n"
+        yield write_ris(item)
@@ -7,6 +7,7 @@ from commonmeta.author_utils import (
     get_authors,
     get_affiliations,
     is_personal_name,
+    AUTHOR_CACHE,
 )
 from commonmeta.base_utils import wrap
 
@@ -369,3 +370,40 @@ def test_is_personal_name():
     assert False is is_personal_name("DH Lab")
     assert False is is_personal_name("Make Data Count")
     assert False is is_personal_name("BJPS Reviewers")
+
+
+def test_one_author_cached():
+    "parsed authors are cached by raw input"
+    AUTHOR_CACHE.clear()
+    author = {"name": "Benjamin Ollomo"}
+    assert get_one_author(author) == {
+        "type": "Person",
+        "contributorRoles": ["Author"],
+        "givenName": "Benjamin",
+        "familyName": "Ollomo",
+    }
+    result = get_one_author({"name": "Benjamin Ollomo"})
+    assert AUTHOR_CACHE.cache_info()["hits"] == 1
+    # every call returns a new dict
+    result["givenName"] = "B."
+    assert get_one_author(author)["givenName"] == "Benjamin"
+    # via is part of the key
+    assert get_one_author({"name": "Ollomo"}, via="crossref")["type"] == "Organization"
+    assert AUTHOR_CACHE.cache_info()["misses"] == 2
+
+
+def test_get_authors_deduplicated():
+    "repeated authors are parsed once and removed"
+    AUTHOR_CACHE.clear()
+    authors = [{"given": "Martin", "family": "Fenner"}, {"name": "Team Alpha"}] * 500
+    assert get_authors(authors) == [
+        {
+            "type": "Person",
+            "contributorRoles": ["Author"],
+            "givenName": "Martin",
+            "familyName": "Fenner",
+        },
+        {"type": "Organization", "contributorRoles": ["Author"], "name": "Team Alpha"},
+    ]
+    assert AUTHOR_CACHE.cache_info()["misses"] == 2
+    assert AUTHOR_CACHE.cache_info()["hits"] == 0
@@ -1,7 +1,9 @@
 # pylint: disable=invalid-name
 """Test base utils"""
-import pytest  # noqa: F401
+import pytest
 from os import path
+import timeit
+import orjson as json
 import pydash as py_
 
 from commonmeta.base_utils import (
@@ -12,6 +14,9 @@ from commonmeta.base_utils import (
     unwrap,
     sanitize,
     parse_xml,
+    compile_path,
+    iterparse_xml,
+    clear_xml_element,
 )
 
 
@@ -113,3 +118,59 @@ def test_parse_xml_crossref():
         )
         == "10.7554/eLife.01567"
     )
+
+
+def test_clear_xml_element():
+    "elements read with iterparse are freed, nodes before the root are kept"
+    string = (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<?xml-stylesheet type="text/xsl" href="oai2.xsl"?>\n'
+        "<root><record>1</record><record>2</record><record>3</record></root>"
+    )
+    texts = []
+    for element in iterparse_xml(string, tag="record"):
+        texts.append(element.text)
+        clear_xml_element(element)
+        assert element.getprevious() is None
+    assert texts == ["1", "2", "3"]
+
+
+def test_compile_path():
+    "same values as py_.get"
+    data = {
+        "a": {"b": [{"c": 1}, {"c": None}], "0": "zero", "journal:journal": {"x": 2}}
+    }
+    for path_, default in [
+        ("a.b.0.c", None),
+        ("a.b[1].c", 5),
+        ("a.b[-1].c", None),
+        ("a.b[2].c", "missing"),
+        ("a.0", None),
+        ("a.journal:journal.x", None),
+        ("a.b.c", []),
+        ("x.y", {}),
+    ]:
+        assert compile_path(path_)(data, default) == py_.get(data, path_, default)
+    assert compile_path("a.b")(None) is None
+
+
+@pytest.mark.benchmark
+def test_compile_path_benchmark():
+    "compiled paths are faster than py_.get on a Crossref record"
+    filepath = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    with open(filepath, encoding="utf-8") as file:
+        data = json.loads(file.read())
+    paths = ["resource.primary.URL", "issued.date-time", "relation.is-part-of"]
+    getters = [compile_path(i) for i in paths]
+
+    def pydash_get():
+        return [py_.get(data, i) for i in paths]
+
+    def compiled_get():
+        return [get(data) for get in getters]
+
+    assert compiled_get() == pydash_get()
+    pydash_time = min(timeit.repeat(pydash_get, number=2000, repeat=3))
+    compiled_time = min(timeit.repeat(compiled_get, number=2000, repeat=3))
+    # typically about twenty times faster
+    assert compiled_time * 2 < pydash_time
@@ -0,0 +1,135 @@
+# pylint: disable=invalid-name
+"""BibTeX reader tests"""
+from os import path
+from commonmeta import Metadata
+from commonmeta.readers.bibtex_reader import bibtex_meta, iter_bibtex_records
+
+
+def test_journal_article():
+    "journal article"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.bib")
+    subject = Metadata(string)
+    assert subject.is_valid
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.type == "JournalArticle"
+    assert subject.url == "http://elifesciences.org/lookup/doi/10.7554/eLife.01567"
+    assert len(subject.contributors) == 5
+    assert subject.contributors[0] == {
+        "type": "Person",
+        "contributorRoles": ["Author"],
+        "givenName": "Martial",
+        "familyName": "Sankar",
+    }
+    assert subject.titles == [
+        {
+            "title": "Automated quantitative histology reveals vascular morphodynamics during Arabidopsis hypocotyl secondary growth"
+        }
+    ]
+    assert subject.publisher == {"name": "eLife Sciences Organisation, Ltd."}
+    assert (
+        subject.descriptions[0]
+        .get("description")
+        .startswith("Among various advantages,")
+    )
+    assert subject.license == {
+        "id": "CC-BY-3.0",
+        "url": "https://creativecommons.org/licenses/by/3.0/legalcode",
+    }
+    assert subject.container == {
+        "type": "Journal",
+        "title": "eLife",
+        "identifier": "2050-084X",
+        "identifierType": "ISSN",
+        "volume": "3",
+    }
+    assert subject.date == {"published": "2014-02"}
+
+
+def test_thesis():
+    "Thesis, no DOI"
+    string = path.join(path.dirname(__file__), "fixtures", "pure.bib")
+    subject = Metadata(string)
+    assert subject.is_valid is False
+    assert subject.errors is None
+    assert subject.id is None
+    assert subject.type == "Dissertation"
+    assert subject.contributors == [
+        {
+            "type": "Person",
+            "contributorRoles": ["Author"],
+            "givenName": "Y.",
+            "familyName": "Toparlar",
+        }
+    ]
+    assert subject.publisher == {"name": "Technische Universiteit Eindhoven"}
+    assert subject.date == {"published": "2018-04-25"}
+    assert subject.language == "en"
+
+
+def test_bibtex_meta():
+    "macros, concatenation, LaTeX and nested braces"
+    meta = bibtex_meta(
+        """@string{jn = "J. Chem. Phys."}
+        @Article{key:2020,
+          Author = "M{\\"u}ller, J. and {\\c{C}}elik, A.",
+          title = {The {DNA} of "quoted" words},
+          journal = jn # { Letters},
+          year = 2020, month = jan,
+          pages = "12--34",
+        }"""
+    )
+    assert meta == {
+        "ENTRYTYPE": "article",
+        "ID": "key:2020",
+        "author": "Müller, J. and Çelik, A.",
+        "title": 'The DNA of "quoted" words',
+        "journal": "J. Chem. Phys. Letters",
+        "year": "2020",
+        "month": "jan",
+        "pages": "12--34",
+    }
+
+
+def test_iter_bibtex_records():
+    "entries of a file read one line at a time, with @string definitions"
+    string = path.join(path.dirname(__file__), "fixtures", "bibtex-list.bib")
+    records = [*iter_bibtex_records(string)]
+    assert len(records) == 2
+    assert records[0].startswith('@string{pub = "Technische Universiteit Eindhoven"}')
+    assert "@article{Sankar_2014," in records[0]
+    subject = Metadata(records[1], via="bibtex")
+    assert subject.type == "Dissertation"
+    assert subject.publisher == {"name": "Technische Universiteit Eindhoven"}
+
+
+def test_iter_bibtex_records_parentheses():
+    "entries in parentheses, as accepted when finding the format"
+    string = """@article(first,
+  title = {A (nested) title},
+  year = 2020
+)
+@article(second, title = {Second})
+"""
+    records = [*iter_bibtex_records(string)]
+    assert len(records) == 2
+    assert bibtex_meta(records[0]) == {
+        "title": "A (nested) title",
+        "year": "2020",
+        "ENTRYTYPE": "article",
+        "ID": "first",
+    }
+    assert bibtex_meta(records[1])["title"] == "Second"
+
+
+def test_iter_bibtex_records_quoted_braces():
+    "braces in quoted values don't end or extend an entry"
+    string = """@article{first,
+  title = "An unmatched } brace",
+  author = "M{\\"u}ller, Anna"
+}
+@article{second, title = "Second"}
+"""
+    records = [*iter_bibtex_records(string)]
+    assert len(records) == 2
+    assert bibtex_meta(records[0])["author"] == "Müller, Anna"
+    assert bibtex_meta(records[1])["title"] == "Second"
@@ -0,0 +1,127 @@
+# pylint: disable=invalid-name
+"""Test cache utils"""
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from commonmeta.cache_utils import (
+    LRUCache,
+    SQLiteStore,
+    ConversionCache,
+    content_hash,
+    file_digest,
+)
+
+
+def test_lru_cache():
+    "least recently used entry is evicted"
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.cache_info() == {"hits": 3, "misses": 1, "size": 2, "maxsize": 2}
+
+
+def test_lru_cache_peek():
+    "peek doesn't count or reorder"
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.peek("a") == 1
+    assert cache.peek("c") is None
+    cache.set("c", 3)
+    assert cache.peek("a") is None
+    assert cache.cache_info() == {"hits": 0, "misses": 0, "size": 2, "maxsize": 2}
+
+
+def test_lru_cache_ttl():
+    "expired entries are dropped"
+    cache = LRUCache(ttl=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_sqlite_store(tmp_path):
+    "values persist between connections"
+    filename = str(tmp_path / "cache.sqlite")
+    store = SQLiteStore(filename, table="test")
+    store.set("a", "1")
+    store.set("b", b"2")
+    store.close()
+    store = SQLiteStore(filename, table="test")
+    assert store.get("a") == "1"
+    assert store.get("b") == b"2"
+    assert store.get("c") is None
+    assert len(store) == 2
+    store.evict(maxsize=1)
+    assert len(store) == 1
+    store.clear()
+    assert len(store) == 0
+
+
+def test_sqlite_store_ttl(tmp_path):
+    "expired values are deleted"
+    store = SQLiteStore(str(tmp_path / "cache.sqlite"), ttl=0.01)
+    store.set("a", "1")
+    time.sleep(0.02)
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_conversion_cache(tmp_path):
+    "outputs are kept in memory and in the database"
+    filename = str(tmp_path / "cache.sqlite")
+    cache = ConversionCache(filename, maxsize=1)
+    cache.set("a", "1")
+    cache.set("b", b"2")
+    assert cache.get("a") == "1"
+    cache.close()
+    cache = ConversionCache(filename, maxsize=1)
+    assert cache.get("b") == b"2"
+    assert cache.get("c") is None
+    info = cache.cache_info()
+    assert info["hits"] == 1
+    assert info["hit_rate"] == 0.5
+    assert info["stored"] == 2
+    cache.close()
+
+
+def test_cache_counters_threads():
+    "hits and misses from several threads are all counted"
+    cache = LRUCache()
+    conversions = ConversionCache()
+    cache.set("a", 1)
+    conversions.set("a", "1")
+
+    def lookup(i):
+        for key in ["a", "b"] * 500:
+            cache.get(key)
+            conversions.get(key)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        [*executor.map(lookup, range(8))]
+    assert cache.cache_info()["hits"] == cache.cache_info()["misses"] == 4000
+    assert conversions.cache_info()["hits"] == 4000
+    assert conversions.cache_info()["misses"] == 4000
+
+
+def test_content_hash():
+    "dict keys are sorted, parts are not concatenated"
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash("ab", "c") != content_hash("a", "bc")
+
+
+def test_file_digest(tmp_path):
+    "files are hashed in chunks"
+    filename = tmp_path / "data.txt"
+    filename.write_bytes(b"0123456789" * 10)
+    assert file_digest(str(filename), chunk_size=7) == hashlib.sha256(
+        b"0123456789" * 10
+    ).digest()
@@ -3,6 +3,12 @@
 from os import path
 import pytest
 from commonmeta import Metadata, MetadataList
+from commonmeta.writers.citation_writer import (
+    get_citation_style,
+    render_citations,
+    write_citation_csl,
+    STYLE_CACHE,
+)
 
 
 def vcr_config():
@@ -123,13 +129,14 @@ def test_write_citation_list_ieee_style_german():
     citation_list = subject_list.write(to="citation", style="ieee", locale="de")
     lines = citation_list.splitlines()
     assert len(lines) == 39  # 20 items, 19 separators
+    # items are numbered in one bibliography
     assert (
         lines[0]
         == "[1]Newell P. Campbell, „Hydrocarbon Potential of Columbia Plateau--an Overview: ABSTRACT“, <i>AAPG Bulletin</i>, Bd. 71, 1987, doi: 10.1306/703c7c64-1707-11d7-8645000102c1865d."
     )
     assert (
         lines[2]
-        == "[1]David G. Morse, „Sedimentology, Diagenesis, and Trapping Style, Chesterian Tar Springs Sandstone at Inman Field, Gallatin County, Illinois: ABSTRACT“, <i>AAPG Bulletin</i>, Bd. 80, 1996, doi: 10.1306/64ed9fd8-1724-11d7-8645000102c1865d."
+        == "[2]David G. Morse, „Sedimentology, Diagenesis, and Trapping Style, Chesterian Tar Springs Sandstone at Inman Field, Gallatin County, Illinois: ABSTRACT“, <i>AAPG Bulletin</i>, Bd. 80, 1996, doi: 10.1306/64ed9fd8-1724-11d7-8645000102c1865d."
     )
 
 def test_epijats_reference():
@@ -144,4 +151,42 @@ def test_epijats_reference():
     assert (
         subject.write(to="citation")
         == "Daniel, S., Venkateswaran, C., Hutchinson, A., &amp; Johnson, M. (2021). 'I don't talk about my distress to others; I feel that I have to suffer my problems...' voices of indian women with breast cancer: a qualitative interview study. In <i>Support Care Cancer</i> (Vol. 29, Number 5, pp. 2591–2600)."
-    )
\ No newline at end of file
+    )
+
+
+def test_citation_style_cache():
+    """styles are parsed once per style and locale"""
+    STYLE_CACHE.clear()
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_list = MetadataList(string, via="crossref")
+    subject_list.write(to="citation")
+    for item in subject_list.items:
+        item.write(to="citation")
+    assert STYLE_CACHE.cache_info()["size"] == 1
+    assert STYLE_CACHE.cache_info()["hits"] >= 20
+    style = get_citation_style("apa", "en-US")
+    assert get_citation_style("apa", "en-US") is style
+    assert get_citation_style("apa", "de") is not style
+    assert STYLE_CACHE.cache_info()["size"] == 2
+    # one miss for each style that was parsed
+    assert STYLE_CACHE.cache_info()["misses"] == 2
+
+
+def test_render_citations():
+    """render all citations of a list in one bibliography"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_list = MetadataList(string, via="crossref")
+    csl_items = [write_citation_csl(item) for item in subject_list.items]
+    citations = render_citations(csl_items, style="ieee", locale="de")
+    assert len(citations) == 20
+    assert citations[
+        "https://doi.org/10.1306/64ed9fd8-1724-11d7-8645000102c1865d"
+    ].startswith("[2]David G. Morse")
+    assert render_citations(csl_items + csl_items[:2], style="ieee") == (
+        render_citations(csl_items, style="ieee")
+    )
+    # chunks rendered in parallel are numbered as one bibliography
+    assert (
+        render_citations(csl_items, style="ieee", locale="de", workers=2, chunk_size=6)
+        == citations
+    )
@@ -1,8 +1,12 @@
 """Test cli"""
 
+import subprocess
+import sys
 import pytest
 from click.testing import CliRunner
-from commonmeta.cli import convert, encode, decode, json_feed, encode_by_id
+from os import path
+from commonmeta.cli import convert, encode, decode, json_feed, encode_by_id, list
+from commonmeta.metadata import configure_conversion_cache, conversion_cache_info
 
 
 def vcr_config():
@@ -150,3 +154,107 @@ def test_encode_by_id():
     result = runner.invoke(encode_by_id, [string])
     assert result.exit_code == 0
     assert "https://doi.org/10.53731/" in result.output
+
+
+def test_list_ris():
+    """Test ris list written one item at a time"""
+    runner = CliRunner()
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    result = runner.invoke(list, [string, "--via", "crossref", "--to", "ris"])
+    assert result.exit_code == 0
+    assert result.output.count("TY  - JOUR") == 20
+
+
+def test_list_bibtex():
+    """Test list from a BibTeX file"""
+    runner = CliRunner()
+    string = path.join(path.dirname(__file__), "fixtures", "bibtex-list.bib")
+    result = runner.invoke(list, [string, "--to", "ris"])
+    assert result.exit_code == 0
+    assert result.output.count("TY  - ") == 2
+    assert "TY  - THES" in result.output
+
+
+def test_list_show_errors():
+    """Test list checking items for errors while streaming"""
+    runner = CliRunner()
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    result = runner.invoke(
+        list, [string, "--via", "crossref", "--to", "ris", "--show-errors"]
+    )
+    assert result.exit_code == 0
+    assert result.output.count("TY  - JOUR") == 20
+
+    # the thesis has no DOI and is not found
+    string = path.join(path.dirname(__file__), "fixtures", "bibtex-list.bib")
+    result = runner.invoke(list, [string, "--to", "ris", "--show-errors"])
+    assert result.exit_code == 1
+    assert "Error: None: not_found" in result.output
+
+
+def test_convert_cache(tmp_path):
+    """Test convert with cached output"""
+    runner = CliRunner()
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+    args = [string, "--to", "bibtex", "--cache", str(tmp_path / "cache.sqlite")]
+    try:
+        result = runner.invoke(convert, args)
+        assert result.exit_code == 0
+        cached = runner.invoke(convert, args)
+        assert cached.output == result.output
+        assert conversion_cache_info()["hits"] == 1
+    finally:
+        configure_conversion_cache(enabled=False)
+
+
+# libraries only needed by some readers and writers
+HEAVY_MODULES = [
+    "pikepdf",
+    "citeproc",
+    "bibtexparser",
+    "dateparser",
+    "pycountry",
+    "bs4",
+    "lxml",
+    "jsonschema",
+    "nameparser",
+    "httpx",
+]
+
+
+def imported_modules(code: str) -> list:
+    """heavy modules imported by running code in a new interpreter"""
+    check = f"import sys; print(','.join(m for m in {HEAVY_MODULES} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}; {check}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [m for m in result.stdout.strip().split(",") if m]
+
+
+def test_startup_imports():
+    """cli starts without loading readers and writers"""
+    assert imported_modules("import commonmeta.cli") == []
+
+
+@pytest.mark.benchmark
+def test_startup_time():
+    """cli imports within the startup time budget"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import commonmeta.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # last line is the cumulative import time of commonmeta.cli in microseconds
+    cumulative = int(result.stderr.strip().splitlines()[-1].split("|")[1])
+    assert cumulative < 500_000
+
+
+def test_json_conversion_imports():
+    """a commonmeta conversion only loads the JSON schema validator"""
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+    code = f"from commonmeta import Metadata; Metadata({string!r}).write()"
+    assert imported_modules(code) == ["jsonschema"]
@@ -4,6 +4,28 @@
 from os import path
 import pytest
 from commonmeta import Metadata
+from commonmeta.readers.crossref_xml_reader import (
+    parse_crossref_xml,
+    read_crossref_xml,
+)
+
+PROCEEDINGS_ARTICLE = """<crossref_result xmlns="http://www.crossref.org/qrschema/3.0">
+<query_result><body><query status="resolved">
+<crm-item name="publisher-name" type="string">eLife Sciences Publications, Ltd</crm-item>
+<doi_record><crossref xmlns="http://www.crossref.org/xschema/1.1"><conference>
+<event_metadata><conference_acronym>C1</conference_acronym>
+<conference_location>Berlin</conference_location></event_metadata>
+<proceedings_metadata><proceedings_title>Proceedings</proceedings_title>
+<isbn media_type="electronic">9781111111111</isbn></proceedings_metadata>
+<conference_paper language="de">
+<contributors><person_name sequence="first" contributor_role="author">
+<given_name>Jane</given_name><surname>Doe</surname></person_name></contributors>
+<titles><title>Main title</title><subtitle>Subtitle</subtitle></titles>
+<publication_date><month>3</month><day>5</day><year>2020</year></publication_date>
+<pages><first_page>1</first_page><last_page>9</last_page></pages>
+<doi_data><doi>10.7554/example</doi><resource>https://example.org/1</resource></doi_data>
+</conference_paper></conference></crossref></doi_record>
+</query></body></query_result></crossref_result>"""
 
 
 def vcr_config():
@@ -1210,3 +1232,62 @@ def test_proceedings_article():
     assert subject.descriptions is None
     assert subject.version is None
     assert subject.provider == "Crossref"
+
+
+def test_read_crossref_xml():
+    "parsed crossref.xml"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    with open(string, encoding="utf-8") as file:
+        xml = file.read()
+    meta = read_crossref_xml(parse_crossref_xml(xml))
+    assert meta["id"] == "https://doi.org/10.7554/elife.01567"
+    assert meta["type"] == "JournalArticle"
+    assert meta["license"] == {
+        "id": "CC-BY-3.0",
+        "url": "https://creativecommons.org/licenses/by/3.0/legalcode",
+    }
+    assert meta["container"]["identifier"] == "2050-084X"
+    assert len(meta["references"]) == 27
+    # as returned by get_crossref_xml
+    assert read_crossref_xml({"xml": xml, "via": "crossref_xml"}) == meta
+    assert read_crossref_xml({"state": "not_found"}) == {"state": "not_found"}
+
+
+def test_read_crossref_xml_legacy_dict():
+    "dict from xmltodict, as parse_crossref_xml returned before"
+    from commonmeta.base_utils import parse_xml
+
+    legacy = parse_xml(PROCEEDINGS_ARTICLE, dialect="crossref")
+    with pytest.raises(TypeError, match="parse_crossref_xml"):
+        read_crossref_xml(legacy)
+
+
+def test_read_crossref_xml_proceedings_article():
+    "proceedings article"
+    meta = read_crossref_xml(parse_crossref_xml(PROCEEDINGS_ARTICLE))
+    assert meta["id"] == "https://doi.org/10.7554/example"
+    assert meta["type"] == "ProceedingsArticle"
+    assert meta["language"] == "de"
+    assert meta["titles"] == [
+        {"title": "Main title"},
+        {"title": "Subtitle", "titleType": "Subtitle"},
+    ]
+    assert meta["contributors"] == [
+        {
+            "type": "Person",
+            "contributorRoles": ["Author"],
+            "givenName": "Jane",
+            "familyName": "Doe",
+        }
+    ]
+    assert meta["date"]["published"] == "2020-03-05"
+    assert meta["container"] == {
+        "type": "Proceedings",
+        "identifier": "9781111111111",
+        "identifierType": "ISBN",
+        "title": "Proceedings",
+        "firstPage": "1",
+        "lastPage": "9",
+        "location": "Berlin",
+        "series": "C1",
+    }
@@ -1,5 +1,6 @@
 """Test crossref_xml_writer module for commonmeta-py"""
 
+import io
 import pytest
 from os import path
 import pydash as py_
@@ -8,6 +9,7 @@ from collections import OrderedDict
 
 from commonmeta import Metadata, MetadataList
 from commonmeta.base_utils import parse_xml
+from commonmeta.writers.crossref_xml_writer import write_crossref_xml_batches
 
 
 def test_write_crossref_xml_header():
@@ -72,6 +74,81 @@ def test_write_crossref_xml_list():
     }
 
 
+def test_write_crossref_xml_list_to_file():
+    """write_crossref_xml_list to file-like object"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_list = MetadataList(string, via="crossref")
+    buffer = io.StringIO()
+    subject_list.write(to="crossref_xml", file=buffer)
+    crossref_xml_list = parse_xml(buffer.getvalue(), dialect="crossref")
+    assert py_.get(crossref_xml_list, "doi_batch.head.depositor.depositor_name") == (
+        "test"
+    )
+    crossref_xml_list = py_.get(crossref_xml_list, "doi_batch.body.journal", [])
+    assert len(crossref_xml_list) == 20
+    assert (
+        py_.get(crossref_xml_list, "19.journal_article.doi_data.doi")
+        == "10.1306/00aa9ad4-1730-11d7-8645000102c1865d"
+    )
+
+
+def test_write_crossref_xml_batches(tmp_path):
+    """write_crossref_xml_list split into batches"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_list = MetadataList(string, via="crossref")
+    filenames = write_crossref_xml_batches(
+        subject_list, str(tmp_path / "deposit.xml"), max_records=8
+    )
+    assert [path.basename(f) for f in filenames] == [
+        "deposit-1.xml",
+        "deposit-2.xml",
+        "deposit-3.xml",
+    ]
+    counts = []
+    for filename in filenames:
+        with open(filename, encoding="utf-8") as file:
+            crossref_xml = parse_xml(file.read(), dialect="crossref")
+        counts.append(len(py_.get(crossref_xml, "doi_batch.body.journal")))
+    assert counts == [8, 8, 4]
+
+    filenames = write_crossref_xml_batches(
+        subject_list, str(tmp_path / "small.xml"), max_size=10000
+    )
+    assert len(filenames) > 1
+    assert all(path.getsize(f) <= 10000 for f in filenames)
+    dois = []
+    for filename in filenames:
+        with open(filename, encoding="utf-8") as file:
+            crossref_xml = parse_xml(file.read(), dialect="crossref")
+        journals = py_.get(crossref_xml, "doi_batch.body.journal")
+        dois += [py_.get(j, "journal_article.doi_data.doi") for j in journals]
+    assert len(set(dois)) == 20
+
+
+def test_write_crossref_xml_list_skips_invalid(tmp_path):
+    """invalid items are left out of lists, streams and batches alike"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_list = MetadataList(string, via="crossref")
+    invalid = "https://doi.org/10.5555/invalid"
+    subject_list.items = subject_list.items + [
+        Metadata({"id": invalid, "state": "not_found"}, via="commonmeta")
+    ]
+
+    def count(xml):
+        return len(py_.get(parse_xml(xml, dialect="crossref"), "doi_batch.body.journal"))
+
+    assert count(subject_list.write(to="crossref_xml")) == 20
+    assert subject_list.skipped == [invalid]
+    subject_list.skipped = []
+    assert count("".join(subject_list.stream(to="crossref_xml"))) == 20
+    assert subject_list.skipped == [invalid]
+    subject_list.skipped = []
+    filenames = write_crossref_xml_batches(subject_list, str(tmp_path / "deposit.xml"))
+    with open(filenames[0], encoding="utf-8") as file:
+        assert count(file.read()) == 20
+    assert subject_list.skipped == [invalid]
+
+
 @pytest.mark.vcr
 def test_write_commonmeta_list_as_crossref_xml():
     """write_commonmeta_list crossref_xml"""
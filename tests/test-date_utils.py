@@ -14,6 +14,8 @@ from commonmeta.date_utils import (
     get_datetime_from_time,
     get_datetime_from_pdf_time,
     validate_edtf,
+    date_cache_info,
+    clear_date_cache,
 )
 
 
@@ -27,6 +29,25 @@ def test_get_iso8601_date():
     assert "2012-01-03" == get_iso8601_date("3. Januar 2012")
     assert "1972-09-09" == get_iso8601_date(84914841)
     assert "2020-05-17" == get_iso8601_date(date(2020, 5, 17))
+    # edtf seasons fall through to dateparser
+    assert "2021-10" == get_iso8601_date("2021-21")
+
+
+def test_get_iso8601_date_parsers():
+    """canonical dates skip dateparser, repeated dates are cached"""
+    clear_date_cache()
+    assert "2012" == get_iso8601_date("2012")
+    assert "2012-05" == get_iso8601_date("2012-05")
+    assert "2012-05-12" == get_iso8601_date("2012-05-12")
+    assert "2012-05-12" == get_iso8601_date("2012-05-12T09:12:45Z")
+    assert "2012-05-12" == get_iso8601_date("May 12, 2012")
+    assert "2012-05-12" == get_iso8601_date("2012-05-12")
+    info = date_cache_info()
+    assert info["iso8601"] == 4
+    assert info["edtf"] == 0
+    assert info["dateparser"] == 1
+    assert info["hits"] == 1
+    assert info["size"] == 5
 
 
 def test_get_date_from_date_parts():
@@ -121,3 +142,6 @@ def test_validate_edtf():
     assert "2024-07-22T23:11:00Z" == validate_edtf("2024-07-22T23:11:00Z")
     assert "2024-10-23T13:58:21" == validate_edtf("2024-10-23T13:58:21")
     assert "2012-01-01" == validate_edtf("2012-01-01")
+    # seasons and intervals are valid edtf, but not dates
+    assert None is validate_edtf("2021-21")
+    assert None is validate_edtf("2004-06/2006-08")
@@ -18,6 +18,10 @@ from commonmeta.doi_utils import (
     datacite_api_url,
     is_rogue_scholar_doi,
     short_doi_as_doi,
+    configure_doi_ra_cache,
+    doi_ra_cache_info,
+    get_cached_doi_ra,
+    set_cached_doi_ra,
 )
 
 
@@ -272,3 +276,47 @@ def test_crossref_api_query_url():
         response
         == "https://api.crossref.org/works?rows=100&filter=member%3A31795%2Chas-references%3Atrue"
     )
+
+
+def test_get_doi_ra_cached():
+    "registration agency from the in-memory cache, no request needed"
+    configure_doi_ra_cache()
+    set_cached_doi_ra("10.7554", "Crossref")
+    assert "Crossref" == get_doi_ra("https://doi.org/10.7554/elife.01567")
+    assert "Crossref" == get_doi_ra("10.7554/elife.00001")
+    assert doi_ra_cache_info()["hits"] == 2
+    configure_doi_ra_cache()
+
+
+def test_doi_ra_cache_seeded():
+    "major prefixes come from the bundled table and expire with the cache ttl"
+    configure_doi_ra_cache()
+    assert "Crossref" == get_cached_doi_ra("10.1371")
+    assert "DataCite" == get_cached_doi_ra("10.5281")
+    configure_doi_ra_cache(ttl=0)
+    assert None is get_cached_doi_ra("10.1371")
+    configure_doi_ra_cache()
+
+
+def test_doi_ra_cache_persistent(tmp_path):
+    "registration agency cached on disk"
+    filename = str(tmp_path / "doi_ra.sqlite")
+    configure_doi_ra_cache(filename=filename)
+    set_cached_doi_ra("10.99998", "Crossref")
+    configure_doi_ra_cache(filename=filename)
+    assert doi_ra_cache_info()["size"] == 0
+    assert "Crossref" == get_cached_doi_ra("10.99998")
+    assert None is get_cached_doi_ra("10.99997")
+    configure_doi_ra_cache()
+
+
+def test_doi_ra_cache_persistent_evicted(tmp_path):
+    "database keeps at most maxsize prefixes"
+    filename = str(tmp_path / "doi_ra.sqlite")
+    configure_doi_ra_cache(filename=filename, maxsize=2)
+    for prefix in ["10.99991", "10.99992", "10.99993"]:
+        set_cached_doi_ra(prefix, "Crossref")
+    configure_doi_ra_cache(filename=filename, maxsize=2)
+    assert None is get_cached_doi_ra("10.99991")
+    assert "Crossref" == get_cached_doi_ra("10.99993")
+    configure_doi_ra_cache()
@@ -0,0 +1,88 @@
+# pylint: disable=invalid-name
+"""Test html utils"""
+
+from os import path
+import httpx
+import pytest  # noqa: F401
+
+from commonmeta.html_utils import parse_html_meta
+from commonmeta.http_utils import create_client, set_client
+from commonmeta.readers.schema_org_reader import get_html_meta, get_schema_org
+
+HEAD = """<html lang="en"><head>
+<meta name="citation_title" content="Example">
+<meta name="citation_author" content="Jane Doe">
+<meta name="citation_author" content="John Doe">
+<meta property="og:description" content="An example">
+<link rel="canonical" href="https://example.org/posts/1">
+<script type="application/ld+json">{"@type": "BlogPosting", "name": "Example"}</script>
+</head>"""
+BODY = """<body><meta name="citation_doi" content="10.5555/12345678">
+<script type="application/ld+json">{"@type": "Dataset"}</script></body></html>"""
+
+
+def test_parse_html_meta():
+    "meta tags, canonical link, language and JSON-LD"
+    meta = parse_html_meta(HEAD + BODY)
+    assert meta.head_done
+    assert meta.get("name", "dc.title", "citation_title") == "Example"
+    assert meta.get("property", "citation_title") is None
+    assert meta.get_all("name", "citation_author") == ["Jane Doe", "John Doe"]
+    assert meta.canonical == "https://example.org/posts/1"
+    assert meta.lang == "en"
+    assert meta.json_ld == [
+        {"@type": "BlogPosting", "name": "Example"},
+        {"@type": "Dataset"},
+    ]
+
+
+def test_parse_html_meta_stop_after_head():
+    "chunks after the head are not read"
+    chunks = iter([HEAD, BODY])
+    meta = parse_html_meta(chunks, stop=lambda meta: True)
+    assert next(chunks) == BODY
+    assert meta.get("name", "citation_doi") is None
+    assert len(meta.json_ld) == 1
+
+
+def test_parse_html_meta_fixture():
+    "arxiv landing page"
+    filepath = path.join(path.dirname(__file__), "fixtures", "arxiv.html")
+    with open(filepath, encoding="utf-8") as file:
+        meta = parse_html_meta(file.read())
+    assert meta.get("name", "citation_arxiv_id") == "1902.02534"
+
+
+def test_get_html_meta():
+    "metadata from meta tags"
+    data = get_html_meta(parse_html_meta(HEAD))
+    assert data["@id"] == "https://example.org/posts/1"
+    assert data["name"] == "Example"
+    assert data["author"] == ["Jane Doe", "John Doe"]
+    assert data["description"] == "An example"
+    assert data["inLanguage"] == "en"
+
+
+def test_get_schema_org_reads_head_only():
+    "the body is not downloaded if the head has supported JSON-LD"
+    chunks = []
+
+    def content():
+        for chunk in [HEAD, BODY]:
+            chunks.append(chunk)
+            yield chunk.encode("utf-8")
+
+    def handler(request):
+        return httpx.Response(
+            200, headers={"content-type": "text/html"}, content=content()
+        )
+
+    set_client(create_client(transport=httpx.MockTransport(handler)))
+    try:
+        data = get_schema_org("https://example.org/posts/1")
+    finally:
+        set_client(None)
+    assert chunks == [HEAD]
+    assert data["@type"] == "BlogPosting"
+    assert data["name"] == "Example"
+    assert data["state"] == "findable"
@@ -0,0 +1,137 @@
+# pylint: disable=invalid-name
+"""Test http utils"""
+
+import asyncio
+import httpx
+import pytest
+
+from commonmeta.http_utils import (
+    create_client,
+    get_client,
+    get_async_client,
+    close_async_client,
+    set_client,
+    configure_client,
+    get_backoff,
+    http_get,
+    HTTP_OPTIONS,
+)
+from commonmeta.doi_utils import get_doi_ra, configure_doi_ra_cache
+
+
+@pytest.fixture
+def mock_client():
+    """inject a client with a mock transport"""
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        if request.url.path == "/ra/10.5555":
+            return httpx.Response(200, json=[{"DOI": "10.5555", "RA": "Crossref"}])
+        if request.url.path == "/flaky" and len(calls) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, text="ok")
+
+    client = create_client(transport=httpx.MockTransport(handler), backoff_factor=0)
+    set_client(client)
+    yield calls
+    set_client(None)
+
+
+def test_shared_client():
+    "client is created once"
+    set_client(None)
+    client = get_client()
+    assert get_client() is client
+    set_client(None)
+    assert get_client() is not client
+    set_client(None)
+
+
+def test_shared_async_client():
+    "async client is created once per event loop"
+
+    async def shared_client():
+        client = get_async_client()
+        assert get_async_client() is client
+        await close_async_client()
+        assert get_async_client() is not client
+        await close_async_client()
+        return client
+
+    assert asyncio.run(shared_client()) is not asyncio.run(shared_client())
+
+
+def test_configure_client_closes_async_client():
+    "async clients replaced by configure_client are closed on their loop"
+
+    async def replaced_client():
+        client = get_async_client()
+        configure_client()
+        assert get_async_client() is not client
+        await asyncio.sleep(0)
+        await close_async_client()
+        return client
+
+    assert asyncio.run(replaced_client()).is_closed
+
+
+def test_injected_client(mock_client):
+    "readers use the injected client"
+    configure_doi_ra_cache()
+    assert get_doi_ra("10.5555/12345678") == "Crossref"
+    assert mock_client == ["https://doi.org/ra/10.5555"]
+
+
+def test_retry_on_server_error(mock_client):
+    "retry on 503"
+    response = http_get("https://example.org/flaky")
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert len(mock_client) == 3
+
+
+def test_no_retry_for_post(mock_client):
+    "POST is not retried"
+    response = get_client().post("https://example.org/flaky")
+    assert response.status_code == 503
+    assert len(mock_client) == 1
+
+
+def test_per_host_slot_released(mock_client):
+    "per-host slots are released after the body is read"
+    for _ in range(HTTP_OPTIONS["max_connections_per_host"] + 2):
+        assert http_get("https://example.org/").status_code == 200
+
+
+def test_backoff():
+    "backoff honours Retry-After"
+    assert get_backoff(httpx.Response(429), 2, 0.5) == 2.0
+    assert get_backoff(httpx.Response(429, headers={"Retry-After": "3"}), 0, 0.5) == 3
+    assert get_backoff(httpx.Response(503), 10, 1) == 60
+
+
+def test_configure_client_unknown_option():
+    "unknown option"
+    with pytest.raises(ValueError):
+        configure_client(pool="large")
+
+
+def test_readers_use_client_timeout():
+    "readers don't override the timeout of the shared client"
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(404)
+
+    set_client(create_client(transport=httpx.MockTransport(handler), timeout=3))
+    try:
+        from commonmeta.readers.datacite_reader import get_datacite
+        from commonmeta.readers.cff_reader import get_cff
+
+        assert get_datacite("10.5555/12345678") == {"state": "not_found"}
+        assert get_cff("https://github.com/example/example") == {"state": "not_found"}
+    finally:
+        set_client(None)
+    assert timeouts == [3, 3]
@@ -1,6 +1,20 @@
 """Metadata tests"""
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import io
+from os import path
+from threading import Lock, Thread
+import time
+import httpx
+import orjson as json
 import pytest
-from commonmeta import Metadata, MetadataList
+from commonmeta import Metadata, MetadataList, AsyncMetadataList
+from commonmeta.http_utils import create_async_client
+from commonmeta.metadata import (
+    configure_conversion_cache,
+    conversion_cache_info,
+    get_cached_output,
+)
 
 
 @pytest.mark.vcr
@@ -56,3 +70,505 @@ def test_list_of_pids():
     subject = subject_lst.items[0]
     assert subject.id == "https://doi.org/10.7554/elife.01567"
     assert subject.type == "JournalArticle"
+
+
+def test_validate_lazy():
+    """validation deferred until errors are accessed"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string, validate="lazy")
+    assert subject._validated is False
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.errors is None
+    assert subject._validated is True
+    assert subject.is_valid
+
+
+def test_validate_off():
+    """validation skipped"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string, validate="off")
+    assert subject.errors is None
+    assert subject.is_valid
+    commonmeta = json.loads(subject.write())
+    assert commonmeta["id"] == "https://doi.org/10.7554/elife.01567"
+    assert "_validation" not in commonmeta
+
+
+def test_validate_not_supported():
+    """validation mode not supported"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    with pytest.raises(ValueError):
+        Metadata(string, validate="sometimes")
+
+
+def test_list_validate_lazy():
+    """metadata list with lazy validation"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_lst = MetadataList(string, via="crossref", validate="lazy")
+    assert all(i._validated is False for i in subject_lst.items)
+    assert subject_lst.errors == []
+    assert all(i._validated is True for i in subject_lst.items)
+    assert subject_lst.is_valid
+
+
+def test_list_jsonlines_file(tmp_path):
+    """metadata list read lazily from a JSON Lines file"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    with open(string, encoding="utf-8") as file:
+        items = json.loads(file.read())["items"]
+    filename = tmp_path / "crossref-list.jsonl"
+    filename.write_bytes(b"\n".join(json.dumps(i) for i in items) + b"\n\n")
+    subject_lst = MetadataList(str(filename))
+    assert subject_lst._items is None
+    subject = next(subject_lst.iter_items())
+    assert subject_lst.via == "crossref"
+    assert subject.id == "https://doi.org/10.1306/703c7c64-1707-11d7-8645000102c1865d"
+    assert subject_lst._items is None
+    assert len(subject_lst.items) == 20
+    assert subject_lst.is_valid
+
+
+def test_list_jsonlines_iterable():
+    """metadata list read lazily from an iterable of lines"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    with open(string, encoding="utf-8") as file:
+        items = json.loads(file.read())["items"]
+    read = []
+
+    def lines():
+        for item in items:
+            read.append(item["DOI"])
+            yield json.dumps(item)
+
+    subject_lst = MetadataList(lines(), via="crossref", validate="lazy")
+    iterator = subject_lst.iter_items()
+    assert next(iterator).id == "https://doi.org/10.1306/703c7c64-1707-11d7-8645000102c1865d"
+    assert len(read) == 1
+    assert len([*iterator]) == 19
+
+
+def test_list_jsonlines_invalid():
+    """invalid JSON in a line"""
+    subject_lst = MetadataList(['{"id": "https://doi.org/10.5555/1"}', "{"])
+    with pytest.raises(ValueError, match="line 2"):
+        [*subject_lst.iter_items()]
+
+
+def test_list_write_to_file():
+    """metadata list written to a file one item at a time"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_lst = MetadataList(string, via="crossref")
+    for to in ["commonmeta", "csl", "ris", "citation"]:
+        buffer = io.StringIO()
+        assert subject_lst.write(to=to, file=buffer) is None
+        assert buffer.getvalue() == subject_lst.write(to=to)
+    buffer = io.StringIO()
+    subject_lst.write(to="bibtex", file=buffer)
+    assert buffer.getvalue().startswith(
+        "@article{10.1306/703c7c64-1707-11d7-8645000102c1865d,"
+    )
+    assert buffer.getvalue().count("@article{") == 20
+
+
+def test_list_write_jsonlines(tmp_path):
+    """JSON Lines in, JSON Lines out"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    filename = tmp_path / "commonmeta.jsonl"
+    MetadataList(string, via="crossref", filename=str(filename), jsonlines=True).write()
+    with open(filename, encoding="utf-8") as file:
+        subject_lst = MetadataList(file, via="commonmeta", jsonlines=True)
+        buffer = io.StringIO()
+        subject_lst.write(file=buffer)
+    lines = buffer.getvalue().splitlines()
+    assert len(lines) == 20
+    assert json.loads(lines[0])["id"] == (
+        "https://doi.org/10.1306/703c7c64-1707-11d7-8645000102c1865d"
+    )
+
+
+def crossref_xml_list() -> str:
+    """crossref_result with two queries, the second for another DOI"""
+    filepath = path.join(path.dirname(__file__), "fixtures", "crossref.xml")
+    with open(filepath, encoding="utf-8") as file:
+        string = file.read()
+    start, end = string.index("<query "), string.index("</query>") + 8
+    query = string[start:end].replace("eLife.01567", "eLife.01568")
+    return string[:end] + query + string[end:]
+
+
+def test_list_crossref_xml_file(tmp_path):
+    """crossref_result with several queries read one record at a time"""
+    filename = tmp_path / "crossref-list.xml"
+    filename.write_text(crossref_xml_list(), encoding="utf-8")
+    subject_lst = MetadataList(str(filename))
+    assert subject_lst.via == "crossref_xml"
+    assert subject_lst._items is None
+    subject = next(subject_lst.iter_items())
+    assert subject.id == "https://doi.org/10.7554/elife.01567"
+    assert subject.publisher["name"] == "eLife Sciences Publications, Ltd"
+    assert subject_lst._items is None
+    assert [i.id for i in subject_lst.items] == [
+        "https://doi.org/10.7554/elife.01567",
+        "https://doi.org/10.7554/elife.01568",
+    ]
+    assert subject_lst.is_valid
+
+
+def test_list_crossref_xml_workers():
+    """records of a crossref_result read in a pool of worker processes"""
+    subject_lst = MetadataList(crossref_xml_list(), workers=2, chunk_size=1)
+    assert subject_lst.via == "crossref_xml"
+    assert [i.id for i in subject_lst.items] == [
+        "https://doi.org/10.7554/elife.01567",
+        "https://doi.org/10.7554/elife.01568",
+    ]
+
+
+def test_list_datacite_xml_oai_pmh(tmp_path):
+    """DataCite resources of an OAI-PMH harvest"""
+    resources = []
+    for name in ["datacite.xml", "datacite-example-full-v4.4.xml"]:
+        filepath = path.join(path.dirname(__file__), "fixtures", name)
+        with open(filepath, encoding="utf-8") as file:
+            resource = file.read().split("?>", 1)[1]
+        resources.append(f"<record><metadata>{resource}</metadata></record>")
+    filename = tmp_path / "oai-pmh.xml"
+    filename.write_text(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<?xml-stylesheet type="text/xsl" href="oai2.xsl"?>\n'
+        '<OAI-PMH xmlns="http://www.openarchives.org/OAI/2.0/">'
+        '<request metadataPrefix="oai_datacite">https://oai.datacite.org/oai</request>'
+        f"<ListRecords>{''.join(resources)}</ListRecords></OAI-PMH>",
+        encoding="utf-8",
+    )
+    subject_lst = MetadataList(str(filename))
+    assert subject_lst.via == "datacite_xml"
+    assert [i.id for i in subject_lst.iter_items()] == [
+        "https://doi.org/10.5438/4k3m-nyvg",
+        "https://doi.org/10.5072/example-full",
+    ]
+
+
+def test_list_ris_file():
+    """RIS file with several records read one record at a time"""
+    string = path.join(path.dirname(__file__), "fixtures", "ris-list.ris")
+    subject_lst = MetadataList(string)
+    assert subject_lst.via == "ris"
+    assert subject_lst._items is None
+    assert [i.type for i in subject_lst.iter_items()] == [
+        "JournalArticle",
+        "Dissertation",
+    ]
+    assert subject_lst._items is None
+    assert subject_lst.items[0].id == "https://doi.org/10.7554/elife.01567"
+
+
+def test_list_bibtex_file_handle():
+    """BibTeX file handle with several entries"""
+    string = path.join(path.dirname(__file__), "fixtures", "bibtex-list.bib")
+    # the file starts with a comment, the format is found from the extension
+    assert MetadataList(string).via == "bibtex"
+    with open(string, encoding="utf-8") as file:
+        subject_lst = MetadataList(file, via="bibtex")
+        assert [i.id for i in subject_lst.items] == [
+            "https://doi.org/10.7554/elife.01567",
+            None,
+        ]
+    assert subject_lst.write(to="ris").count("TY  - ") == 2
+
+
+def test_list_workers():
+    """metadata list read in a pool of worker processes"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_lst = MetadataList(string, via="crossref", workers=2, chunk_size=3)
+    assert [i.id for i in subject_lst.items] == [
+        i.id for i in MetadataList(string, via="crossref").items
+    ]
+    assert subject_lst.is_valid
+    assert subject_lst.items[0].write_item("csl")["DOI"] == (
+        "10.1306/703c7c64-1707-11d7-8645000102c1865d"
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_list_workers_errors(workers):
+    """items that can't be read don't abort the list, with or without workers"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    with open(string, encoding="utf-8") as file:
+        items = json.loads(file.read())["items"][:3]
+    subject_lst = MetadataList(
+        {"items": items[:2] + [42] + items[2:]}, via="crossref", workers=workers
+    )
+    assert len(subject_lst.items) == 4
+    assert subject_lst.items[2].state == "not_found"
+    assert subject_lst.items[2].errors == ["No input found"]
+    assert subject_lst.items[3].id == "https://doi.org/" + items[2]["DOI"].lower()
+    assert not subject_lst.is_valid
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_list_workers_raise_errors(workers):
+    """items that can't be read raise with raise_errors, with or without workers"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    with open(string, encoding="utf-8") as file:
+        items = json.loads(file.read())["items"][:2]
+    with pytest.raises(ValueError, match="No input found"):
+        MetadataList(
+            {"items": items + [42]}, via="crossref", workers=workers, raise_errors=True
+        )
+
+
+def test_list_workers_written():
+    """outputs written in worker processes are not sent back"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    subject_lst = MetadataList(string, via="crossref", workers=2, chunk_size=3)
+    assert all(i._written == {} for i in subject_lst.items)
+    assert subject_lst.items[0].write_item("csl")["DOI"] == (
+        "10.1306/703c7c64-1707-11d7-8645000102c1865d"
+    )
+
+
+def test_validation_dict_reused_for_write():
+    """commonmeta dict built for validation is reused by write"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string)
+    _, item = subject._written["commonmeta"]
+    assert json.loads(subject.write()) == item
+    assert subject._written["commonmeta"][1] is item
+
+    subject.version = "2"
+    assert json.loads(subject.write())["version"] == "2"
+
+
+def test_write_item_cached_per_format():
+    """csl and datacite dicts are built once and reused"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string)
+    csl = json.loads(subject.write(to="csl"))
+    assert csl["DOI"] == "10.7554/elife.01567"
+    _, item = subject._written["csl"]
+    assert subject.write_item("csl", copy=False) is item
+    assert subject.write(to="citation").startswith("Sankar, M.")
+    assert subject._written["csl"][1] is item
+
+    datacite = json.loads(subject.write(to="datacite"))
+    assert datacite["doi"] == "10.7554/elife.01567"
+    assert subject.write_errors is None
+    assert subject._written["csl"][1] is item
+
+
+def test_write_item_changed_in_place():
+    """metadata changed in place is written again, and copies returned by
+    write_item don't change the cached dicts"""
+    string = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    subject = Metadata(string)
+    assert subject.write(to="citation").startswith("Sankar, M.")
+    subject.titles[0]["title"] = "Changed title"
+    assert json.loads(subject.write(to="csl"))["title"] == "Changed title"
+    assert "Changed title" in subject.write(to="citation")
+    assert json.loads(subject.write())["titles"] == [{"title": "Changed title"}]
+
+    item = subject.write_item("csl")
+    item["title"] = "Changed copy"
+    assert subject.write_item("csl")["title"] == "Changed title"
+
+
+@pytest.fixture
+def local_server():
+    """local stand-in for doi.org and api.crossref.org"""
+    with open(path.join(path.dirname(__file__), "fixtures", "crossref.json")) as f:
+        crossref = json.loads(f.read())
+    stats = {"active": 0, "max_active": 0, "requests": 0, "ra": 0}
+    lock = Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            with lock:
+                stats["requests"] += 1
+                stats["active"] += 1
+                stats["max_active"] = max(stats["max_active"], stats["active"])
+            time.sleep(0.02)
+            host = self.headers["Host"]
+            if host == "doi.org" and self.path == "/ra/10.7554":
+                body = [{"DOI": "10.7554", "RA": "Crossref"}]
+                with lock:
+                    stats["ra"] += 1
+            elif host == "api.crossref.org" and self.path.startswith("/works/10.7554/"):
+                doi = self.path.split("/works/")[1]
+                body = {"message": crossref | {"DOI": doi}}
+            else:
+                body = None
+            if self.path.endswith("/invalid"):
+                body = "not JSON"
+            with lock:
+                stats["active"] -= 1
+            self.send_response(200 if body else 404)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            if isinstance(body, str):
+                self.wfile.write(body.encode("utf-8"))
+            else:
+                self.wfile.write(json.dumps(body) if body else b"")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_address[1]
+
+    class LocalTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self.transport = httpx.AsyncHTTPTransport()
+
+        async def handle_async_request(self, request):
+            request.url = request.url.copy_with(
+                scheme="http", host="127.0.0.1", port=port
+            )
+            return await self.transport.handle_async_request(request)
+
+    yield LocalTransport, stats
+    server.shutdown()
+
+
+def test_async_metadata_list_from_ids(local_server):
+    """fetch a list of dois concurrently"""
+    transport, stats = local_server
+    pids = [f"10.7554/elife.{i:05d}" for i in range(20)]
+
+    async def fetch():
+        async with create_async_client(transport=transport()) as client:
+            return await AsyncMetadataList.from_ids(pids, concurrency=4, client=client)
+
+    subject_lst = asyncio.run(fetch())
+    assert len(subject_lst.items) == 20
+    assert [i.id for i in subject_lst.items] == [f"https://doi.org/{p}" for p in pids]
+    assert subject_lst.items[0].type == "JournalArticle"
+    assert subject_lst.is_valid
+    # registration agency for 10.7554 is in the bundled seed table
+    assert stats["requests"] == 20
+    assert stats["ra"] == 0
+    assert stats["max_active"] <= 4
+
+
+def test_async_metadata_list_errors(local_server):
+    """items that can't be found don't abort the list"""
+    transport, _ = local_server
+
+    async def fetch():
+        async with create_async_client(transport=transport()) as client:
+            return await AsyncMetadataList.from_ids(
+                ["10.7554/elife.01567", "abc", "10.7554/invalid"],
+                via="crossref",
+                client=client,
+            )
+
+    subject_lst = asyncio.run(fetch())
+    assert len(subject_lst.items) == 3
+    assert subject_lst.items[0].is_valid
+    assert subject_lst.items[1].state == "not_found"
+    assert subject_lst.items[2].id == "10.7554/invalid"
+    assert subject_lst.items[2].state == "not_found"
+    assert subject_lst.errors[0] == ["No valid id found"]
+    assert len(subject_lst.errors) == 2
+    assert not subject_lst.is_valid
+
+
+@pytest.fixture
+def conversion_cache():
+    """in-memory conversion cache, disabled after the test"""
+    configure_conversion_cache()
+    yield
+    configure_conversion_cache(enabled=False)
+
+
+def test_write_conversion_cache(conversion_cache):
+    "same input, format and options are written once"
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+    output = Metadata(string).write(to="crossref_xml", depositor="test")
+    assert Metadata(string).write(to="crossref_xml", depositor="test") == output
+    assert conversion_cache_info()["hits"] == 1
+    Metadata(string).write(to="crossref_xml", depositor="other")
+    assert conversion_cache_info()["hits"] == 1
+    write_kwargs = {"depositor": "test"}
+    assert get_cached_output(string, "crossref_xml", write_kwargs) == output
+
+
+def test_write_conversion_cache_options():
+    "output is the same with and without the cache after writes with options"
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+
+    def write():
+        subject = Metadata(string)
+        subject.write(to="citation", style="ieee")
+        return subject.write(to="commonmeta")
+
+    uncached = write()
+    assert json.loads(uncached)["style"] == "ieee"
+    configure_conversion_cache()
+    try:
+        Metadata(string).write(to="commonmeta")
+        assert write() == uncached
+    finally:
+        configure_conversion_cache(enabled=False)
+
+
+def test_write_conversion_cache_changed(conversion_cache):
+    "metadata changed after reading is not cached"
+    string = path.join(path.dirname(__file__), "fixtures", "commonmeta.json")
+    Metadata(string).write(to="ris")
+    subject = Metadata(string)
+    subject.titles = [{"title": "Changed"}]
+    assert "T1  - Changed" in subject.write(to="ris")
+    assert conversion_cache_info()["hits"] == 0
+
+    subject = Metadata(string)
+    subject.titles[0]["title"] = "Changed in place"
+    assert "T1  - Changed in place" in subject.write(to="ris")
+    assert conversion_cache_info()["hits"] == 0
+
+
+def test_write_list_conversion_cache(conversion_cache):
+    "lists are cached separately from items"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    output = MetadataList(string, via="crossref").write(to="ris")
+    assert get_cached_output(string, to="ris", via="crossref") is None
+    assert get_cached_output(string, to="ris", is_list=True, via="crossref") == output
+
+
+def test_write_list_conversion_cache_changed(conversion_cache):
+    "lists with items changed after reading are not cached"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    MetadataList(string, via="crossref").write(to="ris")
+    subject_lst = MetadataList(string, via="crossref")
+    subject_lst.items[0].titles[0]["title"] = "Changed in place"
+    assert "T1  - Changed in place" in subject_lst.write(to="ris")
+    assert conversion_cache_info()["hits"] == 0
+
+
+def test_write_jsonl_conversion_cache(conversion_cache, tmp_path):
+    "JSON Lines files are hashed without reading them into memory"
+    string = path.join(path.dirname(__file__), "fixtures", "crossref-list.json")
+    with open(string, encoding="utf-8") as file:
+        items = json.loads(file.read())["items"][:3]
+    filename = str(tmp_path / "crossref.jsonl")
+    with open(filename, "wb") as file:
+        file.write(b"\n".join(json.dumps(i) for i in items))
+    subject_lst = MetadataList(filename)
+    assert subject_lst._items is None
+    output = subject_lst.write(to="ris")
+    assert get_cached_output(filename, to="ris", is_list=True) == output
+    assert MetadataList(filename).write(to="ris") == output
+    assert conversion_cache_info()["hits"] == 2
+
+
+def test_list_raise_errors():
+    """items with errors raise while they are read one at a time"""
+    string = path.join(path.dirname(__file__), "fixtures", "bibtex-list.bib")
+    subject_lst = MetadataList(string, raise_errors=True)
+    items = subject_lst.iter_items()
+    assert next(items).id == "https://doi.org/10.7554/elife.01567"
+    with pytest.raises(ValueError):
+        next(items)
+    assert subject_lst._items is None
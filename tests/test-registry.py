@@ -0,0 +1,109 @@
+# pylint: disable=invalid-name
+"""Test registry"""
+import sys
+import pytest
+
+from commonmeta import Metadata
+from commonmeta import registry
+from commonmeta.registry import (
+    MetadataFormat,
+    get_format,
+    register_format,
+    load_entry_points,
+)
+from commonmeta.utils import find_from_format_by_json
+
+PLUGIN = '''
+from commonmeta.registry import MetadataFormat
+
+
+def read_plain(data):
+    return {
+        "id": data.get("id"),
+        "type": "Other",
+        "titles": [{"title": data.get("name")}],
+        "state": "findable",
+    }
+
+
+FORMAT = MetadataFormat(
+    "plain",
+    sniff=lambda data: "name" in data,
+    read=read_plain,
+    write=lambda metadata: metadata.titles[0]["title"],
+)
+'''
+
+
+@pytest.fixture
+def formats(monkeypatch):
+    """restore the registered formats after the test"""
+    monkeypatch.setattr(registry, "FORMATS", dict(registry.FORMATS))
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+
+
+def test_get_format():
+    "built-in formats"
+    fmt = get_format("crossref")
+    assert fmt.name == "crossref"
+    assert fmt.read == ".readers.crossref_reader:read_crossref"
+    assert fmt.load("read").__name__ == "read_crossref"
+    assert get_format("citation").write_options == {"style": "apa", "locale": "en-US"}
+    assert get_format("mods") is None
+
+
+def test_list_writer_capability():
+    "formats without list writer"
+    assert get_format("ris").write_list is not None
+    assert get_format("datacite").write_list is None
+
+
+def test_register_format(formats):
+    "format registered at runtime"
+    register_format(
+        MetadataFormat(
+            "plain",
+            read=lambda data: {"id": data["id"], "type": "Other", "state": "findable"},
+            write=lambda metadata: metadata.id,
+        )
+    )
+    subject = Metadata({"id": "https://example.org/1"}, via="plain", validate="off")
+    assert subject.type == "Other"
+    assert subject.write(to="plain") == "https://example.org/1"
+    with pytest.raises(ValueError):
+        subject.write(to="mods")
+
+
+def test_entry_point_format(formats, tmp_path, monkeypatch):
+    "format from an installed package"
+    (tmp_path / "commonmeta_plain.py").write_text(PLUGIN)
+    dist_info = tmp_path / "commonmeta_plain-1.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Name: commonmeta-plain\nVersion: 1.0\n")
+    (dist_info / "entry_points.txt").write_text(
+        "[commonmeta.formats]\nplain = commonmeta_plain:FORMAT\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "commonmeta_plain", raising=False)
+
+    load_entry_points()
+    assert get_format("plain").name == "plain"
+    assert find_from_format_by_json({"name": "Example"}) == "plain"
+    subject = Metadata({"id": "https://example.org/1", "name": "Example"}, via="plain")
+    assert subject.titles == [{"title": "Example"}]
+    assert subject.write(to="plain") == "Example"
+
+
+def test_format_entry_points_dict(monkeypatch):
+    "entry points returned as a dict of groups, as on Python 3.9"
+    import importlib.metadata
+
+    entry_point = importlib.metadata.EntryPoint(
+        "plain", "commonmeta_plain:FORMAT", "commonmeta.formats"
+    )
+    monkeypatch.setattr(
+        importlib.metadata,
+        "entry_points",
+        lambda: {"commonmeta.formats": (entry_point,), "console_scripts": ()},
+    )
+    assert registry.format_entry_points() == [entry_point]
@@ -2,6 +2,7 @@
 """RIS reader tests"""
 from os import path
 from commonmeta import Metadata
+from commonmeta.readers.ris_reader import iter_ris_records, ris_meta
 
 
 def test_journal_article():
@@ -12,13 +13,14 @@ def test_journal_article():
     assert subject.id == "https://doi.org/10.7554/elife.01567"
     assert subject.type == "JournalArticle"
     assert subject.url == "http://elifesciences.org/lookup/doi/10.7554/eLife.01567"
-    assert len(subject.contributors) == 4
+    assert len(subject.contributors) == 5
     assert subject.contributors[0] == {
         "type": "Person",
         "contributorRoles": ["Author"],
         "givenName": "Martial",
         "familyName": "Sankar",
     }
+    assert subject.contributors[1]["familyName"] == "Nieminen"
     assert subject.titles == [
         {
             "title": "Automated quantitative histology reveals vascular morphodynamics during Arabidopsis hypocotyl secondary growth"
@@ -68,3 +70,28 @@ def test_thesis():
         "title": "from city averaged temperatures to the energy demand of individual buildings"
     }
     assert subject.date == {"published": "2018-04-25", "created": "2018-04-25"}
+
+
+def test_ris_meta():
+    "repeated tags and values with hyphens"
+    meta = ris_meta(
+        "TY  - JOUR\nTI  - Self-organized criticality\nKW  - a\nKW  - b\n"
+        "KW  - c\nER  - \nTY  - BOOK\n"
+    )
+    assert meta == {
+        "TY": "JOUR",
+        "TI": "Self-organized criticality",
+        "KW": ["a", "b", "c"],
+    }
+
+
+def test_iter_ris_records():
+    "records of a file with several records, read one line at a time"
+    records = []
+    for name in ["crossref.ris", "pure.ris"]:
+        with open(path.join(path.dirname(__file__), "fixtures", name)) as file:
+            records.append(file.read().rstrip() + "\n")
+    string = "Exported from a reference manager\n\n" + "\n".join(records)
+    assert [*iter_ris_records(string)] == records
+    subject = Metadata([*iter_ris_records(string)][1], via="ris")
+    assert subject.type == "Dissertation"
@@ -0,0 +1,60 @@
+# pylint: disable=invalid-name
+"""Test schema utils"""
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+from commonmeta.schema_utils import (
+    json_schema_errors,
+    get_schema_validator,
+    schema_cache_info,
+    clear_schema_cache,
+    SCHEMA_FILES,
+)
+
+
+def test_json_schema_errors_valid():
+    "valid commonmeta"
+    instance = {
+        "id": "https://doi.org/10.7554/elife.01567",
+        "type": "JournalArticle",
+        "url": "https://elifesciences.org/articles/01567",
+    }
+    assert json_schema_errors(instance) is None
+
+
+def test_json_schema_errors_invalid_csl():
+    "invalid csl"
+    instance = [{"id": "https://doi.org/10.7554/elife.01567", "type": "Article"}]
+    assert "is not one of" in json_schema_errors(instance, schema="csl")
+
+
+def test_json_schema_errors_unknown_schema():
+    "unknown schema"
+    with pytest.raises(ValueError):
+        json_schema_errors({}, schema="mods")
+
+
+def test_schema_validator_registry():
+    "validators are compiled once and reused"
+    clear_schema_cache()
+    validator = get_schema_validator("csl")
+    assert get_schema_validator("csl-data") is validator
+    json_schema_errors([], schema="csl")
+    assert schema_cache_info() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_schema_validator_all_schemas():
+    "all bundled schemas compile"
+    clear_schema_cache()
+    for name in SCHEMA_FILES:
+        assert get_schema_validator(name) is not None
+    assert schema_cache_info()["size"] == len(SCHEMA_FILES)
+
+
+def test_schema_validator_threads():
+    "validator is shared across threads"
+    clear_schema_cache()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        validators = list(executor.map(get_schema_validator, ["commonmeta"] * 32))
+    assert all(v is validators[0] for v in validators)
+    assert schema_cache_info()["misses"] == 1
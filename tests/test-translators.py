@@ -6,7 +6,7 @@ import re
 import pytest  # noqa: F401
 
 from commonmeta.translators import web_translator
-from bs4 import BeautifulSoup
+from commonmeta.html_utils import parse_html_meta
 
 
 def test_web_translator_arxiv():
@@ -14,8 +14,8 @@ def test_web_translator_arxiv():
     filepath = path.join(path.dirname(__file__), "fixtures", "arxiv.html")
     with open(filepath, encoding="utf-8") as file:
         string = file.read()
-    soup = BeautifulSoup(string, "html.parser")
-    metadata = web_translator(soup, "https://arxiv.org/abs/1902.02534")
+    meta = parse_html_meta(string)
+    metadata = web_translator(meta, "https://arxiv.org/abs/1902.02534")
     assert re.match(r"https://doi.org/10.48550/arXiv.1902.02534", metadata["@id"])
 
 
@@ -24,8 +24,8 @@ def test_web_translator_datacite():
     filepath = path.join(path.dirname(__file__), "fixtures", "datacite.html")
     with open(filepath, encoding="utf-8") as file:
         string = file.read()
-    soup = BeautifulSoup(string, "html.parser")
-    metadata = web_translator(soup, "https://datacite.org/blog/bioschemas_2024/")
+    meta = parse_html_meta(string)
+    metadata = web_translator(meta, "https://datacite.org/blog/bioschemas_2024/")
     assert re.match(r"https://doi.org/10.5438/vzqp-m504", metadata["@id"])
 
 
@@ -34,6 +34,6 @@ def test_web_translator_pan():
     filepath = path.join(path.dirname(__file__), "fixtures", "pan.html")
     with open(filepath, encoding="utf-8") as file:
         string = file.read()
-    soup = BeautifulSoup(string, "html.parser")
-    metadata = web_translator(soup, "https://app.pan.pl/article/item/app011052023.html")
+    meta = parse_html_meta(string)
+    metadata = web_translator(meta, "https://app.pan.pl/article/item/app011052023.html")
     assert re.match(r"https://doi.org/10.4202/app.01105.2023", metadata["@id"])
@@ -6,6 +6,7 @@ import pytest  # noqa: F401
 
 from commonmeta.utils import (
     dict_to_spdx,
+    get_spdx_index,
     normalize_orcid,
     validate_orcid,
     normalize_ror,
@@ -22,6 +23,8 @@ from commonmeta.utils import (
     from_csl,
     find_from_format_by_id,
     find_from_format_by_string,
+    sniff_format,
+    xml_root_name,
     find_from_format_by_filename,
     find_from_format_by_ext,
     from_schema_org,
@@ -79,6 +82,25 @@ def test_dict_to_spdx_not_found():
     assert {} == dict_to_spdx({"url": "info:eu-repo/semantics/openAccess"})
 
 
+def test_dict_to_spdx_short_cc_url():
+    "dict_to_spdx short creative commons url"
+    assert {
+        "id": "CC-BY-NC-SA-3.0",
+        "url": "https://creativecommons.org/licenses/by-nc-sa/3.0/legalcode",
+    } == dict_to_spdx({"url": "http://creativecommons.org/licenses/by-nc-sa/3.0/us/"})
+
+
+def test_spdx_index():
+    "spdx index is built once"
+    ids, urls = get_spdx_index()
+    assert get_spdx_index()[0] is ids
+    assert ids["cc-by-4.0"][1]["licenseId"] == "CC-BY-4.0"
+    assert (
+        urls["https://creativecommons.org/licenses/by/4.0"]
+        is urls["https://creativecommons.org/licenses/by/4.0/legalcode"]
+    )
+
+
 def test_validate_orcid():
     "validate_orcid"
     assert "0000-0002-2590-225X" == validate_orcid(
@@ -499,6 +521,42 @@ def test_find_from_format_by_string():
     assert None is find_from_format_by_string(None)
 
 
+def test_sniff_format():
+    """sniff_format"""
+    # parsed JSON is returned with the format
+    filepath = path.join(path.dirname(__file__), "fixtures", "crossref.json")
+    with open(filepath, encoding="utf-8") as file:
+        string = file.read()
+    via, data = sniff_format(string)
+    assert "crossref" == via
+    assert "10.7554/elife.01567" == data["DOI"]
+    # parsed YAML is returned with the format
+    filepath = path.join(path.dirname(__file__), "fixtures", "CITATION.cff")
+    with open(filepath, encoding="utf-8") as file:
+        string = file.read()
+    via, data = sniff_format(string)
+    assert "cff" == via
+    assert "1.2.0" == data["cff-version"]
+    # byte order mark and bytes
+    assert ("ris", None) == sniff_format(b"\xef\xbb\xbfTY  - JOUR\nER  - \n")
+    assert "commonmeta" == sniff_format('\ufeff{"schema": "https://commonmeta.org"}')[0]
+    # only the start of large RIS and BibTeX files is looked at
+    assert ("ris", None) == sniff_format("TY  - JOUR\n" + "{[<" * 100000)
+    assert ("bibtex", None) == sniff_format("@article{key,\n" + "{[<" * 100000)
+    assert ("crossref_xml", None) == sniff_format("<doi_records>" + "x" * 100000)
+    assert None is sniff_format("@foo{key,}")[0]
+    assert (None, None) == sniff_format(None)
+
+
+def test_xml_root_name():
+    """xml_root_name"""
+    assert "resource" == xml_root_name(
+        '<?xml version="1.0"?>\n<!-- <doi_record> -->\n<ns0:resource xmlns:ns0="x">'
+    )
+    assert "html" == xml_root_name("<!DOCTYPE html>\n<HTML lang='en'>")
+    assert None is xml_root_name("<!-- unfinished")
+
+
 def test_from_schema_org():
     "from_schema_org"
     author = {